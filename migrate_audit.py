@@ -0,0 +1,27 @@
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from audit_sqlite import migrate_audit_logs, SQLiteAuditRepository
+
+def migrate(data_dir="data"):
+    print("=== AUDIT LOG MIGRATION (CSV/JSON -> SQLite) ===")
+    
+    db_path = os.path.join(data_dir, "audit.db")
+    print(f"\nImporting audit logs from {data_dir}/ into {db_path}...")
+    inserted = migrate_audit_logs(data_dir, db_path)
+    
+    for source, count in inserted.items():
+        print(f"  {source}: {count} new records")
+    
+    repo = SQLiteAuditRepository(db_path)
+    rows = repo.count()
+    repo.close()
+    
+    print(f"\n✅ {rows} audit rows (decisions and decision updates) in {db_path}")
+    print("Set AUDIT_BACKEND=sqlite to use it (re-running this script is safe).")
+
+if __name__ == "__main__":
+    migrate(sys.argv[1] if len(sys.argv) > 1 else "data")
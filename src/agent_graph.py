@@ -27,6 +27,7 @@ from watchdog.events import FileSystemEventHandler
 from langgraph.graph import StateGraph, END
 from langchain_groq import ChatGroq
 from governance_shield import GovernanceShield
+from file_lock import get_file_lock, atomic_write_json
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
@@ -242,22 +243,23 @@ def node_save(state: AgentState):
     """Saves to output file for dashboard (Appends, doesn't overwrite)."""
     output_path = "data/current_alerts.json"
     
-    existing_alerts = []
-    if os.path.exists(output_path):
-        try:
-            with open(output_path, 'r') as f:
-                existing_alerts = json.load(f)
-        except:
-            existing_alerts = []
-            
-    # Add new alert
-    existing_alerts.insert(0, state['final_alert']) # Add to top
-    
-    # Keep max 50 recent alerts
-    existing_alerts = existing_alerts[:50]
-    
-    with open(output_path, 'w') as f:
-        json.dump(existing_alerts, f, indent=2)
+    # Read-modify-write under the file lock; readers (/alerts) see the old or new file, never a partial one
+    with get_file_lock(output_path):
+        existing_alerts = []
+        if os.path.exists(output_path):
+            try:
+                with open(output_path, 'r') as f:
+                    existing_alerts = json.load(f)
+            except:
+                existing_alerts = []
+        
+        # Add new alert
+        existing_alerts.insert(0, state['final_alert']) # Add to top
+        
+        # Keep max 50 recent alerts
+        existing_alerts = existing_alerts[:50]
+        
+        atomic_write_json(output_path, existing_alerts, indent=2)
     print(f"💾 Alert saved to {output_path} (Total: {len(existing_alerts)})")
     return state
 
@@ -0,0 +1,240 @@
+"""
+Analysis Backlog - Deferred Audit Enrichment
+============================================
+Background worker used by the pipeline's degraded fast path.
+
+When a run exceeds its latency budget, clusters are emitted with risk and
+queue only. Their audit record (Stage 9, with the rationale summary) is
+queued here and completed in the background, in submission order, through
+the group-commit audit writer.
+
+Completed analyses are marked non-degraded in place, so cards built later
+are full cards (the rationale itself is generated on first view), and are
+handed to on_complete (the pipeline publishes them as card.updated).
+
+A batch whose audit write fails is requeued, up to MAX_ATTEMPTS times
+with backoff; analyses still failing after that stay degraded and are
+counted in status()["failed"].
+
+Responsible AI Mapping:
+- Reliability & Safety: Alerts are not held back by audit work during spikes
+- Auditability: Every deferred cluster is still audited, with its rationale summary
+"""
+
+import atexit
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class DeferredAnalysis:
+    """A cluster analysis waiting for its audit record."""
+    analysis: Any  # ClusterAnalysis
+    classification_result: Any  # BatchClassificationResult
+    processing_time_ms: int
+    enqueued_at: float
+    attempts: int = 0
+
+
+class AnalysisBacklog:
+    """
+    Single background worker that catches up on deferred analyses.
+    Items are drained in batches so audit writes stay batched.
+    """
+    
+    # Deferred analyses completed per audit write
+    BATCH_SIZE = 50
+    
+    # Seconds to wait for the backlog to drain at interpreter exit
+    EXIT_DRAIN_SECONDS = 5.0
+    
+    # Audit attempts per deferred analysis, and the backoff after a failed batch
+    MAX_ATTEMPTS = 3
+    RETRY_BACKOFF_SECONDS = 0.5
+    
+    def __init__(
+        self,
+        rationale_gen: Any,
+        audit_logger: Any,
+        audit_writer: Any,
+        on_complete: Optional[Callable[[List[Any]], None]] = None,
+        batch_size: int = None
+    ):
+        """
+        Args:
+            rationale_gen: Builds the rationale summary for each record
+            audit_logger: Creates the audit records
+            audit_writer: Group-commit writer the records are submitted to
+            on_complete: Called with the analyses of each completed batch
+            batch_size: Deferred analyses completed per audit write
+        """
+        self.rationale_gen = rationale_gen
+        self.audit_logger = audit_logger
+        self.audit_writer = audit_writer
+        self.on_complete = on_complete
+        self.batch_size = batch_size or self.BATCH_SIZE
+        
+        self._queue: "queue.Queue[DeferredAnalysis]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._oldest_enqueued: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def submit(
+        self,
+        analyses: List[Any],
+        classification_result: Any,
+        processing_time_ms: int = 0
+    ):
+        """Queue analyses for background audit."""
+        if not analyses:
+            return
+        
+        now = time.time()
+        with self._lock:
+            self._pending += len(analyses)
+            if self._oldest_enqueued is None:
+                self._oldest_enqueued = now
+            self._ensure_worker()
+        
+        for analysis in analyses:
+            self._queue.put(DeferredAnalysis(analysis, classification_result, processing_time_ms, now))
+    
+    def _ensure_worker(self):
+        """Start the worker thread on first use (caller holds the lock)."""
+        if self._thread is None:
+            atexit.register(self.wait_idle, self.EXIT_DRAIN_SECONDS)
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="analysis-backlog", daemon=True)
+            self._thread.start()
+    
+    def _run(self):
+        """Worker loop: complete deferred analyses batch by batch."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._complete(batch)
+                error = None
+            except Exception as e:
+                error = str(e)
+            
+            retry = []
+            if error:
+                for item in batch:
+                    item.attempts += 1
+                    if item.attempts < self.MAX_ATTEMPTS:
+                        retry.append(item)
+            failed = len(batch) - len(retry) if error else 0
+            
+            with self._lock:
+                self._pending -= len(batch) - len(retry)
+                self._completed += 0 if error else len(batch)
+                self._failed += failed
+                if error:
+                    self._last_error = error
+                self._oldest_enqueued = None if self._pending == 0 else self._oldest_enqueued
+                if self._pending == 0:
+                    self._idle.notify_all()
+            
+            if retry:
+                time.sleep(self.RETRY_BACKOFF_SECONDS * 2 ** (retry[0].attempts - 1))
+                for item in retry:
+                    self._queue.put(item)
+    
+    def _complete(self, batch: List[DeferredAnalysis]):
+        """Write the audit records for one batch."""
+        records = []
+        for item in batch:
+            analysis = item.analysis
+            records.append(self.audit_logger.create_record(
+                cluster=analysis.cluster,
+                classification_result=item.classification_result,
+                risk_score=analysis.risk_score,
+                confidence=analysis.confidence,
+                rationale=analysis.rationale or self.rationale_gen.summarize(analysis.cluster, analysis.risk_score),
+                escalation=analysis.escalation,
+                human_decision="PENDING",
+                human_user="SYSTEM",
+                processing_time_ms=item.processing_time_ms
+            ))
+        # Waiting makes a failed commit raise here (and the batch be retried)
+        self.audit_writer.submit(records, wait=True)
+        for item in batch:
+            item.analysis.degraded = False
+        if self.on_complete is not None:
+            self.on_complete([item.analysis for item in batch])
+    
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the backlog is empty.
+        
+        Returns:
+            True if drained, False on timeout
+        """
+        with self._lock:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+    
+    def status(self) -> Dict[str, Any]:
+        """Backlog depth and catch-up progress."""
+        with self._lock:
+            lag = time.time() - self._oldest_enqueued if self._oldest_enqueued else 0.0
+            return {
+                "pending": self._pending,
+                "completed": self._completed,
+                "failed": self._failed,
+                "lag_seconds": round(lag, 3),
+                "last_error": self._last_error
+            }
+
+
+if __name__ == "__main__":
+    # Demo with mock stages
+    from types import SimpleNamespace
+    
+    class MockRationale:
+        def summarize(self, cluster, risk_score=None):
+            time.sleep(0.01)
+            return SimpleNamespace(what_signal=f"Rationale for {cluster.cluster_id}", assumptions=[])
+    
+    class MockAudit:
+        def create_record(self, cluster, rationale=None, **kwargs):
+            return f"{cluster.cluster_id}: {rationale.what_signal}"
+    
+    class MockWriter:
+        failures = 1
+        
+        def submit(self, records, wait=False):
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("Audit commit failed: disk full")
+            print(f"Audited {records}")
+            return records
+    
+    backlog = AnalysisBacklog(
+        MockRationale(), MockAudit(), MockWriter(), batch_size=3,
+        on_complete=lambda done: print(f"card.updated: {[a.cluster.cluster_id for a in done]}")
+    )
+    backlog.RETRY_BACKOFF_SECONDS = 0.05
+    analyses = [
+        SimpleNamespace(cluster=SimpleNamespace(cluster_id=f"SVC-{i:02d}"), risk_score=None,
+                        confidence=None, escalation=None, rationale=None, degraded=True)
+        for i in range(5)
+    ]
+    backlog.submit(analyses, classification_result=None)
+    print(backlog.status())
+    backlog.wait_idle()
+    print(backlog.status())
+    print(analyses[0].degraded)
@@ -1,12 +1,14 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from starlette.background import BackgroundTask
 from typing import List, Optional, Dict, Any
+import asyncio
 import json
 import os
 import csv
-import io
+import threading
 from datetime import datetime
 
 # Import pipeline components
@@ -17,6 +19,38 @@ from simulation_engine import SimulationEngine
 from guardrails import get_guardrails
 from responsible_ai_pipeline import get_pipeline
 from audit_logger import get_audit_logger
+from pipeline_metrics import get_stage_histogram
+from pipeline_checkpoint import CheckpointStore
+from audit_writer import get_audit_writer
+from file_lock import get_file_lock
+from event_bus import get_event_bus
+from response_cache import CachedBody, get_response_cache
+from response_encoding import MSGPACK_MEDIA_TYPE, NotAcceptable, encode, negotiate
+from job_queue import JobQueueFull, get_job_queue
+from ndjson_stream import stream_cards
+from streaming_pipeline import StreamingPipelineRunner
+
+# Checkpoints for resumable run-from-csv
+CHECKPOINT_DIR = "data/checkpoints"
+
+# Governed source for run-from-csv
+SOURCE_CSV = "data/synthetic_social_signals_mashreq.csv"
+
+# Largest /pipeline/decisions batch
+MAX_BULK_DECISIONS = 500
+
+# Largest /audit/records and /audit/query page
+MAX_AUDIT_PAGE_SIZE = 500
+
+# Concurrent /pipeline/stream connections (each runs its own stage threads)
+MAX_STREAMS = 8
+_stream_slots = threading.BoundedSemaphore(MAX_STREAMS)
+
+# Idle seconds before /events and /ws/events send a heartbeat
+EVENTS_HEARTBEAT_SECONDS = 15
+
+# Seconds between checks for audit rows from other processes while anyone is subscribed
+AUDIT_FOLLOW_SECONDS = 1.0
 
 app = FastAPI(
     title="Mashreq Responsible AI API", 
@@ -33,6 +67,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def follow_audit_trail():
+    """
+    While anyone is subscribed to live events, pick up audit rows written by
+    other processes (dashboard, other workers) so their decisions are pushed too.
+    """
+    async def follow():
+        bus = get_event_bus()
+        while True:
+            await asyncio.sleep(AUDIT_FOLLOW_SECONDS)
+            if bus.subscriber_count:
+                try:
+                    await asyncio.to_thread(get_audit_logger().refresh)
+                except OSError:
+                    continue
+    
+    app.state.audit_follower = asyncio.get_running_loop().create_task(follow())
+
+@app.on_event("shutdown")
+def flush_audit_writer():
+    """Cancel jobs not yet started and drain queued audit records before the server exits."""
+    get_job_queue().shutdown(wait=False)
+    get_audit_writer().close(timeout=30)
+
 # --- Data Schemas ---
 class SimulationRequest(BaseModel):
     interest_rate_bps: int
@@ -46,33 +104,186 @@ class AuditAction(BaseModel):
     action: str # "ESCALATED", "DISMISSED", "RESOLVED"
     context: str
 
+# --- Response Schemas ---
+# Documentation only: endpoints using _encoded() return a Response, so
+# FastAPI neither re-validates nor re-encodes the payload against these.
+
+class RiskComponent(BaseModel):
+    score: float
+    max: float
+    description: str
+
+class AnalystCard(BaseModel):
+    """Analyst card; while the audit is deferred (degraded=true, rationale_pending=true) the skipped fields are null."""
+    cluster_id: str
+    title: str
+    category: str
+    volume: int
+    risk_score: float
+    risk_level: str
+    suggested_queue: str
+    priority: str
+    approval_required: bool
+    is_critical: bool
+    degraded: bool
+    risk_breakdown: Optional[Dict[str, RiskComponent]] = None
+    confidence_percentage: Optional[float] = None
+    confidence_level: Optional[str] = None
+    uncertainty_wording: Optional[str] = None
+    rationale_url: Optional[str] = None
+    escalation_reason: Optional[str] = None
+    top_phrases: Optional[List[str]] = None
+    example_snippets: Optional[List[str]] = None
+    rationale: Optional[Dict[str, Any]] = None
+    rationale_pending: bool = False
+
+class StageTiming(BaseModel):
+    stage: str
+    wall_ms: float
+    cpu_ms: float
+    items_in: int
+    items_out: int
+    peak_alloc_kb: Optional[float] = None
+
+class GatingSummary(BaseModel):
+    signal_count: int
+    noise_count: int
+    summary: Dict[str, Any]
+
+class ClusteringSummary(BaseModel):
+    cluster_count: int
+    category_distribution: Dict[str, int]
+
+class ProcessResponse(BaseModel):
+    governance_validated: bool
+    validation_issues: List[str]
+    deduplication: Dict[str, Any]
+    gating: GatingSummary
+    clustering: ClusteringSummary
+    clusters: List[AnalystCard]
+    processing_time_ms: int
+    degraded: bool
+    degraded_reason: Optional[str] = None
+    deferred_clusters: List[str]
+    stage_timings: List[StageTiming]
+    timestamp: str
+
+class RunFromCsvResponse(BaseModel):
+    status: str
+    source: str
+    events_processed: int
+    clusters_formed: int
+    analyst_cards: List[AnalystCard]
+    governance_check: bool
+
+class AuditRecordOut(BaseModel):
+    """A stored audit row; list/dict fields are JSON-encoded strings, exactly as hash-chained."""
+    model_config = ConfigDict(extra="allow", protected_namespaces=())
+    
+    record_id: str
+    cluster_id: str
+    timestamp: str
+    signal_count: int
+    signal_category: str
+    top_keywords: str
+    classification_probabilities: str
+    risk_score: float
+    risk_breakdown: str
+    confidence_percentage: float
+    confidence_level: str
+    rationale_summary: str
+    assumptions: str
+    suggested_queue: str
+    priority: str
+    human_decision: str
+    human_user: str
+    decision_reason: Optional[str] = None
+    processing_time_ms: int
+    model_version: str
+    prev_hash: str = ""
+    record_hash: str = ""
+
+class AuditRecordsPage(BaseModel):
+    records: List[AuditRecordOut]
+    next_cursor: Optional[str] = None
+    limit: int
+
+class AuditQueryResponse(BaseModel):
+    records: List[AuditRecordOut]
+    limit: int
+    offset: int
+
+class DecisionStateOut(BaseModel):
+    cluster_id: str
+    decision: str
+    decided_by: str
+    decided_at: str
+    record_id: str
+
+class DecisionsResponse(BaseModel):
+    decision: str
+    count: int
+    counts: Dict[str, int]
+    clusters: List[DecisionStateOut]
+
+# OpenAPI: negotiated endpoints also answer Accept: application/msgpack
+NEGOTIATED = {200: {"content": {MSGPACK_MEDIA_TYPE: {}}}}
+
 # --- Endpoints ---
 
 @app.get("/health")
 def health_check():
     return {"status": "nominal", "timestamp": datetime.now().isoformat()}
 
-@app.get("/alerts")
-def get_alerts():
-    """Fetch all active alerts from the JSON store."""
+def _negotiate(request: Request) -> str:
+    """Response media type for the request's Accept header (406 if none can be served)."""
+    try:
+        return negotiate(request.headers.get("accept"))
+    except NotAcceptable as e:
+        raise HTTPException(status_code=406, detail=str(e))
+
+def _encoded(request: Request, data: Any) -> Response:
+    """
+    Serialize with the fast encoder, as JSON or MessagePack per the Accept
+    header, bypassing response_model validation and jsonable_encoder.
+    """
+    try:
+        body, media_type = encode(data, request.headers.get("accept"))
+    except NotAcceptable as e:
+        raise HTTPException(status_code=406, detail=str(e))
+    return Response(body, media_type=media_type, headers={"Vary": "Accept"})
+
+def _conditional_json(request: Request, key: str, entry: CachedBody) -> Response:
+    """
+    Serve a cached body (JSON, or MessagePack if negotiated), or 304 if the
+    client's copy (ETag / Last-Modified) is current.
+    """
+    entry = entry.variant(_negotiate(request))
+    headers = {**entry.headers(), "Vary": "Accept"}
+    if entry.not_modified(request.headers.get("if-none-match"), request.headers.get("if-modified-since")):
+        get_response_cache().record_not_modified(key)
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type=entry.media_type, headers=headers)
+
+@app.get("/alerts", response_model=List[Dict[str, Any]], responses=NEGOTIATED)
+def get_alerts(request: Request):
+    """Fetch all active alerts from the JSON store (cached until the file changes)."""
     data_path = "data/current_alerts.json"
-    if not os.path.exists(data_path):
-        return []
     try:
-        with open(data_path, 'r') as f:
-            return json.load(f)
+        entry = get_response_cache().file_json(data_path, default=[])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    return _conditional_json(request, data_path, entry)
 
 @app.post("/audit")
 def log_audit(action: AuditAction):
     """Log a human decision to the immutable audit trail."""
     csv_file = "data/audit_trail.csv"
-    file_exists = os.path.isfile(csv_file)
     try:
-        with open(csv_file, mode='a', newline='') as f:
+        # Shared with other workers: check-then-write under the file lock
+        with get_file_lock(csv_file), open(csv_file, mode='a', newline='') as f:
             writer = csv.writer(f)
-            if not file_exists:
+            if f.tell() == 0:
                 writer.writerow(["Timestamp", "User", "Action", "AlertID", "AI_Context"])
             writer.writerow([
                 datetime.now().isoformat(),
@@ -123,55 +334,70 @@ class HumanDecisionRequest(BaseModel):
     reason: Optional[str] = None
 
 
-@app.get("/governance")
-def get_governance():
-    """Get governance guardrails and policy information."""
+class BulkDecisionRequest(BaseModel):
+    decisions: List[HumanDecisionRequest]
+
+
+@app.get("/governance", responses=NEGOTIATED)
+def get_governance(request: Request):
+    """Get governance guardrails and policy information (built once per Guardrails instance)."""
     guardrails = get_guardrails()
-    return {
-        "policy": guardrails.get_policy_text(),
-        "boundaries": guardrails.get_boundaries(),
-        "footer": guardrails.get_governance_footer(),
-        "decision_banner": guardrails.get_decision_banner()
-    }
+    
+    def build():
+        return {
+            "policy": guardrails.get_policy_text(),
+            "boundaries": guardrails.get_boundaries(),
+            "footer": guardrails.get_governance_footer(),
+            "decision_banner": guardrails.get_decision_banner()
+        }
+    
+    entry = get_response_cache().generated("governance", build, version=guardrails)
+    return _conditional_json(request, "governance", entry)
 
 
-@app.get("/governance/data-card")
-def get_data_card():
+@app.get("/governance/data-card", responses=NEGOTIATED)
+def get_data_card(request: Request):
     """Get the data card documentation."""
     card_path = "data/data_card.json"
-    if os.path.exists(card_path):
-        with open(card_path, 'r') as f:
-            return json.load(f)
-    return {"error": "Data card not found"}
+    entry = get_response_cache().file_json(card_path, default={"error": "Data card not found"})
+    return _conditional_json(request, card_path, entry)
 
 
-@app.get("/governance/model-card")
-def get_model_card():
+@app.get("/governance/model-card", responses=NEGOTIATED)
+def get_model_card(request: Request):
     """Get the model card documentation."""
     card_path = "data/model_card.json"
-    if os.path.exists(card_path):
-        with open(card_path, 'r') as f:
-            return json.load(f)
-    return {"error": "Model card not found"}
+    entry = get_response_cache().file_json(card_path, default={"error": "Model card not found"})
+    return _conditional_json(request, card_path, entry)
+
+
+@app.get("/cache/stats")
+def get_response_cache_stats():
+    """Response cache hits, misses, 304s and hit ratio, overall and per resource."""
+    return get_response_cache().stats()
 
 
-@app.post("/pipeline/process")
-def process_events(req: ProcessEventsRequest):
-    """Process events through the 10-stage Responsible AI pipeline."""
+@app.post("/pipeline/process", response_model=ProcessResponse, responses=NEGOTIATED)
+def process_events(req: ProcessEventsRequest, request: Request, durable: bool = False):
+    """
+    Process events through the 10-stage Responsible AI pipeline.
+    Pass durable=true to return only after the audit records are fsynced.
+    """
     if not req.events:
         raise HTTPException(status_code=400, detail="No events provided")
     
     pipeline = get_pipeline()
-    result = pipeline.process(req.events)
+    result = pipeline.process(req.events, durable_audit=durable)
     
     # Convert cluster analyses to JSON-serializable format
     clusters = []
     for analysis in result.cluster_analyses:
         clusters.append(analysis.to_analyst_card())
     
-    return {
+    return _encoded(request, {
         "governance_validated": result.governance_validated,
         "validation_issues": result.validation_issues,
+        "deduplication": result.deduplication,
         "gating": {
             "signal_count": result.gating_result.signal_count,
             "noise_count": result.gating_result.noise_count,
@@ -183,38 +409,265 @@ def process_events(req: ProcessEventsRequest):
         },
         "clusters": clusters,
         "processing_time_ms": result.processing_time_ms,
+        "degraded": result.degraded,
+        "degraded_reason": result.degraded_reason,
+        "deferred_clusters": result.deferred_clusters,
+        "stage_timings": [span.to_dict() for span in result.stage_timings],
         "timestamp": result.timestamp
-    }
+    })
 
 
-@app.post("/pipeline/run-from-csv")
-def run_from_csv():
+class DuplexStreamingResponse(StreamingResponse):
     """
-    CRITICAL: Trigger strict 10-stage pipeline from the validated CSV.
-    Ensures 'Synthetic Data Only' governance.
+    StreamingResponse that leaves receive() to the endpoint, so the request
+    body can still be read while the response streams (StreamingResponse
+    otherwise listens for disconnects on receive() and swallows body chunks).
+    The background task runs however the response ends.
     """
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.stream_response(send)
+        finally:
+            if self.background is not None:
+                await self.background()
+
+
+@app.post("/pipeline/stream")
+async def stream_pipeline(request: Request, micro_batch_size: Optional[int] = None):
+    """
+    Stream events in, analyst cards out.
+    
+    The request body is newline-delimited JSON (one event per line, sent
+    chunked); events enter the streaming pipeline as they arrive. The
+    response is NDJSON: a "card" line per cluster as its time window closes,
+    "progress" lines, and a final "summary" (or "error") line.
+    
+    The body is read only as fast as the pipeline and the client's reading
+    of the response allow, so memory per connection stays bounded.
+    """
+    if not _stream_slots.acquire(blocking=False):
+        raise HTTPException(status_code=429, detail=f"{MAX_STREAMS} streams already open; try again later")
+    
+    loop = asyncio.get_running_loop()
+    body = request.stream()
+    
+    async def next_chunk():
+        try:
+            return await body.__anext__()
+        except StopAsyncIteration:
+            return None
+    
+    def chunks():
+        # Pulled by the runner's source thread, one body chunk at a time
+        while True:
+            chunk = asyncio.run_coroutine_threadsafe(next_chunk(), loop).result()
+            if chunk is None:
+                return
+            if chunk:
+                yield chunk
+    
+    # From here on the response owns the slot; release it if we fail before handing over
     try:
-        from data_loader import load_csv_events
-        # Load directly from the governed source
-        events = load_csv_events("data/synthetic_social_signals_mashreq.csv")
-        
-        # Process through pipeline
+        runner = StreamingPipelineRunner(micro_batch_size=micro_batch_size)
+        return DuplexStreamingResponse(
+            stream_cards(chunks(), runner), 
+            media_type="application/x-ndjson", 
+            background=BackgroundTask(_stream_slots.release)
+        )
+    except BaseException:
+        _stream_slots.release()
+        raise
+
+
+@app.get("/events")
+async def stream_live_events(last_event_id: Optional[str] = Header(None)):
+    """
+    Server-sent events: card.created, card.updated and decision, plus
+    resync when the client has missed updates and should refetch.
+    
+    A reconnecting client sends Last-Event-ID and is replayed what it missed.
+    Events a slow client has not read yet are coalesced per cluster.
+    """
+    try:
+        last_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_id = None
+    
+    async def frames():
+        subscription = get_event_bus().subscribe(loop=asyncio.get_running_loop(), last_event_id=last_id)
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                events = subscription.drain()
+                if events:
+                    yield "".join(event.sse_frame() for event in events)
+                elif not await subscription.wait_async(EVENTS_HEARTBEAT_SECONDS):
+                    yield ": keep-alive\n\n"
+        finally:
+            subscription.close()
+    
+    return StreamingResponse(
+        frames(), 
+        media_type="text/event-stream", 
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.websocket("/ws/events")
+async def websocket_live_events(websocket: WebSocket, last_event_id: Optional[int] = None):
+    """The events of GET /events, one JSON message each ({"type": "heartbeat"} when idle)."""
+    await websocket.accept()
+    subscription = get_event_bus().subscribe(loop=asyncio.get_running_loop(), last_event_id=last_event_id)
+    try:
+        while True:
+            events = subscription.drain()
+            for event in events:
+                await websocket.send_text(event.to_json())
+            if not events and not await subscription.wait_async(EVENTS_HEARTBEAT_SECONDS):
+                await websocket.send_text('{"type": "heartbeat"}')
+    except WebSocketDisconnect:
+        pass
+    finally:
+        subscription.close()
+
+
+@app.get("/events/status")
+def get_live_events_status():
+    """Live event subscribers, and events published, coalesced and dropped."""
+    return get_event_bus().status()
+
+
+@app.get("/pipeline/metrics")
+def get_pipeline_metrics():
+    """Get rolling per-stage latency histograms for recent pipeline runs."""
+    return get_stage_histogram().summary()
+
+
+@app.get("/pipeline/backlog")
+def get_backlog():
+    """Status of deferred audit work from degraded runs."""
+    return get_pipeline().backlog.status()
+
+
+@app.get("/clusters/{cluster_id}/rationale")
+def get_cluster_rationale(cluster_id: str):
+    """Full rationale for a cluster, generated on first request and cached."""
+    analysis = get_pipeline().get_analysis(cluster_id)
+    if analysis is None:
+        raise HTTPException(status_code=404, detail=f"Unknown cluster: {cluster_id}")
+    
+    rationale = analysis.get_rationale()
+    return {**rationale.to_dict(), "cluster_version": analysis.cluster.version}
+
+
+def _run_from_csv_job(resume: bool):
+    """Job body for run-from-csv: process (or resume) the governed source, summarized for the Analyst View."""
+    def run(progress):
         pipeline = get_pipeline()
-        result = pipeline.process(events)
+        if resume:
+            result = pipeline.resume(CHECKPOINT_DIR, progress=progress)
+        else:
+            result = pipeline.process_file(SOURCE_CSV, checkpoint_dir=CHECKPOINT_DIR, progress=progress)
         
         # Format for Analyst View
         clusters = [analysis.to_analyst_card() for analysis in result.cluster_analyses]
         
         return {
              "status": "success",
-             "source": "synthetic_social_signals_mashreq.csv",
-             "events_processed": len(events),
+             "source": os.path.basename(SOURCE_CSV),
+             "events_processed": sum(result.classification_result.class_distribution.values()),
              "clusters_formed": len(clusters),
              "analyst_cards": clusters,
              "governance_check": result.governance_validated
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return run
+
+
+def _submit_run_from_csv(resume: bool):
+    """Queue a run-from-csv job; resumes always run (they finish interrupted audit writes)."""
+    try:
+        return get_job_queue().submit(
+            "resume-from-csv" if resume else "run-from-csv", 
+            _run_from_csv_job(resume), 
+            SOURCE_CSV, 
+            use_cache=not resume
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+@app.post("/pipeline/run-from-csv", response_model=RunFromCsvResponse, responses=NEGOTIATED)
+def run_from_csv(request: Request, resume: bool = False):
+    """
+    CRITICAL: Trigger strict 10-stage pipeline from the validated CSV.
+    Ensures 'Synthetic Data Only' governance.
+    
+    The file is processed in checkpointed chunks; pass resume=true to
+    continue an interrupted run from its last checkpoint.
+    
+    Blocks until the run finishes; long backfills should use POST /jobs/run-from-csv.
+    An unchanged file returns the cached result of its last run.
+    """
+    job = get_job_queue().wait(_submit_run_from_csv(resume).job_id)
+    if job.status == "succeeded":
+        return _encoded(request, job.result)
+    if job.error_type == "FileNotFoundError":
+        raise HTTPException(status_code=404, detail=job.error)
+    raise HTTPException(status_code=500, detail=job.error or f"Job {job.status}")
+
+
+@app.post("/jobs/run-from-csv", status_code=202)
+def submit_run_from_csv(resume: bool = False):
+    """
+    Start run-from-csv in the background and return its job ID immediately.
+    Poll GET /jobs/{job_id} or follow GET /jobs/{job_id}/events.
+    """
+    job = _submit_run_from_csv(resume)
+    return {**job.to_dict(include_result=False), "poll": f"/jobs/{job.job_id}"}
+
+
+@app.get("/jobs")
+def list_jobs():
+    """Jobs known to this worker, newest first, plus pool and cache status."""
+    queue = get_job_queue()
+    return {"status": queue.status(), "jobs": queue.list()}
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str, include_result: bool = True):
+    """Job status, progress (stage, events processed, ETA) and, once finished, its result."""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job.to_dict(include_result=include_result)
+
+
+@app.get("/jobs/{job_id}/events")
+def stream_job_progress(job_id: str):
+    """
+    Follow a job as newline-delimited JSON: one line per progress update,
+    ending with the finished job (including its result).
+    """
+    queue = get_job_queue()
+    if queue.get(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    
+    def updates():
+        for job in queue.watch(job_id):
+            yield json.dumps(job.to_dict(include_result=job.finished)) + "\n"
+    
+    return StreamingResponse(updates(), media_type="application/x-ndjson")
+
+
+@app.get("/pipeline/checkpoint")
+def get_checkpoint():
+    """Progress of the last checkpointed run-from-csv."""
+    checkpoint = CheckpointStore(CHECKPOINT_DIR).load()
+    if checkpoint is None:
+        raise HTTPException(status_code=404, detail="No checkpoint found")
+    return checkpoint.to_dict()
 
 
 @app.post("/pipeline/decision")
@@ -244,30 +697,137 @@ def log_human_decision(req: HumanDecisionRequest, x_role: str = "analyst"):
     return {"status": "logged" if success else "failed", "cluster_id": req.cluster_id}
 
 
-@app.get("/audit/records")
-def get_audit_records(limit: int = 50):
-    """Get recent audit records."""
+@app.post("/pipeline/decisions")
+def log_human_decisions(req: BulkDecisionRequest, x_role: str = "analyst"):
+    """
+    Log many human decisions in one request (bulk triage). Enforces RBAC
+    once per distinct decision; authorized items are written as one audit
+    group commit. Returns per-item results.
+    
+    Headers:
+        X-Role: 'analyst' | 'reviewer' | 'admin'
+    """
+    if len(req.decisions) > MAX_BULK_DECISIONS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_BULK_DECISIONS} decisions per request"
+        )
+    
+    pipeline = get_pipeline()
+    results = pipeline.log_human_decisions([dict(d) for d in req.decisions], role=x_role)
+    
+    summary = {}
+    for result in results:
+        summary[result["status"]] = summary.get(result["status"], 0) + 1
+    return {"summary": summary, "results": results}
+
+
+@app.get("/audit/records", response_model=AuditRecordsPage, responses=NEGOTIATED)
+def get_audit_records(
+    request: Request,
+    limit: int = Query(50, ge=1, le=MAX_AUDIT_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    cluster_id: Optional[str] = None,
+    category: Optional[str] = None,
+    decision: Optional[str] = None,
+    user: Optional[str] = None
+):
+    """
+    Audit records, newest first, one page at a time. Pass the response's
+    next_cursor to get the following (older) page; it is null on the last.
+    Filters: time range (ISO, inclusive), cluster_id, category, decision, user.
+    """
+    logger = get_audit_logger()
+    try:
+        page = logger.page_records(cursor, limit, start_date, end_date, cluster_id, category, decision, user)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _encoded(request, {**page, "limit": limit})
+
+
+@app.get("/audit/writer")
+def get_audit_writer_status():
+    """Audit writer queue depth, group-commit counts and commit latency."""
+    return get_audit_writer().status()
+
+
+@app.get("/audit/query", response_model=AuditQueryResponse, responses=NEGOTIATED)
+def query_audit_records(
+    request: Request,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    cluster_id: Optional[str] = None,
+    decision: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=MAX_AUDIT_PAGE_SIZE),
+    offset: int = Query(0, ge=0)
+):
+    """Filtered, paginated audit records, oldest first (offset-based; see /audit/records for cursors)."""
+    logger = get_audit_logger()
+    records = logger.query_records(start_date, end_date, cluster_id, decision, category, limit, offset)
+    return _encoded(request, {"records": records, "limit": limit, "offset": offset})
+
+
+@app.get("/audit/decisions", response_model=DecisionsResponse, responses=NEGOTIATED)
+def get_current_decisions(request: Request, decision: str = "PENDING"):
+    """Clusters whose current decision is `decision` (default: still pending), from the decision view."""
     logger = get_audit_logger()
-    return logger.get_recent_records(limit)
+    logger.refresh()
+    states = logger.decisions.clusters_with(decision)
+    return _encoded(request, {
+        "decision": decision,
+        "count": len(states),
+        "counts": logger.decisions.counts(),
+        "clusters": [s.to_dict() for s in states]
+    })
+
+
+@app.get("/audit/decisions/{cluster_id}", response_model=DecisionStateOut, responses=NEGOTIATED)
+def get_current_decision(cluster_id: str, request: Request):
+    """Current decision, decider and timestamp for one cluster."""
+    state = get_audit_logger().get_decision(cluster_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"No audit records for cluster {cluster_id}")
+    return _encoded(request, state.to_dict())
+
+
+@app.get("/audit/verify")
+def verify_audit_chain(full: bool = False):
+    """Verify the audit trail's hash chain; only rows since the last verified checkpoint unless full=true."""
+    logger = get_audit_logger()
+    return logger.verify_chain(full=full).to_dict()
 
 
 @app.get("/audit/stats")
-def get_audit_stats():
-    """Get audit log statistics."""
+def get_audit_stats(days: Optional[int] = None):
+    """Exact audit statistics (all-time, plus the last `days` days if given)."""
     logger = get_audit_logger()
-    return logger.get_stats()
+    return logger.get_stats(days)
 
 
 @app.get("/audit/export")
-def export_audit_csv():
-    """Export audit log as CSV."""
+def export_audit_csv(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    decision: Optional[str] = None,
+    category: Optional[str] = None,
+    gzip: bool = False
+):
+    """
+    Stream the audit log as CSV (optionally gzipped), filtered by date range
+    (ISO dates, inclusive), decision and category. Rows are streamed from
+    storage in chunks, so memory stays flat regardless of log size.
+    """
     logger = get_audit_logger()
-    csv_data = logger.export_csv()
+    chunks = logger.iter_export_csv(start_date, end_date, decision, category, compress=gzip)
     
+    filename = "audit_trail.csv.gz" if gzip else "audit_trail.csv"
     return StreamingResponse(
-        io.BytesIO(csv_data),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=audit_trail.csv"}
+        chunks,
+        media_type="application/gzip" if gzip else "text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 
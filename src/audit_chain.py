@@ -0,0 +1,367 @@
+"""
+Audit Chain - Tamper-Evident Hash Chain
+=======================================
+Makes the audit CSV trail tamper-evident.
+
+Every row carries:
+- prev_hash: record_hash of the row before it (GENESIS_HASH for the first)
+- record_hash: SHA-256 over all of the row's other columns
+
+Editing, deleting or reordering any row breaks the chain from that row on.
+
+Every CHECKPOINT_EVERY_RECORDS rows (at batch boundaries) a checkpoint is
+appended to audit_chain_checkpoints.jsonl. It records the row count, the
+byte offset of the CSV after the row, and that row's hash, and is signed
+with HMAC-SHA256 when AUDIT_SIGNING_KEY is set.
+
+The verifier remembers the last checkpoint it verified. The next run seeks
+straight to that byte offset and checks only the rows written since, so
+verification cost grows with new records, not history. full=True
+re-verifies from the first row.
+
+Responsible AI Mapping:
+- Auditability: Any after-the-fact edit to the trail is detectable
+- Accountability: Signed checkpoints anchor the trail to a key holder
+"""
+
+import csv
+import hashlib
+import hmac
+import io
+import json
+import os
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from audit_store import BoundedReader
+from file_lock import atomic_write_json
+
+# prev_hash of the first row
+GENESIS_HASH = "0" * 64
+
+
+def compute_record_hash(row: Dict[str, str], headers: List[str]) -> str:
+    """SHA-256 over a row's column values (as written to CSV), excluding record_hash."""
+    payload = "\x1f".join(str(row.get(h, "")) for h in headers if h != "record_hash")
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ChainCheckpoint:
+    """Signed anchor for the chain up to a given row."""
+    seq: int
+    record_count: int  # Rows in the chain up to and including this row
+    byte_offset: int  # CSV size right after this row
+    record_id: str
+    record_hash: str
+    created_at: str
+    signature: Optional[str] = None  # HMAC-SHA256 hex, None when unsigned
+    
+    def payload(self) -> bytes:
+        """Canonical bytes covered by the signature."""
+        fields = asdict(self)
+        fields.pop("signature")
+        return json.dumps(fields, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+@dataclass
+class ChainVerification:
+    """Result of verifying the audit chain."""
+    valid: bool
+    records_checked: int
+    verified_through: int  # Chain length covered by verified checkpoints
+    total_records: int
+    checkpoints_verified: int
+    signed: bool
+    full: bool
+    elapsed_ms: float
+    error: Optional[str] = None
+    failed_record_id: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        result = asdict(self)
+        result["elapsed_ms"] = round(self.elapsed_ms, 3)
+        return result
+
+
+class AuditChain:
+    """
+    Maintains the hash chain for one audit CSV (links rows, writes checkpoints)
+    and verifies it incrementally. Callers serialize writes (AuditLogger lock).
+    """
+    
+    # Rows between signed checkpoints
+    CHECKPOINT_EVERY_RECORDS = 1000
+    
+    CHECKPOINT_FILE = "audit_chain_checkpoints.jsonl"
+    VERIFIED_FILE = "audit_chain_verified.json"
+    
+    def __init__(
+        self,
+        csv_path: str,
+        headers: List[str],
+        signing_key: Optional[str] = None,
+        checkpoint_every: Optional[int] = None
+    ):
+        """
+        Args:
+            csv_path: Audit CSV trail
+            headers: CSV columns (must include prev_hash and record_hash)
+            signing_key: HMAC key for checkpoints (unsigned if None)
+            checkpoint_every: Rows between checkpoints
+        """
+        self.csv_path = Path(csv_path)
+        self.headers = headers
+        self.signing_key = signing_key.encode("utf-8") if signing_key else None
+        self.checkpoint_every = checkpoint_every or self.CHECKPOINT_EVERY_RECORDS
+        self.checkpoint_path = self.csv_path.parent / self.CHECKPOINT_FILE
+        self.verified_path = self.csv_path.parent / self.VERIFIED_FILE
+        
+        self._checkpoints = self._load_checkpoints()
+        self.last_hash, self.record_count, self.last_record_id = self._recover_tail()
+        self._since_checkpoint = self.record_count - (self._checkpoints[-1].record_count if self._checkpoints else 0)
+    
+    def _load_checkpoints(self) -> List[ChainCheckpoint]:
+        """Read the checkpoint log (a partial trailing line is ignored)."""
+        checkpoints = []
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        checkpoints.append(ChainCheckpoint(**json.loads(line)))
+                    except (json.JSONDecodeError, TypeError):
+                        break
+        except FileNotFoundError:
+            pass
+        return checkpoints
+    
+    def _rows_from(self, offset: int, end_offset: Optional[int] = None):
+        """Iterate CSV rows (as dicts) between two byte offsets."""
+        f = open(self.csv_path, 'rb')
+        f.seek(offset)
+        raw = f if end_offset is None else BoundedReader(f, end_offset - offset)
+        text = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+        try:
+            for row in csv.reader(text):
+                if not row or row == self.headers:
+                    continue
+                yield dict(zip(self.headers, row))
+        finally:
+            text.close()
+    
+    def _recover_tail(self):
+        """Chain head (hash, length, record ID) from the last checkpoint plus the rows after it."""
+        if self._checkpoints and self.csv_path.exists() and self.csv_path.stat().st_size >= self._checkpoints[-1].byte_offset:
+            cp = self._checkpoints[-1]
+            last_hash, count, last_id, offset = cp.record_hash, cp.record_count, cp.record_id, cp.byte_offset
+        else:
+            last_hash, count, last_id, offset = GENESIS_HASH, 0, None, 0
+        
+        if self.csv_path.exists():
+            for row in self._rows_from(offset):
+                last_hash = row.get("record_hash") or last_hash
+                last_id = row.get("record_id")
+                count += 1
+        return last_hash, count, last_id
+    
+    def catch_up(self, offset: int, end_offset: int):
+        """Advance the head over rows another process appended between two offsets."""
+        self._checkpoints = self._load_checkpoints()
+        for row in self._rows_from(offset, end_offset):
+            self.last_hash = row.get("record_hash") or self.last_hash
+            self.last_record_id = row.get("record_id")
+            self.record_count += 1
+        self._since_checkpoint = self.record_count - (self._checkpoints[-1].record_count if self._checkpoints else 0)
+    
+    def link(self, rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Set prev_hash/record_hash on rows about to be appended (in place).
+        Chain state only advances on commit(), once the write succeeded.
+        """
+        prev = self.last_hash
+        for row in rows:
+            row["prev_hash"] = prev
+            row["record_hash"] = compute_record_hash(row, self.headers)
+            prev = row["record_hash"]
+        return rows
+    
+    def commit(self, rows: List[Dict[str, str]], byte_offset: int):
+        """Advance the chain after rows were written; checkpoint when due."""
+        if not rows:
+            return
+        self.last_hash = rows[-1]["record_hash"]
+        self.last_record_id = rows[-1]["record_id"]
+        self.record_count += len(rows)
+        self._since_checkpoint += len(rows)
+        if self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint(byte_offset)
+    
+    def _sign(self, checkpoint: ChainCheckpoint) -> Optional[str]:
+        """HMAC-SHA256 signature, or None without a key."""
+        if self.signing_key is None:
+            return None
+        return hmac.new(self.signing_key, checkpoint.payload(), hashlib.sha256).hexdigest()
+    
+    def checkpoint(self, byte_offset: int) -> Optional[ChainCheckpoint]:
+        """Append a checkpoint at the current chain head (byte_offset = CSV size)."""
+        if self.record_count == 0 or (self._checkpoints and self._checkpoints[-1].record_count == self.record_count):
+            return None
+        cp = ChainCheckpoint(
+            seq=len(self._checkpoints) + 1,
+            record_count=self.record_count,
+            byte_offset=byte_offset,
+            record_id=self.last_record_id or "",
+            record_hash=self.last_hash,
+            created_at=datetime.now().isoformat()
+        )
+        cp.signature = self._sign(cp)
+        with open(self.checkpoint_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(asdict(cp)) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._checkpoints.append(cp)
+        self._since_checkpoint = 0
+        return cp
+    
+    def _load_verified(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.verified_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+    
+    def _save_verified(self, cp: ChainCheckpoint):
+        atomic_write_json(self.verified_path, asdict(cp))
+    
+    def _check_signature(self, cp: ChainCheckpoint) -> Optional[str]:
+        """Error message if a checkpoint's signature is missing or wrong."""
+        if self.signing_key is None:
+            return None
+        if cp.signature is None:
+            return f"Checkpoint {cp.seq} is unsigned"
+        if not hmac.compare_digest(cp.signature, self._sign(cp)):
+            return f"Checkpoint {cp.seq} signature mismatch"
+        return None
+    
+    def verify(self, full: bool = False, end_offset: Optional[int] = None) -> ChainVerification:
+        """
+        Verify the chain from the last verified checkpoint (or from the start).
+        
+        Args:
+            full: Ignore the verified checkpoint and re-check every row
+            end_offset: Stop at this CSV size (rows being appended are left alone)
+        """
+        start = time.perf_counter()
+        checkpoints = self._load_checkpoints()
+        
+        # Resume from the last verified checkpoint, if it is still in the log unchanged
+        anchor = None if full else self._load_verified()
+        if anchor is not None:
+            seq = anchor.get("seq", 0)
+            if seq > len(checkpoints) or asdict(checkpoints[seq - 1]) != anchor:
+                anchor = None
+        if anchor is not None and self.csv_path.stat().st_size < anchor["byte_offset"]:
+            return self._result(False, 0, 0, len(checkpoints), full, start, "Audit trail was truncated")
+        
+        prev = anchor["record_hash"] if anchor else GENESIS_HASH
+        count = anchor["record_count"] if anchor else 0
+        offset = anchor["byte_offset"] if anchor else 0
+        verified_cp = checkpoints[anchor["seq"] - 1] if anchor else None
+        pending = [cp for cp in checkpoints if cp.record_count > count]
+        checkpoints_ok = 0
+        checked = 0
+        
+        for row in self._rows_from(offset, end_offset):
+            checked += 1
+            count += 1
+            record_id = row.get("record_id")
+            if row.get("prev_hash") != prev:
+                return self._result(False, checked, verified_cp, count - 1, full, start,
+                                    f"Chain broken at row {count}: prev_hash mismatch", record_id)
+            if compute_record_hash(row, self.headers) != row.get("record_hash"):
+                return self._result(False, checked, verified_cp, count - 1, full, start,
+                                    f"Row {count} was modified: record_hash mismatch", record_id)
+            prev = row["record_hash"]
+            
+            while pending and pending[0].record_count == count:
+                cp = pending.pop(0)
+                error = self._check_signature(cp)
+                if error is None and cp.record_hash != prev:
+                    error = f"Checkpoint {cp.seq} does not match row {count}"
+                if error:
+                    return self._result(False, checked, verified_cp, count, full, start, error, record_id)
+                verified_cp = cp
+                checkpoints_ok += 1
+        
+        if pending:
+            return self._result(False, checked, verified_cp, count, full, start,
+                                f"Checkpoint {pending[0].seq} refers to rows missing from the trail")
+        
+        if verified_cp is not None:
+            self._save_verified(verified_cp)
+        
+        result = self._result(True, checked, verified_cp, count, full, start)
+        result.checkpoints_verified = checkpoints_ok
+        return result
+    
+    def _result(
+        self,
+        valid: bool,
+        checked: int,
+        verified_cp: Any,
+        total: int,
+        full: bool,
+        start: float,
+        error: Optional[str] = None,
+        record_id: Optional[str] = None
+    ) -> ChainVerification:
+        verified_through = verified_cp.record_count if isinstance(verified_cp, ChainCheckpoint) else 0
+        return ChainVerification(
+            valid=valid,
+            records_checked=checked,
+            verified_through=verified_through,
+            total_records=total,
+            checkpoints_verified=0,
+            signed=self.signing_key is not None,
+            full=full,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            error=error,
+            failed_record_id=record_id
+        )
+
+
+if __name__ == "__main__":
+    # Demo
+    import tempfile
+    
+    headers = ["record_id", "cluster_id", "human_decision", "prev_hash", "record_hash"]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "audit.csv")
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            csv.DictWriter(f, fieldnames=headers).writeheader()
+        
+        chain = AuditChain(csv_path, headers, signing_key="demo-key", checkpoint_every=10)
+        for batch in range(5):
+            rows = chain.link([
+                {"record_id": f"AUD-{batch}-{i}", "cluster_id": "SVC-01", "human_decision": "PENDING"}
+                for i in range(5)
+            ])
+            with open(csv_path, 'a', newline='', encoding='utf-8') as f:
+                csv.DictWriter(f, fieldnames=headers).writerows(rows)
+                offset = f.tell()
+            chain.commit(rows, offset)
+        
+        print(f"Full verify: {chain.verify(full=True).to_dict()}")
+        print(f"Incremental verify: {chain.verify().to_dict()}")
+        
+        # Tamper with a row
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        with open(csv_path, 'w', encoding='utf-8') as f:
+            f.write(content.replace("AUD-3-2,SVC-01,PENDING", "AUD-3-2,SVC-01,APPROVED"))
+        print(f"After tampering (full): {chain.verify(full=True).to_dict()}")
@@ -0,0 +1,392 @@
+"""
+Audit Index - Position Index over the Segment Store
+===================================================
+SQLite sidecar index (audit_segments/positions.db) that serves filtered,
+cursor-paginated audit records from the JSONL segment store without
+reading the log.
+
+Each stored record gets one index row: its position (ordinal in the
+store), the segment and byte range it occupies, and the columns clients
+filter on (timestamp, cluster_id, signal_category, human_decision,
+human_user). Pages are ordered newest first by (timestamp, position)
+and each filter has a (column, timestamp) index, so a page is one index
+range scan from the cursor plus one seek per record: its cost does not
+depend on how deep into history the cursor points.
+
+Decision updates are stored alongside the records (update_type =
+"DECISION_UPDATE"). They are indexed as record_type 'DECISION_UPDATE'
+rows and also move their cluster's decision records to the new latest
+decision (latest_decision, latest_user), which is what the decision
+and user filters match, as with the SQLite repository.
+
+The index is derived and rebuildable:
+- catch_up() indexes the complete lines appended since its high-water
+  mark (segment, byte offset), so it follows appends from any process
+- If the segment store no longer matches (directory replaced, segments
+  removed) the index is rebuilt from scratch
+
+query() serves the offset-based /audit/query pages from the same index,
+oldest first.
+
+Cursors are opaque to clients: encode_cursor()/decode_cursor() wrap the
+(timestamp, position) key of a page's last record.
+
+Responsible AI Mapping:
+- Auditability: Reviewers can page through the full history at constant cost
+- Transparency: Every record is reachable; filters never sample
+"""
+
+import base64
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from audit_sqlite import apply_decision_updates, where_clause
+from audit_store import AuditSegmentStore
+from trail_view import is_decision_update
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    position INTEGER PRIMARY KEY,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    record_id TEXT,
+    timestamp TEXT NOT NULL,
+    cluster_id TEXT,
+    signal_category TEXT,
+    human_decision TEXT,
+    human_user TEXT,
+    record_type TEXT NOT NULL,
+    latest_decision TEXT,
+    latest_user TEXT,
+    latest_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_positions_time ON positions(timestamp);
+CREATE INDEX IF NOT EXISTS idx_positions_record ON positions(record_id);
+CREATE INDEX IF NOT EXISTS idx_positions_cluster_time ON positions(cluster_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_positions_category_time ON positions(signal_category, timestamp);
+CREATE INDEX IF NOT EXISTS idx_positions_latest_decision_time ON positions(latest_decision, timestamp);
+CREATE INDEX IF NOT EXISTS idx_positions_latest_user_time ON positions(latest_user, timestamp);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+CURSOR_VERSION = "v1"
+
+
+def encode_cursor(key: Tuple[str, int]) -> str:
+    """Opaque cursor for a (timestamp, position) page key."""
+    timestamp, position = key
+    raw = f"{CURSOR_VERSION}|{position}|{timestamp}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    The (timestamp, position) key inside a cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        version, position, timestamp = raw.split("|", 2)
+        if version != CURSOR_VERSION:
+            raise ValueError(version)
+        return timestamp, int(position)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+class AuditRecordIndex:
+    """
+    Position index over an AuditSegmentStore. Thread-safe; several
+    processes may share the index file.
+    """
+    
+    INDEX_FILE = "positions.db"
+    
+    # Index rows inserted per transaction while catching up
+    BATCH_SIZE = 1000
+    
+    def __init__(self, store: AuditSegmentStore, db_path: Optional[str] = None):
+        """
+        Args:
+            store: Segment store to index
+            db_path: Index database (default: positions.db in the store's directory)
+        """
+        self.store = store
+        self.db_path = Path(db_path) if db_path else store.directory / self.INDEX_FILE
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._drop_outdated()
+        self._conn.executescript(SCHEMA)
+        self._high_water: Optional[Tuple[int, int]] = None
+    
+    def _drop_outdated(self):
+        """Drop an index built before decision updates were indexed; it is rebuilt on catch_up()."""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(positions)")}
+        if columns and "record_type" not in columns:
+            self._conn.execute("DROP TABLE positions")
+            self._conn.execute("DROP TABLE IF EXISTS meta")
+    
+    def _segment_path(self, segment: int) -> Path:
+        return self.store.directory / self.store.SEGMENT_PATTERN.format(segment)
+    
+    def _meta(self) -> Dict[str, str]:
+        return {row["key"]: row["value"] for row in self._conn.execute("SELECT key, value FROM meta")}
+    
+    def _store_identity(self, segments: List[Dict[str, Any]]) -> str:
+        """Identifies the store the index was built from (its first record)."""
+        return (segments[0].get("first_record_id") or "") if segments else ""
+    
+    def catch_up(self) -> int:
+        """
+        Index records appended to the store since the last call.
+        
+        Returns:
+            Records indexed
+        """
+        segments = self.store.segments()
+        identity = self._store_identity(segments)
+        try:
+            end = (len(segments), self._segment_path(len(segments)).stat().st_size)
+        except FileNotFoundError:
+            end = None
+        if end is not None and end == self._high_water:
+            return 0
+        
+        with self._lock:
+            # IMMEDIATE: one process at a time advances the high-water mark
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                meta = self._meta()
+                segment = int(meta.get("segment", 1))
+                offset = int(meta.get("offset", 0))
+                position = int(meta.get("next_position", 0))
+                
+                if (meta.get("store_identity", identity) != identity or segment > max(len(segments), 1)
+                        or (segment == len(segments) and end is not None and offset > end[1])):
+                    # The store was replaced: start over
+                    self._conn.execute("DELETE FROM positions")
+                    segment, offset, position = 1, 0, 0
+                
+                indexed = 0
+                while segment <= len(segments):
+                    path = self._segment_path(segment)
+                    rows, updates = [], []
+                    with open(path, 'rb') as f:
+                        f.seek(offset)
+                        for line in f:
+                            if not line.endswith(b"\n"):
+                                break  # Partial append in progress
+                            try:
+                                record = json.loads(line)
+                            except json.JSONDecodeError:
+                                offset += len(line)
+                                continue
+                            update = is_decision_update(record)
+                            rows.append((
+                                position, segment, offset, len(line),
+                                record.get("record_id"),
+                                record.get("timestamp") or "",
+                                record.get("cluster_id"),
+                                record.get("signal_category"),
+                                record.get("human_decision"),
+                                record.get("human_user"),
+                                "DECISION_UPDATE" if update else "DECISION",
+                                None if update else record.get("human_decision"),
+                                None if update else record.get("human_user"),
+                                None if update else record.get("timestamp") or ""
+                            ))
+                            if update:
+                                updates.append(record)
+                            position += 1
+                            offset += len(line)
+                            if len(rows) >= self.BATCH_SIZE:
+                                self._insert(rows, updates)
+                                indexed += len(rows)
+                                rows, updates = [], []
+                    self._insert(rows, updates)
+                    indexed += len(rows)
+                    
+                    if segment == len(segments) or not segments[segment - 1]["closed"]:
+                        break
+                    segment, offset = segment + 1, 0
+                
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [("segment", str(segment)), ("offset", str(offset)),
+                     ("next_position", str(position)), ("store_identity", identity)]
+                )
+                self._conn.execute("COMMIT")
+                self._high_water = (segment, offset)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return indexed
+    
+    def _insert(self, rows: List[tuple], updates: List[Dict[str, Any]]):
+        if rows:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO positions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            apply_decision_updates(self._conn, "positions", updates)
+    
+    def page(
+        self,
+        limit: int = 50,
+        before: Optional[Tuple[str, int]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        cluster_id: Optional[str] = None,
+        decision: Optional[str] = None,
+        category: Optional[str] = None,
+        user: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """
+        One page of decision records, newest first. decision and user
+        match the latest decision; records carry it as
+        latest_decision/latest_user.
+        
+        Args:
+            limit: Page size
+            before: Key of the previous page's last record (None: start at the newest)
+        
+        Returns:
+            (records, key of the last record if there are more, else None)
+        """
+        self.catch_up()
+        
+        clauses, params = where_clause(start_date, end_date, cluster_id, decision, category, user, latest=True)
+        clauses.append("record_type = 'DECISION'")
+        if before is not None:
+            clauses.append("(timestamp, position) < (?, ?)")
+            params.extend(before)
+        sql = (
+            "SELECT position, segment, offset, length, timestamp, latest_decision, latest_user "
+            f"FROM positions WHERE {' AND '.join(clauses)} "
+            "ORDER BY timestamp DESC, position DESC LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit + 1]).fetchall()
+        
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return self._read(rows), ((rows[-1]["timestamp"], rows[-1]["position"]) if more else None)
+    
+    def query(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        cluster_id: Optional[str] = None,
+        decision: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Filtered, paginated decision records, oldest first (as SQLiteAuditRepository.query)."""
+        self.catch_up()
+        
+        clauses, params = where_clause(start_date, end_date, cluster_id, decision, category)
+        clauses.append("record_type = 'DECISION'")
+        sql = (
+            "SELECT position, segment, offset, length, timestamp, latest_decision, latest_user "
+            f"FROM positions WHERE {' AND '.join(clauses)} "
+            "ORDER BY timestamp, position LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit, offset]).fetchall()
+        return self._read(rows)
+    
+    def _read(self, rows: List[sqlite3.Row]) -> List[Dict[str, Any]]:
+        """Fetch indexed records from their segments (one seek each, one open per segment)."""
+        records = []
+        handles = {}
+        try:
+            for row in rows:
+                f = handles.get(row["segment"])
+                if f is None:
+                    f = handles[row["segment"]] = open(self._segment_path(row["segment"]), 'rb')
+                f.seek(row["offset"])
+                record = json.loads(f.read(row["length"]))
+                record["latest_decision"] = row["latest_decision"]
+                record["latest_user"] = row["latest_user"]
+                records.append(record)
+        finally:
+            for f in handles.values():
+                f.close()
+        return records
+    
+    def count(self) -> int:
+        """Records indexed so far."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+    
+    def existing_ids(self, record_ids: List[str]) -> set:
+        """Which of the given record IDs are in the store (catches up first)."""
+        self.catch_up()
+        found = set()
+        with self._lock:
+            for start in range(0, len(record_ids), self.BATCH_SIZE):
+                chunk = record_ids[start:start + self.BATCH_SIZE]
+                rows = self._conn.execute(
+                    f"SELECT record_id FROM positions WHERE record_id IN ({', '.join('?' for _ in chunk)})", chunk
+                )
+                found.update(row["record_id"] for row in rows)
+        return found
+    
+    def update_ids(self) -> set:
+        """Record IDs of the decision updates indexed so far."""
+        with self._lock:
+            rows = self._conn.execute("SELECT record_id FROM positions WHERE record_type = 'DECISION_UPDATE'")
+            return {row["record_id"] for row in rows}
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+if __name__ == "__main__":
+    # Demo: page backwards through a store with a cluster filter
+    import tempfile
+    import time
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AuditSegmentStore(tmp, segment_max_bytes=64 * 1024)
+        for batch in range(200):
+            store.append([
+                {
+                    "record_id": f"AUD-{batch:04d}-{i}",
+                    "cluster_id": f"SVC-{i:02d}",
+                    "timestamp": f"2026-01-{1 + batch // 10:02d}T10:{batch % 10:02d}:{i:02d}",
+                    "signal_category": "SERVICE",
+                    "human_decision": "PENDING",
+                    "human_user": "SYSTEM"
+                }
+                for i in range(10)
+            ])
+        
+        index = AuditRecordIndex(store)
+        start = time.perf_counter()
+        print(f"Indexed {index.catch_up()} records in {(time.perf_counter() - start) * 1000:.1f}ms")
+        
+        cursor, pages = None, 0
+        while True:
+            records, key = index.page(limit=50, before=cursor and decode_cursor(cursor), cluster_id="SVC-03")
+            pages += 1
+            if key is None:
+                break
+            cursor = encode_cursor(key)
+        print(f"SVC-03: {pages} pages, last record {records[-1]['record_id']}, last cursor {cursor}")
+        
+        page, _ = index.page(limit=3, start_date="2026-01-05", end_date="2026-01-05")
+        print(f"Newest on Jan 5: {[r['record_id'] for r in page]}")
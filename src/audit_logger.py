@@ -10,19 +10,63 @@ Logged Fields:
 - Rationale text
 - Human decision and timestamp
 
+Storage:
+- audit_trail_full.csv: flat export-friendly trail (records + decision updates)
+- audit_segments/: append-only JSONL segment store (see audit_store.py), or
+- audit.db: indexed SQLite repository when AUDIT_BACKEND=sqlite (see audit_sqlite.py)
+- audit_segments/positions.db: position index over the segment store that
+  serves cursor-paginated, filtered pages (see audit_index.py)
+
+Decision updates go to the CSV and to the record store, so paging by
+decision or user matches the latest human decision on either backend.
+Updates logged before the segment store held them are copied over from
+the CSV once, when the logger is opened.
+
+CSV rows are hash-chained (prev_hash/record_hash) with periodic signed
+checkpoints, so edits to the trail are detectable (see audit_chain.py).
+A trail written before chaining is re-chained from GENESIS_HASH when it
+is first opened (the original is kept as audit_trail_full.legacy-<stamp>.csv).
+The current decision per cluster (decision_view.json, see decision_view.py)
+and exact stats counters (audit_stats.json, see audit_stats.py) are
+maintained incrementally as rows are written.
+
+All file access goes through one lock per logger, so concurrent requests
+never interleave rows. Writes also hold an advisory file lock on the CSV
+(see file_lock.py), so separate processes (uvicorn workers, the dashboard)
+can share data/. Each process catches up on rows appended by the others
+(chain head, decision view, segment index) before it writes.
+
+Human decisions folded into the decision view, including ones caught up
+from other processes, are published as "decision" events (see event_bus.py).
+
 Responsible AI Mapping:
 - Auditability: Complete decision trail
-- Accountability: Immutable logging
+- Accountability: Immutable logging, tamper-evident via the hash chain
 """
 
 import csv
+import io
 import json
 import os
+import secrets
+import shutil
+import threading
+import zlib
 from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+from datetime import datetime, timedelta
 from pathlib import Path
 
+from audit_chain import GENESIS_HASH, AuditChain, ChainVerification, compute_record_hash
+from audit_index import AuditRecordIndex, decode_cursor, encode_cursor
+from audit_store import AuditSegmentStore, BoundedReader
+from audit_stats import AuditStats
+from decision_view import DecisionState, DecisionView
+from event_bus import publish
+from file_lock import get_file_lock
+from audit_sqlite import SQLiteAuditRepository
+from trail_view import is_decision_update
+
 
 @dataclass
 class AuditRecord:
@@ -61,6 +105,10 @@ class AuditRecord:
     processing_time_ms: int
     model_version: str
     
+    # Hash chain (set when the record is written)
+    prev_hash: str = ""
+    record_hash: str = ""
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, handling nested structures."""
         result = asdict(self)
@@ -84,7 +132,17 @@ class AuditLogger:
     """
     
     CSV_FILE = "data/audit_trail_full.csv"
-    JSON_FILE = "data/audit_log.json"
+    SEGMENT_DIR = "data/audit_segments"
+    SQLITE_FILE = "data/audit.db"
+    
+    # Record store backends: "file" (JSONL segments) or "sqlite"
+    BACKENDS = ("file", "sqlite")
+    
+    # Legacy rewrite-per-write log, imported into the segment store once
+    LEGACY_JSON_FILE = "data/audit_log.json"
+    
+    # Bytes buffered per chunk of a streamed export
+    EXPORT_CHUNK_BYTES = 64 * 1024
     
     CSV_HEADERS = [
         "record_id", "cluster_id", "timestamp",
@@ -94,31 +152,153 @@ class AuditLogger:
         "rationale_summary", "assumptions",
         "suggested_queue", "priority",
         "human_decision", "human_user", "decision_reason",
-        "processing_time_ms", "model_version"
+        "processing_time_ms", "model_version",
+        "prev_hash", "record_hash"
     ]
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", backend: Optional[str] = None):
+        """
+        Args:
+            data_dir: Directory holding the audit files
+            backend: Record store, "file" or "sqlite" (default: AUDIT_BACKEND env var, else "file")
+        """
+        self.backend = (backend or os.getenv("AUDIT_BACKEND") or "file").lower()
+        if self.backend not in self.BACKENDS:
+            raise ValueError(f"Unknown audit backend: {self.backend} (expected one of {self.BACKENDS})")
+        
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.csv_path = self.data_dir / "audit_trail_full.csv"
-        self.json_path = self.data_dir / "audit_log.json"
-        self._ensure_files()
+        self.legacy_json_path = self.data_dir / "audit_log.json"
+        self._last_id_time: Optional[datetime] = None
+        # Distinguishes IDs minted by different processes in the same microsecond
+        self._id_suffix = secrets.token_hex(2)
+        self._lock = threading.RLock()
+        self._file_lock = get_file_lock(self.csv_path)
+        with self._file_lock:
+            self._ensure_files()
+            self.chain = AuditChain(self.csv_path, self.CSV_HEADERS, signing_key=os.getenv("AUDIT_SIGNING_KEY") or None)
+            self.decisions = DecisionView(self.csv_path, self.data_dir / "decision_view.json")
+            self.counters = AuditStats(self.csv_path, self.data_dir / "audit_stats.json")
+            self._views = (self.decisions, self.counters)
+            self.decisions.on_decision = self._publish_decision
+            if self.backend == "sqlite":
+                self.store = SQLiteAuditRepository(self.data_dir / "audit.db")
+                self.index = None
+            else:
+                self.store = AuditSegmentStore(self.data_dir / "audit_segments")
+                self.index = AuditRecordIndex(self.store)
+                self._migrate_decision_updates()
+            self._migrate_legacy_json()
+            self._csv_size = self.csv_path.stat().st_size
     
     def _ensure_files(self):
         """Ensure audit files exist with headers."""
+        if self.csv_path.exists():
+            with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
+                header = next(csv.reader(f), None)
+            if header and header != self.CSV_HEADERS:
+                self._migrate_legacy_csv()
         if not self.csv_path.exists():
             with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.DictWriter(f, fieldnames=self.CSV_HEADERS)
                 writer.writeheader()
+    
+    def _migrate_legacy_csv(self):
+        """
+        Re-chain a pre-chain trail (other columns) from GENESIS_HASH, in
+        place, so its history stays in exports, stats and verification.
+        The original is kept as audit_trail_full.legacy-<stamp>.csv.
+        """
+        stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        backup = self.csv_path.with_name(f"{self.csv_path.stem}.legacy-{stamp}.csv")
+        migrating = self.csv_path.with_name(f"{self.csv_path.name}.migrating")
+        
+        with open(self.csv_path, 'r', newline='', encoding='utf-8') as src, \
+                open(migrating, 'w', newline='', encoding='utf-8') as dst:
+            writer = csv.DictWriter(dst, fieldnames=self.CSV_HEADERS, extrasaction='ignore')
+            writer.writeheader()
+            prev = GENESIS_HASH
+            for row in csv.DictReader(src, restval=""):
+                row = {h: row.get(h) or "" for h in self.CSV_HEADERS}
+                row["prev_hash"] = prev
+                row["record_hash"] = prev = compute_record_hash(row, self.CSV_HEADERS)
+                writer.writerow(row)
+            dst.flush()
+            os.fsync(dst.fileno())
+        
+        # Back up first: a crash before the replace leaves the legacy trail in place
+        shutil.copy2(self.csv_path, backup)
+        os.replace(migrating, self.csv_path)
+    
+    def _migrate_legacy_json(self):
+        """Import records from a legacy audit_log.json into the record store (once)."""
+        if not self.legacy_json_path.exists():
+            return
+        
+        try:
+            with open(self.legacy_json_path, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except json.JSONDecodeError:
+            legacy = []
         
-        if not self.json_path.exists():
-            with open(self.json_path, 'w', encoding='utf-8') as f:
-                json.dump([], f)
+        if legacy and self.store.count() == 0:
+            self.store.append(legacy)
+        self.legacy_json_path.rename(self.legacy_json_path.with_suffix(".json.migrated"))
+    
+    def _migrate_decision_updates(self):
+        """
+        Copy decision updates that are only in the CSV (written before the
+        segment store held them) into the store. Reads the CSV only when
+        the store has fewer updates than the trail.
+        """
+        expected = self.counters.get()["decision_updates"]
+        if not expected:
+            return
+        self.index.catch_up()
+        known = self.index.update_ids()
+        if len(known) >= expected:
+            return
+        
+        with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
+            missing = [
+                dict(row, update_type="DECISION_UPDATE") for row in csv.DictReader(f)
+                if is_decision_update(row) and row["record_id"] not in known
+            ]
+        self.store.append(missing)
     
     def _generate_record_id(self) -> str:
         """Generate unique record ID."""
-        now = datetime.now()
-        return f"AUD-{now.strftime('%Y%m%d%H%M%S')}-{now.microsecond:06d}"
+        with self._lock:
+            now = datetime.now()
+            # Batched writes create records within the same microsecond; keep IDs strictly increasing
+            if self._last_id_time is not None and now <= self._last_id_time:
+                now = self._last_id_time + timedelta(microseconds=1)
+            self._last_id_time = now
+        return f"AUD-{now.strftime('%Y%m%d%H%M%S')}-{now.microsecond:06d}-{self._id_suffix}"
+    
+    def _publish_decision(self, state: DecisionState):
+        """Push a human decision to live subscribers (GET /events)."""
+        publish("decision", state.cluster_id, state.to_dict())
+    
+    def _catch_up(self):
+        """
+        Fold in rows other processes appended since our last write
+        (caller holds both locks).
+        """
+        size = self.csv_path.stat().st_size
+        if size == self._csv_size:
+            return
+        self.chain.catch_up(self._csv_size, size)
+        for view in self._views:
+            view.catch_up(self._csv_size, size)
+        self.store.refresh()
+        self._csv_size = size
+    
+    def refresh(self):
+        """Pick up audit rows written by other processes (for readers)."""
+        with self._lock, self._file_lock:
+            self._catch_up()
     
     def create_record(
         self,
@@ -216,27 +396,93 @@ class AuditLogger:
         Returns:
             Record ID
         """
-        # Append to CSV
-        with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.CSV_HEADERS)
-            writer.writerow(record.to_flat_dict())
+        return self.log_decisions([record])[0]
+    
+    def log_decisions(self, records: List[AuditRecord], fsync: bool = False) -> List[str]:
+        """
+        Log a batch of audit records with a single append per file.
         
-        # Append to JSON
-        try:
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                records = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            records = []
+        Args:
+            records: AuditRecords to log, in order
+            fsync: Force the batch to stable storage before returning
+        
+        Returns:
+            Record IDs, in order
+        """
+        if not records:
+            return []
         
-        records.append(record.to_dict())
+        with self._lock, self._file_lock:
+            self._catch_up()
+            
+            # Chain the rows onto the current head
+            rows = self.chain.link([r.to_flat_dict() for r in records])
+            for record, row in zip(records, rows):
+                record.prev_hash = row["prev_hash"]
+                record.record_hash = row["record_hash"]
+            
+            # Append to CSV
+            with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=self.CSV_HEADERS)
+                writer.writerows(rows)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+                offset = f.tell()
+            self._csv_size = offset
+            self.chain.commit(rows, offset)
+            for view in self._views:
+                view.apply(rows, offset)
+            
+            # Append to the record store
+            self.store.append([r.to_dict() for r in records], fsync=fsync)
         
-        # Keep only last 1000 records in JSON (CSV keeps all)
-        records = records[-1000:]
+        return [r.record_id for r in records]
+    
+    def store_records(self, records: List[AuditRecord], fsync: bool = False) -> int:
+        """
+        Append records that already reached the CSV trail to the record store
+        alone, skipping any it already holds. Completes a log_decisions() call
+        that failed after the CSV append.
         
-        with open(self.json_path, 'w', encoding='utf-8') as f:
-            json.dump(records, f, indent=2)
+        Returns:
+            Records appended to the store
+        """
+        if not records:
+            return 0
         
-        return record.record_id
+        with self._lock, self._file_lock:
+            if self.backend == "sqlite":
+                # Existing record IDs are skipped by the repository
+                return self.store.append([r.to_dict() for r in records], fsync=fsync)
+            held = self.index.existing_ids([r.record_id for r in records])
+            missing = [r.to_dict() for r in records if r.record_id not in held]
+            self.store.append(missing, fsync=fsync)
+            return len(missing)
+    
+    def sync(self):
+        """Force earlier writes (CSV + record store) to stable storage."""
+        with self._lock:
+            with open(self.csv_path, 'ab') as f:
+                os.fsync(f.fileno())
+            self.store.sync()
+            for view in self._views:
+                view.flush()
+    
+    def csv_offset(self) -> int:
+        """Current size of the audit CSV (a cursor for record_ids_since)."""
+        with self._lock, self._file_lock:
+            return self.csv_path.stat().st_size
+    
+    def record_ids_since(self, offset: int) -> List[str]:
+        """
+        Record IDs written to the audit CSV after a byte offset.
+        Used to tell which records of an interrupted write already landed.
+        """
+        with self._lock, open(self.csv_path, 'rb') as f:
+            f.seek(offset)
+            tail = f.read().decode('utf-8', errors='replace')
+        return [row[0] for row in csv.reader(io.StringIO(tail, newline='')) if row and row[0] != "record_id"]
     
     def update_decision(
         self, 
@@ -258,52 +504,256 @@ class AuditLogger:
         Returns:
             True if logged successfully
         """
-        # Create a minimal update record
-        update_record = {
-            "record_id": self._generate_record_id(),
+        self.update_decisions([{
             "cluster_id": cluster_id,
-            "timestamp": datetime.now().isoformat(),
-            "update_type": "DECISION_UPDATE",
             "human_decision": human_decision,
             "human_user": human_user,
-            "decision_reason": decision_reason or ""
-        }
+            "decision_reason": decision_reason
+        }])
+        return True
+    
+    def update_decisions(self, updates: List[Dict[str, Any]], fsync: bool = False) -> List[str]:
+        """
+        Log several human decisions as one group commit (one append per file).
         
-        # Append to CSV as a lightweight update row
+        Args:
+            updates: Dicts with cluster_id, human_decision, human_user and
+                optional decision_reason, in order
+            fsync: Force the batch to stable storage before returning
+        
+        Returns:
+            Record IDs of the update rows, in order
+        """
+        if not updates:
+            return []
+        
+        # Append to CSV as lightweight update rows (missing fields padded)
         # In practice, you'd want a separate updates table
-        with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
-            # Write minimal update (pad missing fields)
+        rows = []
+        for update in updates:
             row = {h: "" for h in self.CSV_HEADERS}
             row.update({
-                "record_id": update_record["record_id"],
-                "cluster_id": cluster_id,
-                "timestamp": update_record["timestamp"],
-                "human_decision": human_decision,
-                "human_user": human_user,
-                "decision_reason": decision_reason or ""
+                "record_id": self._generate_record_id(),
+                "cluster_id": update["cluster_id"],
+                "timestamp": datetime.now().isoformat(),
+                "human_decision": update["human_decision"],
+                "human_user": update["human_user"],
+                "decision_reason": update.get("decision_reason") or ""
             })
-            writer = csv.DictWriter(f, fieldnames=self.CSV_HEADERS)
-            writer.writerow(row)
+            rows.append(row)
         
-        return True
+        with self._lock, self._file_lock:
+            self._catch_up()
+            self.chain.link(rows)
+            with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=self.CSV_HEADERS)
+                writer.writerows(rows)
+                f.flush()
+                if fsync:
+                    os.fsync(f.fileno())
+                self._csv_size = f.tell()
+            self.chain.commit(rows, self._csv_size)
+            for view in self._views:
+                view.apply(rows, self._csv_size)
+            
+            # The record store keeps decision updates alongside records, so
+            # pages can filter on each record's latest decision
+            self.store.append([dict(row, update_type="DECISION_UPDATE") for row in rows], fsync=fsync)
+        
+        return [row["record_id"] for row in rows]
+    
+    def get_decision(self, cluster_id: str) -> Optional[DecisionState]:
+        """Current decision for a cluster, from the materialized view (O(1))."""
+        self.refresh()
+        return self.decisions.get(cluster_id)
     
-    def export_csv(self, start_date: str = None, end_date: str = None) -> bytes:
+    def get_pending_clusters(self) -> List[DecisionState]:
+        """Clusters whose latest decision is still PENDING, most recent first."""
+        self.refresh()
+        return self.decisions.pending()
+    
+    def verify_chain(self, full: bool = False) -> ChainVerification:
+        """
+        Verify the audit trail's hash chain and signed checkpoints.
+        Only rows after the last verified checkpoint are read unless full=True.
+        """
+        with self._lock, self._file_lock:
+            self._catch_up()
+            # Anchor the rows written so far so the next run can skip them
+            end_offset = self.csv_path.stat().st_size
+            self.chain.checkpoint(end_offset)
+        return self.chain.verify(full=full, end_offset=end_offset)
+    
+    def export_csv(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        decision: str = None,
+        category: str = None
+    ) -> bytes:
         """
         Export audit log as CSV bytes.
+        Materializes the whole export; use iter_export_csv() to stream.
         
         Args:
             start_date: Optional start date filter (ISO format)
             end_date: Optional end date filter (ISO format)
+            decision: Optional human_decision filter
+            category: Optional signal_category filter
             
         Returns:
             CSV file contents as bytes
         """
-        with open(self.csv_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        return b"".join(self.iter_export_csv(start_date, end_date, decision, category))
+    
+    def iter_export_csv(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        decision: str = None,
+        category: str = None,
+        compress: bool = False
+    ) -> Iterator[bytes]:
+        """
+        Stream a filtered CSV export in EXPORT_CHUNK_BYTES chunks.
+        Rows go straight from storage to the consumer, so memory stays flat
+        regardless of log size.
+        
+        Args:
+            start_date: Optional start date filter (ISO format)
+            end_date: Optional end date filter (ISO format; a bare date includes the whole day)
+            decision: Optional human_decision filter
+            category: Optional signal_category filter
+            compress: gzip the stream on the fly
+        
+        Yields:
+            CSV bytes (gzip members if compress=True)
+        """
+        if self.backend == "sqlite":
+            rows = (
+                {k: "" if v is None else v for k, v in record.items()}
+                for record in self.store.iter_range(start_date, end_date, decision=decision, category=category)
+            )
+        else:
+            rows = self._iter_csv_rows(start_date, end_date, decision, category)
+        
+        buffer = io.StringIO(newline='')
+        writer = csv.DictWriter(buffer, fieldnames=self.CSV_HEADERS)
+        gzipper = zlib.compressobj(wbits=31) if compress else None
         
-        # TODO: Implement date filtering if needed
+        def take() -> bytes:
+            data = buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            return gzipper.compress(data) if gzipper else data
         
-        return content.encode('utf-8')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            if buffer.tell() >= self.EXPORT_CHUNK_BYTES:
+                chunk = take()
+                if chunk:
+                    yield chunk
+        
+        chunk = take()
+        if gzipper:
+            chunk += gzipper.flush()
+        if chunk:
+            yield chunk
+    
+    def _iter_csv_rows(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        decision: str = None,
+        category: str = None
+    ) -> Iterator[Dict[str, str]]:
+        """Filtered rows of the CSV trail, read without holding the lock."""
+        end_date = end_date if not end_date or "T" in end_date else f"{end_date}T23:59:59.999999"
+        
+        # Rows are only ever appended: snapshot the size, then stream up to it
+        with self._lock, self._file_lock:
+            end_offset = self.csv_path.stat().st_size
+        
+        with io.TextIOWrapper(BoundedReader(open(self.csv_path, 'rb'), end_offset), encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                ts = row.get("timestamp", "")
+                if (start_date and ts < start_date) or (end_date and ts > end_date):
+                    continue
+                if (decision and row.get("human_decision") != decision
+                        or category and row.get("signal_category") != category):
+                    continue
+                yield row
+    
+    def query_records(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        cluster_id: str = None,
+        decision: str = None,
+        category: str = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Filtered, paginated decision records (oldest first), served from the
+        SQLite repository or the segment store's position index.
+        
+        Args:
+            start_date: Optional start bound (ISO format, inclusive)
+            end_date: Optional end bound (ISO format; a bare date includes the whole day)
+            cluster_id: Optional cluster filter
+            decision: Optional human_decision filter
+            category: Optional signal_category filter
+            limit: Page size
+            offset: Records to skip
+        """
+        self.refresh()
+        source = self.store if self.backend == "sqlite" else self.index
+        return source.query(start_date, end_date, cluster_id, decision, category, limit, offset)
+    
+    def page_records(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        start_date: str = None,
+        end_date: str = None,
+        cluster_id: str = None,
+        category: str = None,
+        decision: str = None,
+        user: str = None
+    ) -> Dict[str, Any]:
+        """
+        One page of audit records, newest first, served from an index
+        (position index or SQLite), so every page costs the same however
+        deep into history the cursor is. Each record carries its latest
+        human decision (latest_decision, latest_user), which the decision
+        and user filters match.
+        
+        Args:
+            cursor: next_cursor of the previous page (None: start at the newest record)
+            limit: Page size
+            start_date: Optional start bound (ISO format, inclusive)
+            end_date: Optional end bound (ISO format; a bare date includes the whole day)
+            cluster_id: Optional cluster filter
+            category: Optional signal_category filter
+            decision: Optional latest decision filter
+            user: Optional filter on the latest decision's user
+        
+        Returns:
+            {"records": [...], "next_cursor": cursor for the next page, or None at the oldest}
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        before = decode_cursor(cursor) if cursor else None
+        self.refresh()
+        source = self.store if self.backend == "sqlite" else self.index
+        records, key = source.page(
+            limit, before, start_date, end_date,
+            cluster_id=cluster_id, decision=decision, category=category, user=user
+        )
+        return {"records": records, "next_cursor": encode_cursor(key) if key else None}
     
     def get_recent_records(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -315,50 +765,35 @@ class AuditLogger:
         Returns:
             List of record dictionaries
         """
-        try:
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                records = json.load(f)
-            return records[-limit:]
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+        self.refresh()
+        if self.backend == "sqlite":
+            return self.store.tail(limit)
+        # The segment store also holds decision updates; the index skips them
+        records, _ = self.index.page(limit)
+        return records[::-1]
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get audit log statistics."""
-        records = self.get_recent_records(1000)
+    def get_stats(self, days: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Exact audit statistics from the incremental counters (O(1)).
         
-        if not records:
-            return {
-                "total_records": 0,
-                "decisions": {},
-                "categories": {}
-            }
-        
-        decisions = {}
-        categories = {}
-        
-        for r in records:
-            dec = r.get('human_decision', 'UNKNOWN')
-            decisions[dec] = decisions.get(dec, 0) + 1
-            
-            cat = r.get('signal_category', 'UNKNOWN')
-            categories[cat] = categories.get(cat, 0) + 1
-        
-        return {
-            "total_records": len(records),
-            "decisions": decisions,
-            "categories": categories,
-            "last_updated": records[-1].get('timestamp') if records else None
-        }
+        Args:
+            days: Also include a window over the last `days` days
+        """
+        self.refresh()
+        return self.counters.get(days)
 
 
 # Singleton instance
 _logger = None
+_logger_lock = threading.Lock()
 
 def get_audit_logger() -> AuditLogger:
     """Get the singleton AuditLogger instance."""
     global _logger
     if _logger is None:
-        _logger = AuditLogger()
+        with _logger_lock:
+            if _logger is None:
+                _logger = AuditLogger()
     return _logger
 
 
@@ -367,6 +802,10 @@ def log_decision(record: AuditRecord) -> str:
     """Log an audit record."""
     return get_audit_logger().log_decision(record)
 
+def log_decisions(records: List[AuditRecord]) -> List[str]:
+    """Log a batch of audit records."""
+    return get_audit_logger().log_decisions(records)
+
 def update_decision(cluster_id: str, decision: str, user: str, reason: str = None) -> bool:
     """Update a decision."""
     return get_audit_logger().update_decision(cluster_id, decision, user, reason)
@@ -415,3 +854,6 @@ if __name__ == "__main__":
     stats = logger.get_stats()
     print(f"Total records: {stats['total_records']}")
     print(f"Decisions: {stats['decisions']}")
+    
+    verification = logger.verify_chain()
+    print(f"Chain valid: {verification.valid} ({verification.records_checked} rows checked)")
@@ -0,0 +1,475 @@
+"""
+Audit SQLite - Indexed Audit Repository
+=======================================
+Optional SQLite backend for audit records (AUDIT_BACKEND=sqlite).
+
+Compared to the JSONL segment store, it adds:
+- Indexed range queries (timestamp, cluster_id, human_decision, category, user)
+- Paginated reads (limit/offset, or a keyset cursor via page())
+- Date-range iteration for CSV exports without loading the whole trail
+
+The database runs in WAL mode, so readers (API, dashboard, exports) never
+block the writer. Decision updates are stored as rows with
+record_type = 'DECISION_UPDATE', mirroring the CSV trail. Each decision
+record also carries its latest decision (latest_decision, latest_user,
+latest_at): the newest update for its cluster, or its own decision until
+one arrives. page() filters on these, so decision and user filters
+match human decisions rather than the initial PENDING.
+
+migrate_audit_logs() imports existing CSV, JSONL segment and legacy JSON
+logs; it is idempotent (records are keyed by record_id).
+
+Responsible AI Mapping:
+- Auditability: Reviewers can query any period without exporting the full trail
+- Accountability: Imports never duplicate or drop existing records
+"""
+
+import csv
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Column order matches AuditLogger.CSV_HEADERS
+COLUMNS = [
+    "record_id", "cluster_id", "timestamp",
+    "signal_count", "signal_category", "top_keywords",
+    "classification_probabilities", "risk_score", "risk_breakdown",
+    "confidence_percentage", "confidence_level",
+    "rationale_summary", "assumptions",
+    "suggested_queue", "priority",
+    "human_decision", "human_user", "decision_reason",
+    "processing_time_ms", "model_version",
+    "prev_hash", "record_hash"
+]
+
+INTEGER_COLUMNS = {"signal_count", "processing_time_ms"}
+REAL_COLUMNS = {"risk_score", "confidence_percentage"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_records (
+    record_id TEXT PRIMARY KEY,
+    cluster_id TEXT,
+    timestamp TEXT,
+    signal_count INTEGER,
+    signal_category TEXT,
+    top_keywords TEXT,
+    classification_probabilities TEXT,
+    risk_score REAL,
+    risk_breakdown TEXT,
+    confidence_percentage REAL,
+    confidence_level TEXT,
+    rationale_summary TEXT,
+    assumptions TEXT,
+    suggested_queue TEXT,
+    priority TEXT,
+    human_decision TEXT,
+    human_user TEXT,
+    decision_reason TEXT,
+    processing_time_ms INTEGER,
+    model_version TEXT,
+    prev_hash TEXT,
+    record_hash TEXT,
+    record_type TEXT NOT NULL DEFAULT 'DECISION',
+    latest_decision TEXT,
+    latest_user TEXT,
+    latest_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_records(timestamp);
+"""
+
+# Filter + time indexes: each serves a filtered, time-ordered page (cursor
+# pagination, see page()) as one index range scan. They supersede the
+# single-column indexes of earlier databases, which are dropped.
+FILTER_INDEXES = """
+DROP INDEX IF EXISTS idx_audit_cluster;
+DROP INDEX IF EXISTS idx_audit_decision;
+DROP INDEX IF EXISTS idx_audit_category;
+DROP INDEX IF EXISTS idx_audit_user_time;
+CREATE INDEX IF NOT EXISTS idx_audit_cluster_time ON audit_records(cluster_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_decision_time ON audit_records(human_decision, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_category_time ON audit_records(signal_category, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_latest_decision_time ON audit_records(latest_decision, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_latest_user_time ON audit_records(latest_user, timestamp);
+"""
+
+# Latest-decision columns (see page()), added to older databases and backfilled
+LATEST_COLUMNS = ("latest_decision", "latest_user", "latest_at")
+
+
+def apply_decision_updates(conn: sqlite3.Connection, table: str, updates: List[Dict[str, Any]]):
+    """
+    Make each update the latest decision of its cluster's earlier decision
+    records. Updates older than a record's current latest_at are ignored,
+    so they may be applied in any order, and more than once.
+    """
+    conn.executemany(
+        f"UPDATE {table} SET latest_decision = ?, latest_user = ?, latest_at = ? "
+        "WHERE cluster_id = ? AND record_type = 'DECISION' AND timestamp <= ? AND latest_at <= ?",
+        [
+            (u.get("human_decision"), u.get("human_user"), u.get("timestamp"),
+             u.get("cluster_id"), u.get("timestamp"), u.get("timestamp"))
+            for u in updates
+        ]
+    )
+
+
+def where_clause(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    cluster_id: Optional[str] = None,
+    decision: Optional[str] = None,
+    category: Optional[str] = None,
+    user: Optional[str] = None,
+    latest: bool = False
+) -> Tuple[List[str], List[Any]]:
+    """
+    SQL conditions for optional audit filters over the record columns
+    (ISO date bounds are inclusive; a bare end date includes the whole day).
+    With latest=True, decision and user match the latest decision
+    (latest_decision, latest_user) instead of the record's own.
+    
+    Returns:
+        (clauses to AND together, parameters)
+    """
+    clauses, params = [], []
+    if start_date:
+        clauses.append("timestamp >= ?")
+        params.append(start_date)
+    if end_date:
+        clauses.append("timestamp <= ?")
+        params.append(end_date if "T" in end_date else f"{end_date}T23:59:59.999999")
+    for column, value in (
+        ("cluster_id", cluster_id),
+        ("latest_decision" if latest else "human_decision", decision),
+        ("signal_category", category),
+        ("latest_user" if latest else "human_user", user)
+    ):
+        if value:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    return clauses, params
+
+
+class SQLiteAuditRepository:
+    """
+    SQLite audit repository (WAL mode).
+    Same append/tail/count/iter_records interface as AuditSegmentStore.
+    """
+    
+    # Rows fetched per round trip when iterating
+    FETCH_SIZE = 1000
+    
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._add_missing_columns()
+        self._conn.executescript(FILTER_INDEXES)
+    
+    def _add_missing_columns(self):
+        """Bring databases created before a column existed up to the current schema."""
+        existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(audit_records)")}
+        for col in COLUMNS + list(LATEST_COLUMNS):
+            if col not in existing:
+                self._conn.execute(f"ALTER TABLE audit_records ADD COLUMN {col} TEXT")
+        
+        if "latest_at" not in existing:
+            # Backfill: every record starts at its own decision, then updates apply in order
+            self._conn.execute(
+                "UPDATE audit_records SET latest_decision = human_decision, latest_user = human_user, "
+                "latest_at = COALESCE(timestamp, '') WHERE record_type = 'DECISION'"
+            )
+            updates = self._conn.execute(
+                "SELECT cluster_id, timestamp, human_decision, human_user FROM audit_records "
+                "WHERE record_type = 'DECISION_UPDATE' ORDER BY timestamp, rowid"
+            ).fetchall()
+            apply_decision_updates(self._conn, "audit_records", [dict(u) for u in updates])
+        self._conn.commit()
+    
+    def _row_values(self, record: Dict[str, Any], record_type: str) -> tuple:
+        """Coerce a record dict (typed or all-string CSV row) to column values."""
+        values = []
+        for col in COLUMNS:
+            value = record.get(col)
+            if value is None or value == "":
+                value = None
+            elif col in INTEGER_COLUMNS:
+                value = int(float(value))
+            elif col in REAL_COLUMNS:
+                value = float(value)
+            elif isinstance(value, (list, dict)):
+                value = json.dumps(value)
+            else:
+                value = str(value)
+            values.append(value)
+        values.append(record_type)
+        # A decision record is its own latest decision until an update arrives
+        own = record_type == "DECISION"
+        values.extend((
+            values[COLUMNS.index("human_decision")] if own else None,
+            values[COLUMNS.index("human_user")] if own else None,
+            (values[COLUMNS.index("timestamp")] or "") if own else None
+        ))
+        return tuple(values)
+    
+    def _record_type(self, record: Dict[str, Any]) -> str:
+        """CSV update rows carry a decision but no category."""
+        if record.get("update_type") == "DECISION_UPDATE":
+            return "DECISION_UPDATE"
+        if not record.get("signal_category") and record.get("human_decision"):
+            return "DECISION_UPDATE"
+        return "DECISION"
+    
+    def append(self, records: List[Dict[str, Any]], fsync: bool = False) -> int:
+        """
+        Insert records in one transaction. Existing record IDs are skipped.
+        
+        Args:
+            records: Record dicts (typed, or all-string CSV rows)
+            fsync: Commit with synchronous=FULL (durable against power loss)
+        
+        Returns:
+            Number of rows inserted
+        """
+        if not records:
+            return 0
+        
+        columns = COLUMNS + ["record_type"] + list(LATEST_COLUMNS)
+        placeholders = ", ".join("?" for _ in columns)
+        sql = f"INSERT OR IGNORE INTO audit_records ({', '.join(columns)}) VALUES ({placeholders})"
+        types = [self._record_type(r) for r in records]
+        rows = [self._row_values(r, t) for r, t in zip(records, types)]
+        updates = [
+            dict(zip(COLUMNS, row)) for row, record_type in zip(rows, types)
+            if record_type == "DECISION_UPDATE"
+        ]
+        
+        with self._lock:
+            if fsync:
+                self._conn.execute("PRAGMA synchronous=FULL")
+            try:
+                with self._conn:
+                    before = self._conn.total_changes
+                    self._conn.executemany(sql, rows)
+                    inserted = self._conn.total_changes - before
+                    apply_decision_updates(self._conn, "audit_records", updates)
+                    return inserted
+            finally:
+                if fsync:
+                    self._conn.execute("PRAGMA synchronous=NORMAL")
+    
+    def refresh(self):
+        """No-op: SQLite already sees other processes' committed writes."""
+    
+    def sync(self):
+        """Sync committed WAL frames to stable storage (passive checkpoint)."""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+    
+    def _to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Row to record dict (same shape as AuditRecord.to_dict)."""
+        return {col: row[col] for col in COLUMNS}
+    
+    def _where(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        cluster_id: Optional[str] = None,
+        decision: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause from optional filters (ISO date bounds are inclusive)."""
+        clauses, params = where_clause(start_date, end_date, cluster_id, decision, category)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+    
+    def query(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        cluster_id: Optional[str] = None,
+        decision: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Filtered, paginated decision records, oldest first."""
+        where, params = self._where(start_date, end_date, cluster_id, decision, category)
+        where = f"{where} AND record_type = 'DECISION'" if where else " WHERE record_type = 'DECISION'"
+        sql = f"SELECT * FROM audit_records{where} ORDER BY timestamp, record_id LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit, offset]).fetchall()
+        return [self._to_dict(r) for r in rows]
+    
+    def iter_range(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        cluster_id: Optional[str] = None,
+        decision: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate filtered records (date range etc.), oldest first, in FETCH_SIZE pages."""
+        where, params = self._where(start_date, end_date, cluster_id, decision, category)
+        last = ("", "")
+        while True:
+            keyset = "(timestamp, record_id) > (?, ?)"
+            clause = f"{where} AND {keyset}" if where else f" WHERE {keyset}"
+            sql = f"SELECT * FROM audit_records{clause} ORDER BY timestamp, record_id LIMIT ?"
+            with self._lock:
+                rows = self._conn.execute(sql, params + list(last) + [self.FETCH_SIZE]).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._to_dict(row)
+            last = (rows[-1]["timestamp"] or "", rows[-1]["record_id"])
+    
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Iterate every record, oldest first."""
+        return self.iter_range()
+    
+    def page(
+        self,
+        limit: int = 50,
+        before: Optional[Tuple[str, int]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        cluster_id: Optional[str] = None,
+        decision: Optional[str] = None,
+        category: Optional[str] = None,
+        user: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """
+        One page of decision records, newest first, keyed by (timestamp, rowid).
+        Each page is an index range scan starting at the key, so its cost does
+        not depend on how far back the key is. decision and user match the
+        latest decision; records carry it as latest_decision/latest_user.
+        
+        Args:
+            limit: Page size
+            before: Key of the previous page's last record (None: start at the newest)
+        
+        Returns:
+            (records, key of the last record if there are more, else None)
+        """
+        clauses, params = where_clause(start_date, end_date, cluster_id, decision, category, user, latest=True)
+        clauses.append("record_type = 'DECISION'")
+        if before is not None:
+            clauses.append("(timestamp, rowid) < (?, ?)")
+            params.extend(before)
+        sql = (
+            f"SELECT rowid AS position, * FROM audit_records WHERE {' AND '.join(clauses)} "
+            "ORDER BY timestamp DESC, rowid DESC LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit + 1]).fetchall()
+        
+        records = [
+            dict(self._to_dict(r), latest_decision=r["latest_decision"], latest_user=r["latest_user"])
+            for r in rows[:limit]
+        ]
+        if len(rows) <= limit:
+            return records, None
+        return records, (rows[limit - 1]["timestamp"], rows[limit - 1]["position"])
+    
+    def tail(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent decision records, oldest first."""
+        sql = (
+            "SELECT * FROM audit_records WHERE record_type = 'DECISION' "
+            "ORDER BY timestamp DESC, record_id DESC LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, (limit,)).fetchall()
+        return [self._to_dict(r) for r in reversed(rows)]
+    
+    def count(self) -> int:
+        """Total rows (decisions + decision updates)."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM audit_records").fetchone()[0]
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def migrate_audit_logs(data_dir: str = "data", db_path: Optional[str] = None) -> Dict[str, int]:
+    """
+    Import existing audit logs into the SQLite repository.
+    
+    Sources, in order: audit_trail_full.csv, audit_segments/*.jsonl,
+    audit_log.json (or its .migrated copy). Records already present are skipped,
+    so the migration can be re-run safely.
+    
+    Returns:
+        Rows inserted per source
+    """
+    from audit_store import AuditSegmentStore
+    
+    data_dir = Path(data_dir)
+    repo = SQLiteAuditRepository(db_path or data_dir / "audit.db")
+    inserted = {"csv": 0, "segments": 0, "legacy_json": 0}
+    
+    csv_path = data_dir / "audit_trail_full.csv"
+    if csv_path.exists():
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            batch = []
+            for row in csv.DictReader(f):
+                batch.append(row)
+                if len(batch) >= repo.FETCH_SIZE:
+                    inserted["csv"] += repo.append(batch)
+                    batch = []
+            inserted["csv"] += repo.append(batch)
+    
+    segment_dir = data_dir / "audit_segments"
+    if segment_dir.exists():
+        batch = []
+        for record in AuditSegmentStore(segment_dir).iter_records():
+            batch.append(record)
+            if len(batch) >= repo.FETCH_SIZE:
+                inserted["segments"] += repo.append(batch)
+                batch = []
+        inserted["segments"] += repo.append(batch)
+    
+    for name in ("audit_log.json", "audit_log.json.migrated"):
+        legacy_path = data_dir / name
+        if legacy_path.exists():
+            try:
+                with open(legacy_path, 'r', encoding='utf-8') as f:
+                    inserted["legacy_json"] += repo.append(json.load(f))
+            except json.JSONDecodeError:
+                pass
+    
+    repo.close()
+    return inserted
+
+
+if __name__ == "__main__":
+    # Demo
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = SQLiteAuditRepository(f"{tmp}/audit.db")
+        repo.append([
+            {
+                "record_id": f"AUD-2026013{day}-{i}",
+                "cluster_id": f"SVC-0{i}",
+                "timestamp": f"2026-01-3{day}T10:0{i}:00",
+                "signal_category": "SERVICE" if i % 2 else "FRAUD",
+                "risk_score": 5.0 + i,
+                "human_decision": "PENDING" if i else "APPROVED"
+            }
+            for day in (0, 1) for i in range(4)
+        ])
+        repo.append([{"record_id": "AUD-upd", "cluster_id": "SVC-01", "timestamp": "2026-01-31T11:00:00",
+                      "human_decision": "APPROVED", "update_type": "DECISION_UPDATE"}])
+        
+        print(f"Rows: {repo.count()}")
+        print(f"Jan 31, page 2: {[r['record_id'] for r in repo.query(start_date='2026-01-31', limit=2, offset=2)]}")
+        print(f"Approved: {[r['record_id'] for r in repo.page(decision='APPROVED')[0]]}")
@@ -0,0 +1,207 @@
+"""
+Audit Stats - Incremental Audit Counters
+========================================
+Exact all-time and per-day counters over the audit trail, maintained as
+records are written (see trail_view.py), so /audit/stats is O(1) however
+long the log grows.
+
+Counted per decision record:
+- total records
+- latest decision, signal_category and suggested_queue
+- the same, bucketed by the record's day (the last MAX_DAYS days are kept)
+
+A DECISION_UPDATE row moves every earlier record of its cluster from the
+previous decision to the new one, so the decision counts always reflect
+the latest decision per record. Update rows themselves are counted
+separately (decision_updates).
+
+Windowed stats ("last N days") sum at most N day buckets.
+
+Responsible AI Mapping:
+- Auditability: Exact decision totals over the whole trail
+- Transparency: Category and queue mix over time
+"""
+
+import copy
+import csv
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from trail_view import TrailView, is_decision_update
+
+
+def _empty_bucket() -> Dict[str, Any]:
+    return {"records": 0, "decision_updates": 0, "decisions": {}, "categories": {}, "queues": {}}
+
+
+def _add_bucket(total: Dict[str, Any], bucket: Dict[str, Any]):
+    """Add one bucket's counts into another."""
+    total["records"] += bucket["records"]
+    total["decision_updates"] += bucket["decision_updates"]
+    for key in ("decisions", "categories", "queues"):
+        for name, count in bucket[key].items():
+            total[key][name] = total[key].get(name, 0) + count
+
+
+class AuditStats(TrailView):
+    """
+    All-time and per-day audit counters with a persisted snapshot.
+    """
+    
+    # Day buckets kept for windowed stats
+    MAX_DAYS = 366
+    
+    COLUMNS = ("record_id", "cluster_id", "timestamp", "signal_category", "suggested_queue", "human_decision")
+    
+    # v2 adds the per-cluster decision map
+    SNAPSHOT_VERSION = 2
+    
+    def __init__(self, csv_path: str, snapshot_path: str):
+        """
+        Args:
+            csv_path: Audit CSV trail the counters fold
+            snapshot_path: Persisted snapshot (JSON)
+        """
+        self._total = _empty_bucket()
+        self._days: Dict[str, Dict[str, Any]] = {}
+        # cluster_id -> record day -> current decision -> records
+        self._clusters: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._last_updated: Optional[str] = None
+        super().__init__(csv_path, snapshot_path)
+    
+    def _fold(self, row: Dict[str, str]):
+        """Count one trail row in the all-time and day buckets."""
+        timestamp = row.get("timestamp") or ""
+        day = timestamp[:10]
+        buckets = [self._total]
+        if day:
+            if day not in self._days:
+                self._days[day] = _empty_bucket()
+                if len(self._days) > self.MAX_DAYS:
+                    del self._days[min(self._days)]
+            if day in self._days:
+                buckets.append(self._days[day])
+        
+        if is_decision_update(row):
+            for bucket in buckets:
+                bucket["decision_updates"] += 1
+            self._move_decisions(row.get("cluster_id"), row.get("human_decision") or "UNKNOWN")
+            return
+        
+        decision = row.get("human_decision") or "UNKNOWN"
+        category = row.get("signal_category") or "UNKNOWN"
+        queue = row.get("suggested_queue") or "UNKNOWN"
+        for bucket in buckets:
+            bucket["records"] += 1
+            bucket["decisions"][decision] = bucket["decisions"].get(decision, 0) + 1
+            bucket["categories"][category] = bucket["categories"].get(category, 0) + 1
+            bucket["queues"][queue] = bucket["queues"].get(queue, 0) + 1
+        cluster_id = row.get("cluster_id")
+        if cluster_id:
+            decisions = self._clusters.setdefault(cluster_id, {}).setdefault(day, {})
+            decisions[decision] = decisions.get(decision, 0) + 1
+        if timestamp and (self._last_updated is None or timestamp > self._last_updated):
+            self._last_updated = timestamp
+    
+    def _move_decisions(self, cluster_id: Optional[str], decision: str):
+        """Move the cluster's records logged so far to a new decision."""
+        for day, decisions in self._clusters.get(cluster_id, {}).items():
+            buckets = [self._total]
+            if day in self._days:
+                buckets.append(self._days[day])
+            for bucket in buckets:
+                for previous, count in decisions.items():
+                    remaining = bucket["decisions"].get(previous, 0) - count
+                    if remaining > 0:
+                        bucket["decisions"][previous] = remaining
+                    else:
+                        bucket["decisions"].pop(previous, None)
+                bucket["decisions"][decision] = bucket["decisions"].get(decision, 0) + sum(decisions.values())
+            self._clusters[cluster_id][day] = {decision: sum(decisions.values())}
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        return {
+            "total": self._total,
+            "days": self._days,
+            "clusters": self._clusters,
+            "last_updated": self._last_updated
+        }
+    
+    def _restore(self, snapshot: Dict[str, Any]):
+        self._total = snapshot.get("total", _empty_bucket())
+        self._days = snapshot.get("days", {})
+        self._clusters = snapshot.get("clusters", {})
+        self._last_updated = snapshot.get("last_updated")
+    
+    def get(self, days: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Exact counters.
+        
+        Args:
+            days: Also return a window over the last `days` days (including today)
+        
+        Returns:
+            total_records, decisions, categories, queues, decision_updates,
+            last_updated, plus "window" when days is given
+        """
+        with self._lock:
+            total = _empty_bucket()
+            _add_bucket(total, self._total)
+            last_updated = self._last_updated
+            
+            window = None
+            if days:
+                since = (datetime.now() - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+                window = _empty_bucket()
+                for day, bucket in self._days.items():
+                    if day >= since:
+                        _add_bucket(window, bucket)
+        
+        stats = {
+            "total_records": total["records"],
+            "decisions": total["decisions"],
+            "categories": total["categories"],
+            "queues": total["queues"],
+            "decision_updates": total["decision_updates"],
+            "last_updated": last_updated
+        }
+        if window is not None:
+            stats["window"] = {
+                "days": days,
+                "since": since,
+                "total_records": window["records"],
+                "decisions": window["decisions"],
+                "categories": window["categories"],
+                "queues": window["queues"],
+                "decision_updates": window["decision_updates"]
+            }
+        return stats
+    
+    def daily(self) -> Dict[str, Dict[str, Any]]:
+        """Per-day counters, oldest day first."""
+        with self._lock:
+            return {day: copy.deepcopy(self._days[day]) for day in sorted(self._days)}
+
+
+if __name__ == "__main__":
+    # Demo
+    import tempfile
+    
+    headers = ["record_id", "cluster_id", "timestamp", "signal_category", "suggested_queue", "human_decision"]
+    today = datetime.now().strftime("%Y-%m-%d")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "audit.csv")
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            writer.writeheader()
+            writer.writerows([
+                {"record_id": "AUD-1", "cluster_id": "FRD-01", "timestamp": "2026-01-30T10:00:00", "signal_category": "FRAUD", "suggested_queue": "FRAUD_OPS", "human_decision": "PENDING"},
+                {"record_id": "AUD-2", "cluster_id": "SVC-01", "timestamp": f"{today}T09:00:00", "signal_category": "SERVICE", "suggested_queue": "IT_OPS", "human_decision": "PENDING"},
+                {"record_id": "AUD-3", "cluster_id": "FRD-01", "timestamp": f"{today}T09:05:00", "signal_category": "", "suggested_queue": "", "human_decision": "APPROVED"},
+            ])
+        
+        stats = AuditStats(csv_path, os.path.join(tmp, "audit_stats.json"))
+        print(f"All-time: {stats.get()}")
+        print(f"Last 7 days: {stats.get(days=7)['window']}")
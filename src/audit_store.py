@@ -0,0 +1,319 @@
+"""
+Audit Store - Append-Only JSONL Segments
+========================================
+Durable storage for audit records, replacing the rewrite-per-write
+audit_log.json.
+
+Layout (under data/audit_segments/):
+- segment-000001.jsonl, segment-000002.jsonl, ...: one JSON record per line
+- index.json: small sidecar index of segments (record counts, first/last IDs)
+
+Writes only ever append to the active segment. When the active segment
+reaches SEGMENT_MAX_BYTES it is closed and a new one is started. Recent
+records are served by seeking backwards from the end of the active
+segment, so reads cost O(limit), not O(history).
+
+A crash mid-append can leave at most one partial line at the end of the
+active segment; it is trimmed when the store is next opened.
+
+Responsible AI Mapping:
+- Auditability: Records are never rewritten, only appended
+- Reliability: A crash cannot corrupt records that were already written
+"""
+
+import io
+import json
+import os
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class SegmentInfo:
+    """Index entry for one segment file."""
+    name: str
+    records: int = 0
+    size_bytes: int = 0
+    first_record_id: Optional[str] = None
+    last_record_id: Optional[str] = None
+    closed: bool = False
+
+
+class BoundedReader(io.RawIOBase):
+    """
+    Raw reader exposing at most `limit` bytes of an open binary file.
+    Lets readers stop at a size captured under a lock while appends continue.
+    """
+    
+    def __init__(self, f, limit: int):
+        self._f = f
+        self._remaining = max(0, limit)
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        data = self._f.read(min(len(buffer), self._remaining))
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+    
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+class AuditSegmentStore:
+    """
+    Append-only JSONL segment store with size-based rotation.
+    Thread-safe. Several processes may append if each holds a shared file
+    lock and calls refresh() first (AuditLogger does both).
+    """
+    
+    # Segment size that triggers rotation
+    SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+    
+    # Block size for backwards tail reads
+    TAIL_BLOCK_BYTES = 64 * 1024
+    
+    INDEX_FILE = "index.json"
+    SEGMENT_PATTERN = "segment-{:06d}.jsonl"
+    
+    def __init__(self, directory: str, segment_max_bytes: int = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes or self.SEGMENT_MAX_BYTES
+        self.index_path = self.directory / self.INDEX_FILE
+        self._lock = threading.RLock()
+        self._segments: List[SegmentInfo] = self._load_index()
+        self._recover_active()
+    
+    def _load_index(self) -> List[SegmentInfo]:
+        """Load the sidecar index, rebuilding it from the segment files if needed."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                segments = [SegmentInfo(**s) for s in json.load(f)["segments"]]
+            if all((self.directory / s.name).exists() for s in segments):
+                return segments
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+            pass
+        return self._rebuild_index()
+    
+    def _rebuild_index(self) -> List[SegmentInfo]:
+        """Scan segment files to rebuild the index."""
+        segments = []
+        for path in sorted(self.directory.glob("segment-*.jsonl")):
+            info = SegmentInfo(name=path.name, closed=True)
+            for record in self._read_segment(path):
+                info.records += 1
+                info.first_record_id = info.first_record_id or record.get("record_id")
+                info.last_record_id = record.get("record_id")
+            info.size_bytes = path.stat().st_size
+            segments.append(info)
+        if segments:
+            segments[-1].closed = False
+        return segments
+    
+    def _save_index(self):
+        """Write the sidecar index atomically (caller holds the lock)."""
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"segments": [asdict(s) for s in self._segments]}, f)
+        os.replace(tmp_path, self.index_path)
+    
+    def _recover_active(self):
+        """Trim a partial trailing line and refresh the active segment's entry."""
+        if not self._segments:
+            self._segments.append(SegmentInfo(name=self.SEGMENT_PATTERN.format(1)))
+            (self.directory / self._segments[-1].name).touch()
+            self._save_index()
+            return
+        
+        active = self._segments[-1]
+        path = self.directory / active.name
+        size = path.stat().st_size
+        if size:
+            with open(path, 'rb+') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # Crash mid-append: drop the incomplete record
+                    f.seek(0)
+                    data = f.read()
+                    f.truncate(data.rfind(b"\n") + 1)
+        
+        # The active entry is only persisted on rotation; recount it
+        active.records = 0
+        active.first_record_id = active.last_record_id = None
+        for record in self._read_segment(path):
+            active.records += 1
+            active.first_record_id = active.first_record_id or record.get("record_id")
+            active.last_record_id = record.get("record_id")
+        active.size_bytes = path.stat().st_size
+        self._save_index()
+    
+    def append(self, records: List[Dict[str, Any]], fsync: bool = False):
+        """
+        Append records to the active segment (one write per batch).
+        
+        Args:
+            records: Record dicts, in order
+            fsync: Force the write to stable storage before returning
+        """
+        if not records:
+            return
+        
+        payload = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records).encode("utf-8")
+        
+        with self._lock:
+            active = self._segments[-1]
+            if active.size_bytes and active.size_bytes + len(payload) > self.segment_max_bytes:
+                active = self._rotate()
+            
+            with open(self.directory / active.name, 'ab') as f:
+                f.write(payload)
+                f.flush()
+                if fsync:
+                    os.fsync(f.fileno())
+            
+            active.records += len(records)
+            active.size_bytes += len(payload)
+            active.first_record_id = active.first_record_id or records[0].get("record_id")
+            active.last_record_id = records[-1].get("record_id")
+    
+    def refresh(self):
+        """
+        Pick up appends and rotations made by another process sharing the
+        directory (caller holds the inter-process lock).
+        """
+        with self._lock:
+            if (self.directory / self.SEGMENT_PATTERN.format(len(self._segments) + 1)).exists():
+                self._segments = self._load_index()
+                self._recover_active()
+                return
+            
+            active = self._segments[-1]
+            path = self.directory / active.name
+            size = path.stat().st_size
+            if size == active.size_bytes:
+                return
+            
+            # Count only the bytes appended since our last write
+            with open(path, 'rb') as f:
+                f.seek(active.size_bytes)
+                lines = f.read(size - active.size_bytes).split(b"\n")[:-1]
+            if lines:
+                active.records += len(lines)
+                active.last_record_id = json.loads(lines[-1]).get("record_id")
+                active.first_record_id = active.first_record_id or json.loads(lines[0]).get("record_id")
+            active.size_bytes = size
+    
+    def sync(self):
+        """Force earlier appends to the active segment to stable storage."""
+        with self._lock, open(self.directory / self._segments[-1].name, 'ab') as f:
+            os.fsync(f.fileno())
+    
+    def _rotate(self) -> SegmentInfo:
+        """Close the active segment and start a new one (caller holds the lock)."""
+        self._segments[-1].closed = True
+        info = SegmentInfo(name=self.SEGMENT_PATTERN.format(len(self._segments) + 1))
+        (self.directory / info.name).touch()
+        self._segments.append(info)
+        self._save_index()
+        return info
+    
+    def _read_segment(self, path: Path) -> Iterator[Dict[str, Any]]:
+        """Iterate the complete records of a segment file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+    
+    def _tail_segment(self, path: Path, limit: int) -> List[Dict[str, Any]]:
+        """Last `limit` records of one segment, read backwards in blocks."""
+        with open(path, 'rb') as f:
+            end = f.seek(0, os.SEEK_END)
+            pos = end
+            data = b""
+            while pos > 0 and data.count(b"\n") <= limit:
+                step = min(self.TAIL_BLOCK_BYTES, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        
+        lines = data.split(b"\n")
+        if pos > 0:
+            lines = lines[1:]  # First line may be cut mid-record
+        
+        records = []
+        for line in lines[-(limit + 1):]:
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return records[-limit:]
+    
+    def tail(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent records, oldest first."""
+        if limit <= 0:
+            return []
+        
+        with self._lock:
+            segments = list(self._segments)
+        
+        records: List[Dict[str, Any]] = []
+        for info in reversed(segments):
+            needed = limit - len(records)
+            if needed <= 0:
+                break
+            records = self._tail_segment(self.directory / info.name, needed) + records
+        return records
+    
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Iterate every stored record, oldest first."""
+        with self._lock:
+            segments = list(self._segments)
+        for info in segments:
+            yield from self._read_segment(self.directory / info.name)
+    
+    def count(self) -> int:
+        """Total records across all segments."""
+        with self._lock:
+            return sum(s.records for s in self._segments)
+    
+    def segments(self) -> List[Dict[str, Any]]:
+        """Index entries, for diagnostics."""
+        with self._lock:
+            return [asdict(s) for s in self._segments]
+
+
+if __name__ == "__main__":
+    # Demo
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AuditSegmentStore(tmp, segment_max_bytes=2048)
+        for batch in range(10):
+            store.append([
+                {"record_id": f"AUD-{batch:02d}-{i}", "cluster_id": f"SVC-{batch:02d}", "human_decision": "PENDING"}
+                for i in range(5)
+            ])
+        
+        print(f"Records: {store.count()}")
+        print(f"Segments: {[(s['name'], s['records']) for s in store.segments()]}")
+        print(f"Tail: {[r['record_id'] for r in store.tail(7)]}")
+        
+        # Simulate a crash mid-append, then reopen
+        with open(os.path.join(tmp, store.segments()[-1]["name"]), 'a') as f:
+            f.write('{"record_id": "AUD-partial"')
+        reopened = AuditSegmentStore(tmp, segment_max_bytes=2048)
+        print(f"After crash recovery: {reopened.count()} records, last {reopened.tail(1)[0]['record_id']}")
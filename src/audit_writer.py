@@ -0,0 +1,456 @@
+"""
+Audit Writer - Group-Commit Background Writer
+=============================================
+Takes audit writes off the request path.
+
+Producers enqueue records and return immediately. A dedicated thread
+drains the queue and writes everything queued so far as one group commit
+(one CSV append + one record-store append).
+
+Durability (fsync) policy:
+- "batch": fsync every group commit
+- "interval": fsync at most every FSYNC_INTERVAL_MS (default)
+- "os": never fsync explicitly; the OS flushes dirty pages
+
+Callers that need durability pass wait=True: they block until their
+records are committed *and* synced (their commit is fsynced regardless
+of policy). Everyone else only pays for the enqueue.
+
+Failed commits are never dropped:
+- A failed group commit is retried with exponential backoff. Records that
+  reached the CSV trail but not the record store (segment store + index, or
+  SQLite) are appended to the store alone, so no sink gets a record twice
+- If it still fails, waiting callers get the error and the other records
+  are kept ("stranded") and retried ahead of the next commit, or every
+  RETRY_MAX_BACKOFF_SECONDS, so the trail keeps submission order
+- While records are stranded, submit() and flush() raise AuditWriteError,
+  so producers see the failure instead of silently losing audit records
+
+Queue depth and commit latency are exposed via status() and as
+"audit_commit" spans in the stage histogram (/pipeline/metrics).
+
+Responsible AI Mapping:
+- Auditability: Every record is still written, in submission order
+- Reliability: Shutdown drains and syncs the queue; callers can demand durability
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from pipeline_metrics import StageTimer, get_stage_histogram
+
+
+class AuditWriteError(RuntimeError):
+    """Audit records could not be written (they are kept and retried)."""
+
+
+@dataclass
+class _PendingWrite:
+    """Records from one submit() call."""
+    records: List[Any]  # List[AuditRecord]
+    durable: bool = False
+    done: threading.Event = field(default_factory=threading.Event)
+    error: Optional[str] = None
+
+
+class AuditWriter:
+    """
+    Single background thread batching audit writes into group commits.
+    """
+    
+    FSYNC_POLICIES = ("batch", "interval", "os")
+    
+    # Default durability policy and interval
+    FSYNC_POLICY = "interval"
+    FSYNC_INTERVAL_MS = 100
+    
+    # Maximum records per group commit
+    MAX_BATCH_RECORDS = 1000
+    
+    # Seconds to wait for the queue to drain at interpreter exit
+    EXIT_DRAIN_SECONDS = 10.0
+    
+    # Retries of a failed group commit, with exponential backoff
+    RETRY_ATTEMPTS = 4
+    RETRY_BACKOFF_SECONDS = 0.05
+    RETRY_MAX_BACKOFF_SECONDS = 2.0
+    
+    def __init__(
+        self,
+        audit_logger: Any,
+        fsync_policy: Optional[str] = None,
+        fsync_interval_ms: Optional[float] = None,
+        max_batch_records: Optional[int] = None
+    ):
+        """
+        Args:
+            audit_logger: AuditLogger doing the actual writes
+            fsync_policy: "batch", "interval" or "os"
+            fsync_interval_ms: Sync interval for the "interval" policy
+            max_batch_records: Maximum records per group commit
+        """
+        self.audit_logger = audit_logger
+        self.fsync_policy = fsync_policy or self.FSYNC_POLICY
+        if self.fsync_policy not in self.FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {self.fsync_policy} (expected one of {self.FSYNC_POLICIES})")
+        self.fsync_interval_ms = self.FSYNC_INTERVAL_MS if fsync_interval_ms is None else fsync_interval_ms
+        self.max_batch_records = max_batch_records or self.MAX_BATCH_RECORDS
+        self.stage_histogram = get_stage_histogram()
+        
+        self._queue: "queue.Queue[Optional[_PendingWrite]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._queued_records = 0
+        self._unsynced = False
+        self._last_sync = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        
+        # Records whose commit failed after all retries, oldest first
+        self._stranded: List[Any] = []
+        # Records in the CSV trail that the record store still lacks
+        self._unstored: List[Any] = []
+        self._next_stranded_retry = 0.0
+        
+        # Metrics
+        self._commits = 0
+        self._records_committed = 0
+        self._syncs = 0
+        self._failed = 0
+        self._retries = 0
+        self._max_queue_depth = 0
+        self._last_commit_ms = 0.0
+        self._last_error: Optional[str] = None
+    
+    def submit(self, records: List[Any], wait: bool = False, timeout: Optional[float] = None) -> List[str]:
+        """
+        Queue audit records for the next group commit.
+        
+        Args:
+            records: AuditRecords, in order
+            wait: Block until the records are committed and fsynced
+            timeout: Maximum seconds to wait (with wait=True)
+        
+        Returns:
+            Record IDs, in order
+        
+        Raises:
+            RuntimeError: If the writer is closed
+            AuditWriteError: If earlier records are still unwritten after
+                retries (nothing is queued), or a waited-for commit failed
+            TimeoutError: If wait=True and the commit did not finish in time
+        """
+        if not records:
+            return []
+        
+        pending = _PendingWrite(records=list(records), durable=wait)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Audit writer is closed")
+            self._raise_if_stranded()
+            self._queued_records += len(records)
+            self._max_queue_depth = max(self._max_queue_depth, self._queued_records)
+            self._ensure_worker()
+        self._queue.put(pending)
+        
+        if wait:
+            if not pending.done.wait(timeout):
+                raise TimeoutError("Audit commit did not complete in time")
+            if pending.error:
+                raise AuditWriteError(f"Audit commit failed: {pending.error}")
+        
+        return [r.record_id for r in records]
+    
+    def _raise_if_stranded(self):
+        """Surface a commit failure that retries have not fixed yet (caller holds the lock)."""
+        if self._stranded or self._unstored:
+            raise AuditWriteError(
+                f"{len(self._stranded) + len(self._unstored)} audit records are not yet written "
+                f"(retrying): {self._last_error}"
+            )
+    
+    def _ensure_worker(self):
+        """Start the writer thread on first use (caller holds the lock)."""
+        if self._thread is None:
+            atexit.register(self.close, self.EXIT_DRAIN_SECONDS)
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+    
+    def _sync_timeout(self) -> Optional[float]:
+        """Seconds until an interval sync is due (None if nothing to sync)."""
+        if self.fsync_policy != "interval" or not self._unsynced:
+            return None
+        due = self._last_sync + self.fsync_interval_ms / 1000
+        return max(0.0, due - time.monotonic())
+    
+    def _next_timeout(self) -> Optional[float]:
+        """Seconds until an interval sync or a stranded-records retry is due."""
+        timeouts = [t for t in (self._sync_timeout(), self._stranded_timeout()) if t is not None]
+        return min(timeouts) if timeouts else None
+    
+    def _stranded_timeout(self) -> Optional[float]:
+        with self._lock:
+            if not self._stranded and not self._unstored:
+                return None
+        return max(0.0, self._next_stranded_retry - time.monotonic())
+    
+    def _run(self):
+        """Writer loop: drain the queue into group commits."""
+        while True:
+            try:
+                first = self._queue.get(timeout=self._next_timeout())
+            except queue.Empty:
+                if self._stranded_timeout() == 0.0:
+                    self._commit([])
+                self._sync()
+                continue
+            
+            if first is None:
+                self._commit([])
+                self._sync()
+                return
+            
+            # Group everything already queued (up to the batch limit)
+            batch = [first]
+            count = len(first.records)
+            stop = False
+            while count < self.max_batch_records:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                count += len(item.records)
+            
+            self._commit(batch)
+            if stop:
+                self._sync()
+                return
+    
+    def _write(
+        self, 
+        records: List[Any], 
+        unstored: List[Any], 
+        durable: bool, 
+        attempts: int
+    ) -> Tuple[Optional[str], List[Any], List[Any]]:
+        """
+        log_decisions() with retries and exponential backoff. A failed
+        attempt can leave records in the CSV trail only: before each retry
+        they move to `unstored` and are appended to the record store alone
+        (store_records() skips any the store already holds).
+        
+        Returns:
+            (last error or None, records still unwritten, records still missing from the store)
+        """
+        delay = self.RETRY_BACKOFF_SECONDS
+        error = None
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(delay)
+                delay = min(delay * 2, self.RETRY_MAX_BACKOFF_SECONDS)
+                with self._lock:
+                    self._retries += 1
+            try:
+                offset = self.audit_logger.csv_offset()
+            except Exception:
+                offset = None
+            try:
+                if unstored:
+                    self.audit_logger.store_records(unstored, fsync=durable)
+                    unstored = []
+                self.audit_logger.log_decisions(records, fsync=durable)
+                return None, [], []
+            except Exception as e:
+                error = str(e)
+            if offset is not None and records:
+                try:
+                    landed = set(self.audit_logger.record_ids_since(offset))
+                except Exception:
+                    landed = set()
+                unstored = unstored + [r for r in records if r.record_id in landed]
+                records = [r for r in records if r.record_id not in landed]
+        return error, records, unstored
+    
+    def _commit(self, batch: List[_PendingWrite]):
+        """
+        Write one group commit (stranded records first) and release its waiters.
+        An empty batch retries only the stranded records.
+        """
+        with self._lock:
+            stranded, self._stranded = self._stranded, []
+            unstored, self._unstored = self._unstored, []
+        if not batch and not stranded and not unstored:
+            return
+        records = stranded + [r for item in batch for r in item.records]
+        durable = self.fsync_policy == "batch" or any(item.durable for item in batch)
+        
+        with StageTimer("audit_commit", items_in=len(records)) as timer:
+            # A retry of stranded records alone is one attempt; the timer paces those
+            error, unwritten, unstored = self._write(
+                records, unstored, durable, 1 if not batch else self.RETRY_ATTEMPTS + 1
+            )
+            incomplete = {r.record_id for r in unwritten + unstored} & {r.record_id for r in records}
+            timer.items_out = len(records) - len(incomplete)
+        self.stage_histogram.record([timer.span])
+        
+        if error is None:
+            if durable:
+                self._last_sync = time.monotonic()
+                self._unsynced = False
+            else:
+                self._unsynced = True
+                if self.fsync_policy == "interval" and self._sync_timeout() == 0.0:
+                    self._sync()
+        
+        # Waiters get the error and own their unwritten records; the rest stay queued for retry.
+        # Records already in the CSV trail always stay, to be completed in the record store.
+        unwritten_ids = {r.record_id for r in unwritten + unstored}
+        waiter_ids = {r.record_id for item in batch if item.durable for r in item.records}
+        keep = [r for r in unwritten if r.record_id not in waiter_ids]
+        
+        with self._lock:
+            self._queued_records -= sum(len(item.records) for item in batch)
+            self._last_commit_ms = timer.span.wall_ms
+            if error is None:
+                self._commits += 1
+                self._records_committed += len(records)
+                self._syncs += int(durable)
+            else:
+                self._records_committed += len(records) - len(incomplete)
+                self._failed += len(unwritten_ids & waiter_ids)
+                self._last_error = error
+                self._stranded = keep + self._stranded
+                self._unstored = unstored
+                self._next_stranded_retry = time.monotonic() + self.RETRY_MAX_BACKOFF_SECONDS
+            if self._queued_records == 0:
+                self._idle.notify_all()
+        
+        for item in batch:
+            if error is not None and item.durable and any(r.record_id in unwritten_ids for r in item.records):
+                item.error = error
+            item.done.set()
+    
+    def _sync(self):
+        """fsync earlier commits if any are unsynced (writer thread only)."""
+        if not self._unsynced or self.fsync_policy == "os":
+            return
+        try:
+            self.audit_logger.sync()
+        except OSError as e:
+            with self._lock:
+                self._last_error = str(e)
+            return
+        self._last_sync = time.monotonic()
+        self._unsynced = False
+        with self._lock:
+            self._syncs += 1
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued record is committed (not necessarily synced).
+        
+        Returns:
+            True if drained, False on timeout
+        
+        Raises:
+            AuditWriteError: If records are still unwritten after retries
+        """
+        with self._lock:
+            drained = self._idle.wait_for(lambda: self._queued_records == 0, timeout=timeout)
+            self._raise_if_stranded()
+            return drained
+    
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Drain the queue, sync, and stop the writer thread.
+        
+        Returns:
+            True if the writer stopped cleanly within the timeout
+        """
+        with self._lock:
+            if self._closed:
+                return True
+            self._closed = True
+            thread = self._thread
+        
+        if thread is None or not thread.is_alive():
+            return True
+        
+        self._queue.put(None)
+        thread.join(timeout)
+        return not thread.is_alive()
+    
+    def status(self) -> Dict[str, Any]:
+        """Queue depth, commit counts and latency."""
+        commit_stats = self.stage_histogram.summary().get("audit_commit", {})
+        with self._lock:
+            return {
+                "fsync_policy": self.fsync_policy,
+                "fsync_interval_ms": self.fsync_interval_ms,
+                "queue_depth": self._queued_records,
+                "max_queue_depth": self._max_queue_depth,
+                "commits": self._commits,
+                "records_committed": self._records_committed,
+                "syncs": self._syncs,
+                "failed_records": self._failed,
+                "stranded_records": len(self._stranded) + len(self._unstored),
+                "unstored_records": len(self._unstored),
+                "retries": self._retries,
+                "last_commit_ms": round(self._last_commit_ms, 3),
+                "commit_p50_ms": commit_stats.get("p50_ms", 0.0),
+                "commit_p95_ms": commit_stats.get("p95_ms", 0.0),
+                "last_error": self._last_error
+            }
+
+
+# Singleton instance
+_writer = None
+_writer_lock = threading.Lock()
+
+def get_audit_writer() -> AuditWriter:
+    """Get the singleton AuditWriter (policy from AUDIT_FSYNC_POLICY / AUDIT_FSYNC_INTERVAL_MS)."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                from audit_logger import get_audit_logger
+                interval = os.getenv("AUDIT_FSYNC_INTERVAL_MS")
+                _writer = AuditWriter(
+                    get_audit_logger(),
+                    fsync_policy=os.getenv("AUDIT_FSYNC_POLICY") or None,
+                    fsync_interval_ms=float(interval) if interval else None
+                )
+    return _writer
+
+
+if __name__ == "__main__":
+    # Demo with a mock logger
+    from types import SimpleNamespace
+    
+    class MockLogger:
+        def log_decisions(self, records, fsync=False):
+            time.sleep(0.005)
+            print(f"Commit of {len(records)} records (fsync={fsync})")
+            return [r.record_id for r in records]
+        
+        def sync(self):
+            print("Interval sync")
+    
+    writer = AuditWriter(MockLogger(), fsync_policy="interval", fsync_interval_ms=20)
+    for i in range(20):
+        writer.submit([SimpleNamespace(record_id=f"AUD-{i:02d}")])
+    writer.submit([SimpleNamespace(record_id="AUD-durable")], wait=True)
+    writer.flush()
+    time.sleep(0.05)
+    print(writer.status())
+    writer.close()
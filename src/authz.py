@@ -74,3 +74,16 @@ def validate_decision_authority(role_str: str, decision: str) -> bool:
         return check_permission(role_str, Action.APPROVE) or check_permission(role_str, Action.DISMISS)
         
     return False
+
+def authorize_decisions(role_str: str, decisions: List[str]) -> Dict[str, bool]:
+    """
+    Validate a role once per distinct decision (for bulk requests).
+    
+    Args:
+        role_str: Role string
+        decisions: Decisions in the request (duplicates allowed)
+    
+    Returns:
+        Dict mapping each distinct decision to whether the role may make it
+    """
+    return {decision: validate_decision_authority(role_str, decision) for decision in set(decisions)}
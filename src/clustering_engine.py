@@ -4,16 +4,23 @@ Clustering Engine - Stage 3: Signal Aggregation
 Groups similar signals by topic and time window into clusters.
 Creates interpretable cluster IDs and evidence summaries.
 
+ClusterStats keeps running aggregates over a category's members (volume,
+keyword hits, sources, class labels, probability margins, time window),
+so incremental runs rebuild and score a cluster from the signals that
+changed instead of rescanning all of its members.
+
 Responsible AI Mapping:
 - Privacy: Aggregation works with patterns, not individuals
 - Transparency: Shows cluster evidence summary (top phrases, examples)
 """
 
+import bisect
 import re
+import threading
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter, defaultdict
 from enum import Enum
 import hashlib
 
@@ -27,6 +34,194 @@ class ClusterCategory(Enum):
     MIXED = "MIX"
 
 
+def _signal_text(signal: Any) -> str:
+    """Text content of a signal (empty if it has none)."""
+    if hasattr(signal, 'classification_result'):
+        return signal.classification_result.raw_text
+    if hasattr(signal, 'raw_text'):
+        return signal.raw_text
+    if hasattr(signal, 'content'):
+        return signal.content
+    return ""
+
+
+def _signal_sources(signal: Any) -> Tuple[str, ...]:
+    """Distinct sources a signal stands for (all collapsed duplicates)."""
+    if getattr(signal, 'sources', None):
+        return tuple(signal.sources)
+    return (signal.source,) if hasattr(signal, 'source') else ()
+
+
+@dataclass
+class ClusterStats:
+    """
+    Running aggregates over one category's member signals.
+    
+    A member's contribution is recorded when it is added and subtracted as
+    recorded when it is removed, so a member whose multiplicity grew since
+    is still removed exactly. Members and timestamps are kept in sorted
+    lists (bisect), so arrival order and the time window need no rescans.
+    """
+    keywords: Tuple[str, ...] = ()  # Phrases whose hits are counted
+    contributions: Dict[str, tuple] = field(default_factory=dict)  # event_id -> recorded contribution
+    ordinals: List[int] = field(default_factory=list)  # Member arrival positions, sorted
+    ordered: List[Any] = field(default_factory=list)  # Member signals, aligned with ordinals
+    timestamps: List[datetime] = field(default_factory=list)  # Member first/last event times, sorted
+    volume: int = 0
+    keyword_counts: Counter = field(default_factory=Counter)  # Members containing each keyword
+    source_counts: Counter = field(default_factory=Counter)  # Members per source
+    label_counts: Counter = field(default_factory=Counter)  # Multiplicity per predicted class
+    margin_sum: float = 0.0  # Multiplicity-weighted top-2 probability margins
+    margin_weight: int = 0
+    fingerprint: int = 0  # Order-independent membership hash (see version)
+    untimed: int = 0  # Members without a timestamp
+    min_ts: Optional[datetime] = None
+    max_ts: Optional[datetime] = None
+    
+    def add(
+        self,
+        event_id: str,
+        signal: Any,
+        ordinal: int,
+        timestamp: Optional[datetime] = None,
+        margin: Optional[float] = None,
+        label: Optional[str] = None,
+        last_timestamp: Optional[datetime] = None
+    ):
+        """
+        Add a member, replacing any member with the same event_id.
+        
+        Args:
+            event_id: Member key
+            signal: The member signal
+            ordinal: Arrival position; signals() lists members in this order
+            timestamp: Event time, if the signal has one (earliest collapsed copy)
+            margin: Top-2 probability margin (None without probability data)
+            label: Predicted class
+            last_timestamp: Latest collapsed copy's time, if later than timestamp
+        """
+        self.remove(event_id)
+        
+        multiplicity = getattr(signal, 'multiplicity', 1)
+        text = _signal_text(signal).lower()
+        hits = tuple(k for k in self.keywords if k in text)
+        sources = _signal_sources(signal)
+        digest = hashlib.blake2b(f"{event_id}:{multiplicity};".encode(), digest_size=8).digest()
+        member_hash = int.from_bytes(digest, 'big')
+        times = tuple(t for t in (timestamp, last_timestamp) if t is not None)
+        self.contributions[event_id] = (ordinal, multiplicity, label, margin, hits, sources, member_hash, timestamp, times)
+        
+        index = bisect.bisect_right(self.ordinals, ordinal)
+        self.ordinals.insert(index, ordinal)
+        self.ordered.insert(index, signal)
+        
+        self.volume += multiplicity
+        self.keyword_counts.update(hits)
+        self.source_counts.update(sources)
+        if label is not None:
+            self.label_counts[label] += multiplicity
+        if margin is not None:
+            self.margin_sum += margin * multiplicity
+            self.margin_weight += multiplicity
+        self.fingerprint = (self.fingerprint + member_hash) % (1 << 64)
+        
+        if timestamp is None:
+            self.untimed += 1
+        else:
+            for t in times:
+                bisect.insort(self.timestamps, t)
+            self._update_window()
+    
+    def remove(self, event_id: str):
+        """Remove a member (no-op if absent)."""
+        contribution = self.contributions.pop(event_id, None)
+        if contribution is None:
+            return
+        ordinal, multiplicity, label, margin, hits, sources, member_hash, timestamp, times = contribution
+        
+        index = bisect.bisect_left(self.ordinals, ordinal)
+        del self.ordinals[index]
+        del self.ordered[index]
+        
+        self.volume -= multiplicity
+        self.keyword_counts.subtract(hits)
+        self.source_counts.subtract(sources)
+        if label is not None:
+            self.label_counts[label] -= multiplicity
+        if margin is not None:
+            self.margin_sum -= margin * multiplicity
+            self.margin_weight -= multiplicity
+        self.fingerprint = (self.fingerprint - member_hash) % (1 << 64)
+        
+        if timestamp is None:
+            self.untimed -= 1
+        else:
+            for t in times:
+                del self.timestamps[bisect.bisect_left(self.timestamps, t)]
+            self._update_window()
+    
+    def _update_window(self):
+        self.min_ts = self.timestamps[0] if self.timestamps else None
+        self.max_ts = self.timestamps[-1] if self.timestamps else None
+    
+    def restore(self, contributions: Dict[str, tuple], signals: Dict[str, Any]):
+        """
+        Reattach members to restored aggregates (see summary()): their
+        recorded contributions, and the signals they stand for by event_id.
+        """
+        self.contributions = dict(contributions)
+        members = sorted((c[0], event_id) for event_id, c in self.contributions.items())
+        self.ordinals = [ordinal for ordinal, _ in members]
+        self.ordered = [signals[event_id] for _, event_id in members]
+        self.timestamps = sorted(t for c in self.contributions.values() for t in c[8])
+        self._update_window()
+    
+    def __len__(self) -> int:
+        return len(self.contributions)
+    
+    def signals(self) -> List[Any]:
+        """Members in arrival order."""
+        return list(self.ordered)
+    
+    def first_ordinal(self) -> int:
+        """Arrival position of the earliest member (0 if empty)."""
+        return self.ordinals[0] if self.ordinals else 0
+    
+    @property
+    def version(self) -> str:
+        return f"{self.fingerprint:016x}"
+    
+    @property
+    def sources(self) -> int:
+        """Distinct sources among members that have one."""
+        return sum(1 for count in self.source_counts.values() if count > 0)
+    
+    def average_margin(self) -> float:
+        """Mean top-2 probability margin (NaN without probability data)."""
+        return self.margin_sum / self.margin_weight if self.margin_weight > 0 else float('nan')
+    
+    def consistency(self) -> float:
+        """Share of the most common predicted class (NaN without labels)."""
+        total = sum(self.label_counts.values())
+        return max(self.label_counts.values()) / total if total > 0 else float('nan')
+    
+    def summary(self) -> 'ClusterStats':
+        """Copy of the aggregates without the members, for a built cluster to keep."""
+        return ClusterStats(
+            keywords=self.keywords,
+            volume=self.volume,
+            keyword_counts=+self.keyword_counts,
+            source_counts=+self.source_counts,
+            label_counts=+self.label_counts,
+            margin_sum=self.margin_sum,
+            margin_weight=self.margin_weight,
+            fingerprint=self.fingerprint,
+            untimed=self.untimed,
+            min_ts=self.min_ts,
+            max_ts=self.max_ts
+        )
+
+
 @dataclass
 class SignalCluster:
     """A cluster of related signals."""
@@ -40,10 +235,15 @@ class SignalCluster:
     time_window_end: datetime
     evidence_summary: str
     example_snippets: List[str]  # Synthetic examples for UI
+    version: str = ""  # Changes whenever cluster membership changes
+    stats: Optional[ClusterStats] = None  # Aggregates when built incrementally
     
     @property
     def volume(self) -> int:
-        return len(self.signals)
+        # Collapsed duplicates count once per member event
+        if self.stats is not None:
+            return self.stats.volume
+        return sum(getattr(s, 'multiplicity', 1) for s in self.signals)
 
 
 @dataclass
@@ -77,9 +277,6 @@ class ClusteringEngine:
         'NOISE': 'NOI',
     }
     
-    # Cluster counter for unique IDs
-    _cluster_counter: Dict[str, int] = defaultdict(int)
-    
     # Common phrases to extract per category
     CATEGORY_PHRASES = {
         'SERVICE': ['error', 'down', 'outage', 'slow', 'timeout', 'failure', 'unavailable'],
@@ -97,14 +294,22 @@ class ClusteringEngine:
         'NOISE': 20,
     }
     
+    # Process-wide ID counters: cluster IDs key decisions, rationales, live
+    # events and the audit trail, so they must not repeat across runs
+    _cluster_counter: Dict[str, int] = defaultdict(int)
+    _cluster_counter_lock = threading.Lock()
+    
     def __init__(self):
+        # Per-engine state: pipelines create one engine per run, so concurrent
+        # runs never share active clusters
         self.active_clusters: Dict[str, SignalCluster] = {}
     
     def _generate_cluster_id(self, category: str) -> str:
-        """Generate a unique cluster ID."""
+        """Generate a cluster ID, unique within this process."""
         prefix = self.CATEGORY_PREFIX.get(category, 'UNK')
-        self._cluster_counter[category] += 1
-        count = self._cluster_counter[category]
+        with ClusteringEngine._cluster_counter_lock:
+            ClusteringEngine._cluster_counter[category] += 1
+            count = ClusteringEngine._cluster_counter[category]
         return f"{prefix}-{count:02d}"
     
     def _extract_timestamp(self, signal: Any) -> Optional[datetime]:
@@ -118,18 +323,59 @@ class ClusteringEngine:
         
         # For signals with direct timestamp access
         if hasattr(signal, 'timestamp'):
-            ts = signal.timestamp
-            if isinstance(ts, str):
-                try:
-                    return datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                except:
-                    pass
-            elif isinstance(ts, datetime):
+            ts = self._parse_timestamp(signal.timestamp)
+            if ts is not None:
                 return ts
         
         # Default to now if no timestamp found
         return datetime.now()
     
+    def _event_timestamp(self, signal: Any) -> Optional[datetime]:
+        """
+        Event time of a signal: its own timestamp, else its classification
+        result's (GatedSignals carry none). Timezone-aware times are
+        normalized to naive UTC so they compare with each other and with now.
+        None if the event has no parseable time.
+        """
+        ts = self._parse_timestamp(getattr(signal, 'timestamp', None))
+        if ts is None:
+            ts = self._parse_timestamp(getattr(getattr(signal, 'classification_result', None), 'timestamp', None))
+        return self._naive_utc(ts)
+    
+    def _event_time_range(self, signal: Any) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Earliest and latest time of the raw events a signal stands for:
+        its event time widened by the first_seen/last_seen of its collapsed
+        duplicates. None if the event has no parseable time.
+        """
+        first = self._event_timestamp(signal)
+        if first is None:
+            return None
+        result = getattr(signal, 'classification_result', signal)
+        times = [first] + [
+            self._naive_utc(self._parse_timestamp(getattr(result, name, None)))
+            for name in ('first_seen', 'last_seen')
+        ]
+        times = [t for t in times if t is not None]
+        return min(times), max(times)
+    
+    def _naive_utc(self, ts: Optional[datetime]) -> Optional[datetime]:
+        """Timezone-aware times as naive UTC (others unchanged)."""
+        if ts is not None and ts.tzinfo is not None:
+            ts = ts.replace(tzinfo=None) - (ts.utcoffset() or timedelta(0))
+        return ts
+    
+    def _parse_timestamp(self, ts: Any) -> Optional[datetime]:
+        """Parse an ISO string or datetime; None if unparseable."""
+        if isinstance(ts, str):
+            try:
+                return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+            except:
+                pass
+        elif isinstance(ts, datetime):
+            return ts
+        return None
+    
     def _extract_phrases(self, signals: List[Any], category: str) -> List[str]:
         """Extract top phrases from signals in a cluster."""
         phrase_counts = defaultdict(int)
@@ -154,6 +400,16 @@ class ClusteringEngine:
         sorted_phrases = sorted(phrase_counts.items(), key=lambda x: -x[1])
         return [phrase for phrase, _ in sorted_phrases[:5]]
     
+    def _top_phrases(self, keyword_counts: Counter, category: str) -> List[str]:
+        """Top 5 category phrases from running hit counts (see ClusterStats)."""
+        counts = [(p, keyword_counts[p]) for p in self.CATEGORY_PHRASES.get(category, []) if keyword_counts[p] > 0]
+        return [phrase for phrase, _ in sorted(counts, key=lambda x: -x[1])[:5]]
+    
+    def stats_keywords(self, category: str, extra: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+        """Keywords a category's ClusterStats must count: its phrases plus any extra."""
+        phrases = tuple(self.CATEGORY_PHRASES.get(category, []))
+        return phrases + tuple(k for k in extra if k not in phrases)
+    
     def _calculate_spike_ratio(self, volume: int, category: str, window_minutes: float) -> float:
         """Calculate spike ratio vs baseline."""
         baseline_hourly = self.BASELINE_VOLUMES.get(category, 5)
@@ -195,10 +451,16 @@ class ClusteringEngine:
         
         return snippets
     
-    def _find_related_clusters(self, cluster: SignalCluster) -> List[str]:
+    def _find_related_clusters(
+        self, 
+        cluster: SignalCluster, 
+        candidates: Optional[Dict[str, SignalCluster]] = None
+    ) -> List[str]:
         """Find related clusters based on category and timing."""
         related = []
-        for cid, other in self.active_clusters.items():
+        if candidates is None:
+            candidates = self.active_clusters
+        for cid, other in candidates.items():
             if cid == cluster.cluster_id:
                 continue
             
@@ -211,6 +473,94 @@ class ClusteringEngine:
         
         return related[:3]  # Max 3 related clusters
     
+    def _cluster_version(self, signals: List[Any]) -> str:
+        """Fingerprint of cluster membership (event IDs + multiplicities)."""
+        digest = hashlib.blake2b(digest_size=8)
+        for s in signals:
+            digest.update(f"{getattr(s, 'event_id', id(s))}:{getattr(s, 'multiplicity', 1)};".encode())
+        return digest.hexdigest()
+    
+    def _meets_min_size(self, category: str, signals: List[Any], volume: Optional[int] = None) -> bool:
+        """Check the minimum cluster size (fraud and misinformation always qualify)."""
+        if volume is None:
+            volume = sum(getattr(s, 'multiplicity', 1) for s in signals)
+        if volume < self.MIN_CLUSTER_SIZE and category != 'FRAUD':
+            # Skip small clusters unless it's fraud (always important)
+            if category != 'MISINFORMATION':
+                return False
+        return True
+    
+    def _build_cluster(
+        self, 
+        category: str, 
+        signals: List[Any], 
+        timestamps: Optional[List[datetime]] = None,
+        cluster_id: Optional[str] = None,
+        stats: Optional[ClusterStats] = None
+    ) -> SignalCluster:
+        """
+        Build a SignalCluster for a group of same-category signals.
+        
+        Args:
+            category: Signal category
+            signals: Signals in the cluster
+            timestamps: Optional event times (defaults to each signal's first and last event time)
+            cluster_id: Existing ID to keep when rebuilding a cluster (new ID if None)
+            stats: Running aggregates over the signals; phrases, time window,
+                volume and version are read from them instead of the signals
+        
+        Returns:
+            SignalCluster with ID, phrases, spike ratio and evidence summary
+        """
+        now = datetime.now()
+        if cluster_id is None:
+            cluster_id = self._generate_cluster_id(category)
+        
+        if stats is not None:
+            top_phrases = self._top_phrases(stats.keyword_counts, category)
+            # Members without a timestamp count as now (as in _extract_timestamp)
+            edges = [t for t in (stats.min_ts, stats.max_ts) if t is not None] + ([now] if stats.untimed else [])
+            min_ts = min(edges, default=now)
+            max_ts = max(edges, default=now)
+            volume = stats.volume
+        else:
+            top_phrases = self._extract_phrases(signals, category)
+            
+            # Determine time window from ACTUAL data, not system time
+            # (event times; members without one count as now, as with stats)
+            if timestamps is None:
+                timestamps = [t for s in signals for t in (self._event_time_range(s) or (now,))]
+            min_ts = min(timestamps) if timestamps else now
+            max_ts = max(timestamps) if timestamps else now
+            volume = sum(getattr(s, 'multiplicity', 1) for s in signals)
+        
+        # Spike calc based on data density
+        duration_minutes = (max_ts - min_ts).total_seconds() / 60
+        if duration_minutes < 1: duration_minutes = 1
+        
+        spike_ratio = self._calculate_spike_ratio(volume, category, duration_minutes)
+        snippets = self._get_example_snippets(signals)
+        
+        cluster = SignalCluster(
+            cluster_id=cluster_id,
+            category=category,
+            signals=signals,
+            top_phrases=top_phrases,
+            spike_ratio=spike_ratio,
+            related_clusters=[],  # Will be filled after all clusters created
+            time_window_start=min_ts,
+            time_window_end=max_ts,
+            evidence_summary="",  # Will be filled
+            example_snippets=snippets,
+            version=stats.version if stats is not None else self._cluster_version(signals),
+            stats=stats.summary() if stats is not None else None
+        )
+        
+        # Generate evidence summary
+        cluster.evidence_summary = self._generate_evidence_summary(cluster)
+        
+        return cluster
+    
     def cluster_signals(self, signals: List[Any]) -> ClusteringResult:
         """
         Cluster signals into incidents based on similarity and time.
@@ -255,53 +605,22 @@ class ClusteringEngine:
         window_start = now - timedelta(minutes=self.TIME_WINDOW_MINUTES)
         
         for category, signals in category_groups.items():
-            if len(signals) < self.MIN_CLUSTER_SIZE and category != 'FRAUD':
-                # Skip small clusters unless it's fraud (always important)
-                if category != 'MISINFORMATION':
-                    continue
-            
-            cluster_id = self._generate_cluster_id(category)
-            top_phrases = self._extract_phrases(signals, category)
-            
-            # Determine time window from ACTUAL data, not system time
-            timestamps = [self._extract_timestamp(s) for s in signals]
-            min_ts = min(timestamps) if timestamps else now
-            max_ts = max(timestamps) if timestamps else now
-            
-            # Spike calc based on data density
-            duration_minutes = (max_ts - min_ts).total_seconds() / 60
-            if duration_minutes < 1: duration_minutes = 1
-            
-            spike_ratio = self._calculate_spike_ratio(
-                len(signals), category, duration_minutes
-            )
-            snippets = self._get_example_snippets(signals)
-            
-            cluster = SignalCluster(
-                cluster_id=cluster_id,
-                category=category,
-                signals=signals,
-                top_phrases=top_phrases,
-                spike_ratio=spike_ratio,
-                related_clusters=[],  # Will be filled after all clusters created
-                time_window_start=min_ts,
-                time_window_end=max_ts,
-                evidence_summary="",  # Will be filled
-                example_snippets=snippets
-            )
-            
-            # Generate evidence summary
-            cluster.evidence_summary = self._generate_evidence_summary(cluster)
+            if not self._meets_min_size(category, signals):
+                continue
             
+            cluster = self._build_cluster(category, signals)
             clusters.append(cluster)
-            self.active_clusters[cluster_id] = cluster
+            self.active_clusters[cluster.cluster_id] = cluster
         
         # Find related clusters
         for cluster in clusters:
             cluster.related_clusters = self._find_related_clusters(cluster)
         
         # Calculate category distribution
-        category_dist = {cat: len(sigs) for cat, sigs in category_groups.items()}
+        category_dist = {
+            cat: sum(getattr(s, 'multiplicity', 1) for s in sigs)
+            for cat, sigs in category_groups.items()
+        }
         
         return ClusteringResult(
             clusters=clusters,
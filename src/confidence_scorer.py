@@ -17,10 +17,13 @@ Responsible AI Mapping:
 - Reliability & Safety: Explicit uncertainty handling prevents overreaction
 """
 
+import numpy as np
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from enum import Enum
 
+from naive_bayes_classifier import NaiveBayesClassifier
+
 
 class ConfidenceLevel(Enum):
     """Confidence level labels."""
@@ -73,43 +76,167 @@ class ConfidenceScorer:
     def __init__(self):
         pass
     
-    def _calculate_nb_margin(self, cluster: Any) -> tuple[float, str]:
+    def _extract_signal_fields(self, signal: Any) -> tuple[Optional[dict], Optional[float], Optional[str]]:
         """
-        Calculate confidence factor from Naïve Bayes probability margins.
-        Returns score (0-100) and description.
+        Walk a signal's attributes once.
+        Returns (class probabilities, fallback confidence, predicted class).
         """
-        margins = []
-        
-        signals = cluster.signals if hasattr(cluster, 'signals') else []
-        for signal in signals:
-            # Get class probabilities
-            probs = None
-            if hasattr(signal, 'classification_result'):
-                result = signal.classification_result
-                if hasattr(result, 'class_probabilities'):
-                    probs = result.class_probabilities
-                elif hasattr(result, 'confidence'):
-                    margins.append(result.confidence)
-                    continue
-            elif hasattr(signal, 'class_probabilities'):
-                probs = signal.class_probabilities
-            elif hasattr(signal, 'confidence'):
-                margins.append(signal.confidence)
-                continue
-            
-            if probs:
-                # Margin = top probability - second probability
-                sorted_probs = sorted(probs.values(), reverse=True)
-                if len(sorted_probs) >= 2:
-                    margin = sorted_probs[0] - sorted_probs[1]
-                    margins.append(margin)
-                elif sorted_probs:
-                    margins.append(sorted_probs[0])
-        
-        if not margins:
-            return 50.0, "No probability data available"
+        probs = None
+        fallback = None
+        label = None
+        
+        if hasattr(signal, 'classification_result'):
+            result = signal.classification_result
+            if hasattr(result, 'class_probabilities'):
+                probs = result.class_probabilities
+            elif hasattr(result, 'confidence'):
+                fallback = result.confidence
+        elif hasattr(signal, 'class_probabilities'):
+            probs = signal.class_probabilities
+        elif hasattr(signal, 'confidence'):
+            fallback = signal.confidence
+        
+        if hasattr(signal, 'predicted_class'):
+            label = signal.predicted_class
+        elif hasattr(signal, 'classification_result'):
+            label = signal.classification_result.predicted_class
+        
+        return probs, fallback, label
+    
+    def signal_margin(self, signal: Any) -> tuple[Optional[float], Optional[str]]:
+        """
+        One signal's top-2 probability margin and predicted class, as
+        _calculate_nb_margins computes it (margin None without probability data).
+        Used to maintain ClusterStats incrementally.
+        """
+        probs, fallback, label = self._extract_signal_fields(signal)
+        if probs:
+            top = sorted(probs.values(), reverse=True)[:2] + [0.0, 0.0]
+            return max(top[0], 0.0) - max(top[1], 0.0), label
+        return fallback, label
+    
+    def _build_signal_arrays(self, clusters: List[Any]) -> Dict[str, np.ndarray]:
+        """
+        Flatten all cluster signals into aligned arrays.
+        
+        Returns a dict with:
+        - probabilities: (N x K) class probability matrix (K >= 5, CLASSES order first)
+        - has_probs: rows whose margin comes from the probability matrix
+        - fallback: margin taken directly from a confidence value
+        - has_margin: rows contributing to the NB margin factor
+        - labels: predicted class index per row (-1 if unknown)
+        - multiplicity: raw events each row stands for (collapsed duplicates)
+        - offsets: cluster membership offsets (len = clusters + 1)
+        """
+        class_index = {cls: i for i, cls in enumerate(NaiveBayesClassifier.CLASSES)}
+        
+        offsets = [0]
+        rows, cols, vals = [], [], []
+        has_probs, fallback, has_margin, labels, multiplicity = [], [], [], [], []
+        
+        n = 0
+        for cluster in clusters:
+            # Clusters carrying running aggregates are scored from those instead
+            if getattr(cluster, 'stats', None) is not None:
+                signals = []
+            else:
+                signals = cluster.signals if hasattr(cluster, 'signals') else []
+            for signal in signals:
+                probs, conf, label = self._extract_signal_fields(signal)
+                
+                if probs:
+                    for cls, p in probs.items():
+                        rows.append(n)
+                        cols.append(class_index.setdefault(cls, len(class_index)))
+                        vals.append(p)
+                    has_probs.append(True)
+                    has_margin.append(True)
+                    fallback.append(0.0)
+                elif conf is not None:
+                    has_probs.append(False)
+                    has_margin.append(True)
+                    fallback.append(conf)
+                else:
+                    has_probs.append(False)
+                    has_margin.append(False)
+                    fallback.append(0.0)
+                
+                labels.append(class_index.setdefault(label, len(class_index)) if label is not None else -1)
+                multiplicity.append(getattr(signal, 'multiplicity', 1))
+                n += 1
+            offsets.append(n)
+        
+        probabilities = np.zeros((n, len(class_index)))
+        if rows:
+            probabilities[rows, cols] = vals
+        
+        return {
+            'probabilities': probabilities,
+            'has_probs': np.array(has_probs, dtype=bool),
+            'fallback': np.array(fallback, dtype=float),
+            'has_margin': np.array(has_margin, dtype=bool),
+            'labels': np.array(labels, dtype=np.int64),
+            'multiplicity': np.array(multiplicity, dtype=float),
+            'offsets': np.array(offsets, dtype=np.int64),
+            'num_classes': len(class_index),
+        }
+    
+    def _calculate_nb_margins(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Mean top-2 probability margin per cluster (NaN where no data).
+        Uses np.partition instead of sorting each probability dict.
+        """
+        probs = arrays['probabilities']
+        offsets = arrays['offsets']
+        num_clusters = len(offsets) - 1
+        k = probs.shape[1]
+        
+        if len(probs):
+            part = np.partition(probs, k - 2, axis=1)
+            top2_margin = part[:, -1] - part[:, -2]
+        else:
+            top2_margin = np.zeros(0)
+        
+        margins = np.where(arrays['has_probs'], top2_margin, arrays['fallback'])
+        weights = arrays['has_margin'] * arrays['multiplicity']
+        
+        # Segment reduction over cluster membership
+        cluster_ids = np.repeat(np.arange(num_clusters), np.diff(offsets))
+        sums = np.bincount(cluster_ids, weights=margins * weights, minlength=num_clusters)
+        counts = np.bincount(cluster_ids, weights=weights, minlength=num_clusters)
         
-        avg_margin = sum(margins) / len(margins)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+    
+    def _calculate_consistencies(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Share of the most common predicted class per cluster (NaN where no data).
+        Uses a single bincount over (cluster, class) pairs.
+        """
+        labels = arrays['labels']
+        offsets = arrays['offsets']
+        num_clusters = len(offsets) - 1
+        k = arrays['num_classes']
+        
+        cluster_ids = np.repeat(np.arange(num_clusters), np.diff(offsets))
+        valid = labels >= 0
+        
+        counts = np.bincount(
+            cluster_ids[valid] * k + labels[valid],
+            weights=arrays['multiplicity'][valid],
+            minlength=num_clusters * k
+        ).reshape(num_clusters, k)
+        
+        totals = counts.sum(axis=1)
+        most_common = counts.max(axis=1) if k else np.zeros(num_clusters)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(totals > 0, most_common / np.maximum(totals, 1), np.nan)
+    
+    def _describe_margin(self, avg_margin: float) -> tuple[float, str]:
+        """Convert an average margin to a 0-100 score and description."""
+        if np.isnan(avg_margin):
+            return 50.0, "No probability data available"
         
         # Convert margin to 0-100 score (margin of 0.5 = 100%)
         score = min(100, (avg_margin / 0.5) * 100)
@@ -123,7 +250,27 @@ class ConfidenceScorer:
         else:
             desc = "Very narrow margins (ambiguous)"
         
-        return score, desc
+        return float(score), desc
+    
+    def _describe_consistency(self, consistency: float, has_signals: bool) -> tuple[float, str]:
+        """Convert a consistency ratio to a 0-100 score and description."""
+        if not has_signals:
+            return 50.0, "No signals to analyze"
+        if np.isnan(consistency):
+            return 50.0, "No classification data"
+        
+        score = consistency * 100
+        
+        if consistency >= 0.9:
+            desc = "Highly consistent signals"
+        elif consistency >= 0.7:
+            desc = "Mostly consistent signals"
+        elif consistency >= 0.5:
+            desc = "Mixed signal types"
+        else:
+            desc = "Inconsistent signals"
+        
+        return float(score), desc
     
     def _calculate_cluster_size_factor(self, cluster: Any) -> tuple[float, str]:
         """
@@ -151,46 +298,6 @@ class ConfidenceScorer:
         
         return score, desc
     
-    def _calculate_consistency_factor(self, cluster: Any) -> tuple[float, str]:
-        """
-        Calculate confidence factor from signal consistency.
-        Returns score (0-100) and description.
-        """
-        signals = cluster.signals if hasattr(cluster, 'signals') else []
-        
-        if not signals:
-            return 50.0, "No signals to analyze"
-        
-        # Check classification consistency
-        classifications = []
-        for signal in signals:
-            if hasattr(signal, 'predicted_class'):
-                classifications.append(signal.predicted_class)
-            elif hasattr(signal, 'classification_result'):
-                classifications.append(signal.classification_result.predicted_class)
-        
-        if not classifications:
-            return 50.0, "No classification data"
-        
-        # Calculate consistency as percentage of most common class
-        from collections import Counter
-        counts = Counter(classifications)
-        most_common_count = counts.most_common(1)[0][1]
-        consistency = most_common_count / len(classifications)
-        
-        score = consistency * 100
-        
-        if consistency >= 0.9:
-            desc = "Highly consistent signals"
-        elif consistency >= 0.7:
-            desc = "Mostly consistent signals"
-        elif consistency >= 0.5:
-            desc = "Mixed signal types"
-        else:
-            desc = "Inconsistent signals"
-        
-        return score, desc
-    
     def _get_confidence_level(self, percentage: float) -> ConfidenceLevel:
         """Get confidence level for a percentage."""
         for threshold, level in self.LEVEL_THRESHOLDS:
@@ -221,20 +328,17 @@ class ConfidenceScorer:
         
         return " + ".join(reasons)
     
-    def calculate_confidence(self, cluster: Any) -> ConfidenceScore:
-        """
-        Calculate confidence score for a cluster.
-        
-        Args:
-            cluster: SignalCluster object
-            
-        Returns:
-            ConfidenceScore with percentage, level, and uncertainty wording
-        """
-        # Calculate each component
-        nb_score, nb_desc = self._calculate_nb_margin(cluster)
+    def _build_score(
+        self,
+        cluster: Any,
+        nb_margin: float,
+        consistency: float,
+        has_signals: bool
+    ) -> ConfidenceScore:
+        """Assemble a ConfidenceScore from precomputed per-cluster factors."""
+        nb_score, nb_desc = self._describe_margin(nb_margin)
         size_score, size_desc = self._calculate_cluster_size_factor(cluster)
-        consistency_score, consistency_desc = self._calculate_consistency_factor(cluster)
+        consistency_score, consistency_desc = self._describe_consistency(consistency, has_signals)
         
         components = {
             'nb_margin': {'score': nb_score, 'description': nb_desc, 'weight': self.WEIGHT_NB_MARGIN},
@@ -262,6 +366,48 @@ class ConfidenceScorer:
             components=components
         )
     
+    def calculate_confidence_batch(self, clusters: List[Any]) -> List[ConfidenceScore]:
+        """
+        Calculate confidence scores for many clusters in one pass.
+        
+        All signals are flattened into an (N x K) probability array; margins
+        and consistency are reduced per cluster over membership offsets.
+        
+        Args:
+            clusters: List of SignalCluster objects
+        
+        Returns:
+            ConfidenceScore per cluster, in input order
+        """
+        if not clusters:
+            return []
+        
+        arrays = self._build_signal_arrays(clusters)
+        margins = self._calculate_nb_margins(arrays)
+        consistencies = self._calculate_consistencies(arrays)
+        sizes = np.diff(arrays['offsets'])
+        
+        scores = []
+        for i, cluster in enumerate(clusters):
+            stats = getattr(cluster, 'stats', None)
+            if stats is not None:
+                scores.append(self._build_score(cluster, stats.average_margin(), stats.consistency(), stats.volume > 0))
+            else:
+                scores.append(self._build_score(cluster, margins[i], consistencies[i], sizes[i] > 0))
+        return scores
+    
+    def calculate_confidence(self, cluster: Any) -> ConfidenceScore:
+        """
+        Calculate confidence score for a cluster.
+        
+        Args:
+            cluster: SignalCluster object
+        
+        Returns:
+            ConfidenceScore with percentage, level, and uncertainty wording
+        """
+        return self.calculate_confidence_batch([cluster])[0]
+    
     def get_uncertainty_badge(self, confidence: ConfidenceScore) -> dict:
         """
         Get badge data for UI display.
@@ -301,11 +447,15 @@ def get_confidence_scorer() -> ConfidenceScorer:
     return _scorer
 
 
-# Convenience function
+# Convenience functions
 def calculate_confidence(cluster: Any) -> ConfidenceScore:
     """Calculate confidence score for a cluster."""
     return get_confidence_scorer().calculate_confidence(cluster)
 
+def calculate_confidence_batch(clusters: List[Any]) -> List[ConfidenceScore]:
+    """Calculate confidence scores for a list of clusters."""
+    return get_confidence_scorer().calculate_confidence_batch(clusters)
+
 
 if __name__ == "__main__":
     # Demo with mock cluster
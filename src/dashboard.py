@@ -18,13 +18,14 @@ import pandas as pd
 import json
 import os
 import sys
+import threading
 from datetime import datetime, timedelta
 import time
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from responsible_ai_pipeline import get_pipeline, process_events, ClusterAnalysis
+from responsible_ai_pipeline import get_pipeline, process_events, ClusterAnalysis, PipelineState
 from data_loader import load_csv_events
 from guardrails import get_guardrails
 from audit_logger import get_audit_logger
@@ -454,17 +455,39 @@ DEPARTMENTS = {
 # DATA LOADING
 # ==============================================================================
 
+# The cached state is shared by every browser session; updates are serialized
+_STATE_LOCK = threading.Lock()
+
+@st.cache_resource
+def load_pipeline_state(state_path):
+    """Load the incremental pipeline state (persisted across restarts)."""
+    return PipelineState.load(state_path)
+
 @st.cache_data(ttl=60)
 def load_pipeline_data():
-    """Load and process data through the 10-stage pipeline."""
+    """Load and process data through the 10-stage pipeline (new rows only)."""
     try:
         csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'synthetic_social_signals_mashreq.csv')
         if not os.path.exists(csv_path):
             csv_path = 'data/synthetic_social_signals_mashreq.csv'
+        state_path = os.path.join(os.path.dirname(csv_path), 'pipeline_state.pkl')
         
         events = load_csv_events(csv_path)
-        pipeline = get_pipeline()
-        result = pipeline.process(events)
+        
+        with _STATE_LOCK:
+            state = load_pipeline_state(state_path)
+            
+            # File was replaced or truncated: start over from a clean state
+            if len(events) < state.event_count:
+                if os.path.exists(state_path):
+                    os.remove(state_path)
+                load_pipeline_state.clear()
+                state = load_pipeline_state(state_path)
+            
+            pipeline = get_pipeline()
+            result = pipeline.process_delta(events[state.event_count:], state)
+            if result.recomputed_clusters or not os.path.exists(state_path):
+                state.save(state_path)
         return result, events
     except Exception as e:
         st.error(f"Pipeline error: {e}")
@@ -486,6 +509,9 @@ def get_risk_color(score):
     if score >= 4: return "#D4AF37"
     return "#3B82F6"
 
+# RBAC role the dashboard's bulk decisions are made under (see authz.py)
+DASHBOARD_ROLE = os.getenv("DASHBOARD_ROLE", "reviewer")
+
 def log_action(action, signal_id, user="Risk Analyst", details=""):
     """Log an action to the audit trail."""
     entry = {
@@ -498,6 +524,20 @@ def log_action(action, signal_id, user="Risk Analyst", details=""):
     st.session_state['audit_log'].append(entry)
     return entry
 
+def apply_bulk_decision(analyses, action, decision, user="Risk Analyst"):
+    """Record one decision for several signals as a single audit commit."""
+    results = get_pipeline().log_human_decisions(
+        [{"cluster_id": a.cluster.cluster_id, "decision": decision, "user": user} for a in analyses],
+        role=DASHBOARD_ROLE
+    )
+    logged = {r["cluster_id"] for r in results if r["status"] == "logged"}
+    target = 'escalated_signals' if action == "ESCALATED" else 'dismissed_signals'
+    for analysis in analyses:
+        if analysis.cluster.cluster_id in logged:
+            st.session_state[target].append(analysis)
+            log_action(action, analysis.cluster.cluster_id, user=user, details="Bulk action")
+    return results
+
 # ==============================================================================
 # RENDER FUNCTIONS
 # ==============================================================================
@@ -561,11 +601,15 @@ def render_signal_card(analysis, show_actions=True, key_prefix=""):
     # Extract values
     title = card['title']
     risk_score = card['risk_score']
-    confidence = card['confidence_percentage']
     category = card['category']
-    signal_text = card['rationale']['what_signal']
-    why_matters = card['rationale']['why_it_matters']
-    uncertainty = card['uncertainty_wording']
+    
+    # Degraded cards skip confidence until the deferred audit completes
+    if card['confidence_percentage'] is None:
+        confidence = "pending"
+        uncertainty = "Deferred under load; full analysis follows shortly."
+    else:
+        confidence = f"{card['confidence_percentage']:.0f}%"
+        uncertainty = card['uncertainty_wording']
     
     # Card container with badges
     st.markdown(f"""
@@ -576,27 +620,35 @@ def render_signal_card(analysis, show_actions=True, key_prefix=""):
             ⚠️ Risk: {risk_score}/10
         </span>
         <span class="score-badge confidence-badge">
-            🎯 Confidence: {confidence:.0f}%
+            🎯 Confidence: {confidence}
         </span>
         <span class="score-badge category-badge">
             📂 {category}
         </span>
     </div>
     <div class="ai-reasoning">
-        <div class="ai-reasoning-title">🤖 AI Reasoning</div>
         <div class="ai-reasoning-text">
-            <span style="font-weight: 600; color: #D4AF37;">Signal:</span> {signal_text}
-        </div>
-        <div class="ai-reasoning-text" style="margin-top: 8px;">
-            <span style="font-weight: 600; color: #D4AF37;">Why it matters:</span> {why_matters}
-        </div>
-        <div class="ai-reasoning-text" style="margin-top: 8px;">
             <span style="font-weight: 600; color: #D4AF37;">Uncertainty:</span> {uncertainty}
         </div>
     </div>
 </div>
     """, unsafe_allow_html=True)
     
+    # Rationale is generated on first view (a toggle, unlike an expander, skips its body when closed)
+    if st.toggle("🤖 Show AI reasoning", key=f"{key_prefix}_reasoning_{card['cluster_id']}"):
+        rationale = analysis.get_rationale()
+        st.markdown(f"""
+<div class="ai-reasoning">
+    <div class="ai-reasoning-title">🤖 AI Reasoning</div>
+    <div class="ai-reasoning-text">
+        <span style="font-weight: 600; color: #D4AF37;">Signal:</span> {rationale.what_signal}
+    </div>
+    <div class="ai-reasoning-text" style="margin-top: 8px;">
+        <span style="font-weight: 600; color: #D4AF37;">Why it matters:</span> {rationale.why_it_matters}
+    </div>
+</div>
+        """, unsafe_allow_html=True)
+    
     if show_actions:
         col1, col2, col3 = st.columns([2, 2, 4])
         with col1:
@@ -849,6 +901,20 @@ def render_analytics_tab(result, events):
             <p><strong>Clusters Formed:</strong> {result.clustering_result.cluster_count}</p>
         </div>
         """, unsafe_allow_html=True)
+        
+        # Per-stage breakdown
+        if result.stage_timings:
+            total_wall = sum(span.wall_ms for span in result.stage_timings) or 1
+            for span in result.stage_timings:
+                pct = span.wall_ms / total_wall * 100
+                st.markdown(f"""
+                <div style="margin-bottom: 8px;">
+                    <div style="color: #E2E8F0; margin-bottom: 4px;">{span.stage.title()}: {span.wall_ms:.1f}ms wall • {span.cpu_ms:.1f}ms CPU • {span.items_in} → {span.items_out}</div>
+                    <div class="risk-bar-container">
+                        <div class="risk-bar-fill" style="width: {pct}%;"></div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
     
     with col2:
         st.markdown("#### 📊 Category Distribution")
@@ -942,6 +1008,10 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
+        # Persisted state from the audit decision view (O(1), survives restarts)
+        audit_pending = get_audit_logger().decisions.counts().get("PENDING", 0)
+        st.caption(f"📋 {audit_pending} clusters awaiting a human decision in the audit trail")
+        
         if result and result.cluster_analyses:
             # Filter out already processed signals
             escalated_ids = [a.cluster.cluster_id for a in st.session_state['escalated_signals']]
@@ -956,6 +1026,27 @@ def main():
             
             if pending:
                 st.markdown(f"**{len(pending)} signals awaiting review**")
+                
+                # Multi-select: one RBAC check per decision, one audit commit
+                with st.expander("☑️ Bulk actions"):
+                    by_id = {a.cluster.cluster_id: a for a in pending}
+                    selected = st.multiselect("Select signals", options=list(by_id), key="triage_bulk_select")
+                    bulk = None
+                    bcol1, bcol2 = st.columns(2)
+                    with bcol1:
+                        if st.button("🚀 Escalate selected", key="triage_bulk_escalate", disabled=not selected):
+                            bulk = ("ESCALATED", "APPROVED")
+                    with bcol2:
+                        if st.button("❌ Dismiss selected", key="triage_bulk_dismiss", disabled=not selected):
+                            bulk = ("DISMISSED", "DISMISSED")
+                    if bulk:
+                        results = apply_bulk_decision([by_id[cid] for cid in selected], *bulk)
+                        rejected = [r for r in results if r["status"] != "logged"]
+                        if rejected:
+                            st.error(f"{len(rejected)} of {len(results)} decisions rejected: {rejected[0].get('detail')}")
+                        else:
+                            st.rerun()
+                
                 for analysis in pending:
                     render_signal_card(analysis, show_actions=True, key_prefix="triage")
             else:
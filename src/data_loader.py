@@ -10,7 +10,7 @@ Responsible AI Mapping:
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import os
 from datetime import datetime
 
@@ -18,6 +18,9 @@ class DataLoader:
     """Adapter for loading and standardizing CSV data."""
 
     REQUIRED_COLUMNS = ['event_id', 'content', 'source', 'timestamp']
+    
+    # Rows per chunk when streaming large files
+    CHUNK_SIZE = 10000
 
     def load_csv_events(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -34,56 +37,97 @@ class DataLoader:
             
         try:
             df = pd.read_csv(file_path)
+            return self._standardize(df, file_path)
             
-            # Validate columns
-            missing = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
-            if missing:
-                # Try simple mapping if standard columns missing
-                column_map = {
-                    'text': 'content',
-                    'post_id': 'event_id',
-                    'platform': 'source',
-                    'region': 'region'
-                }
-                df.rename(columns=column_map, inplace=True)
-                
-            # Fill missing IDs
-            if 'event_id' not in df.columns:
-                df['event_id'] = [f"csv-{i}" for i in range(len(df))]
-                
-            # Convert timestamps
-            if 'timestamp' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['timestamp']).map(lambda x: x.isoformat())
-            else:
-                df['timestamp'] = datetime.now().isoformat()
+        except Exception as e:
+            print(f"Error loading CSV: {e}")
+            return []
+    
+    def iter_csv_events(
+        self, 
+        file_path: str, 
+        chunk_size: int = None, 
+        skip_rows: int = 0
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream events from a large CSV file in chunks.
+        
+        Args:
+            file_path: Path to the CSV file
+            chunk_size: Rows per chunk
+            skip_rows: Data records to skip (e.g. records already processed before a resume)
             
-            # Convert to list of dicts
-            events = df.to_dict('records')
+        Yields:
+            Lists of standardized event dictionaries (same schema as load_csv_events)
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
+        
+        # Records are skipped by count while iterating: skiprows takes line
+        # numbers, which need not match records when quoted fields span lines
+        reader = pd.read_csv(file_path, chunksize=chunk_size or self.CHUNK_SIZE)
+        row = 0
+        for df in reader:
+            if row + len(df) <= skip_rows:
+                row += len(df)
+                continue
+            if row < skip_rows:
+                df = df.iloc[skip_rows - row:]
+                row = skip_rows
+            events = self._standardize(df, file_path, start_row=row)
+            row += len(df)
+            yield events
+    
+    def _standardize(self, df: pd.DataFrame, file_path: str, start_row: int = 0) -> List[Dict[str, Any]]:
+        """Map a raw CSV frame onto the pipeline event schema."""
+        # Validate columns
+        missing = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
+        if missing:
+            # Try simple mapping if standard columns missing
+            column_map = {
+                'text': 'content',
+                'post_id': 'event_id',
+                'platform': 'source',
+                'region': 'region'
+            }
+            df.rename(columns=column_map, inplace=True)
+        
+        # Fill missing IDs
+        if 'event_id' not in df.columns:
+            df['event_id'] = [f"csv-{i}" for i in range(start_row, start_row + len(df))]
             
-            # Enforce Schema & Metadata
-            standardized_events = []
-            for e in events:
-                std_event = {
-                    'event_id': str(e.get('event_id', f"unknown-{np.random.randint(99999)}")),
-                    'content': str(e.get('content', '')),
-                    'source': str(e.get('source', 'unknown')),
-                    'timestamp': e.get('timestamp'),
-                    'region': str(e.get('region', 'Global')),
-                    'metadata': {
-                        'synthetic': True,  # CRITICAL Governance Flag
-                        'original_source_file': os.path.basename(file_path)
-                    }
+        # Convert timestamps
+        if 'timestamp' in df.columns:
+            df['timestamp'] = pd.to_datetime(df['timestamp']).map(lambda x: x.isoformat())
+        else:
+            df['timestamp'] = datetime.now().isoformat()
+        
+        # Convert to list of dicts
+        events = df.to_dict('records')
+        
+        # Enforce Schema & Metadata
+        standardized_events = []
+        for e in events:
+            std_event = {
+                'event_id': str(e.get('event_id', f"unknown-{np.random.randint(99999)}")),
+                'content': str(e.get('content', '')),
+                'source': str(e.get('source', 'unknown')),
+                'timestamp': e.get('timestamp'),
+                'region': str(e.get('region', 'Global')),
+                'metadata': {
+                    'synthetic': True,  # CRITICAL Governance Flag
+                    'original_source_file': os.path.basename(file_path)
                 }
-                standardized_events.append(std_event)
-                
-            return standardized_events
+            }
+            standardized_events.append(std_event)
             
-        except Exception as e:
-            print(f"Error loading CSV: {e}")
-            return []
+        return standardized_events
 
 # Singleton
 _loader = DataLoader()
 
 def load_csv_events(file_path: str) -> List[Dict[str, Any]]:
     return _loader.load_csv_events(file_path)
+
+def iter_csv_events(file_path: str, chunk_size: int = None, skip_rows: int = 0) -> Iterator[List[Dict[str, Any]]]:
+    return _loader.iter_csv_events(file_path, chunk_size, skip_rows)
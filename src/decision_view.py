@@ -0,0 +1,140 @@
+"""
+Decision View - Current Decision per Cluster
+============================================
+Materialized view over the audit CSV trail: cluster_id -> latest decision,
+decider and timestamp.
+
+The trail itself is append-only. PENDING records and DECISION_UPDATE rows
+are never rewritten, so answering "what is this cluster's state" from the
+log means folding the whole trail. This view does that fold once,
+incrementally (see trail_view.py): updated by AuditLogger on every write,
+persisted to decision_view.json, and caught up from the CSV on startup.
+
+Lookups and per-decision counts are O(1); listing a decision's clusters
+is O(matches).
+
+Responsible AI Mapping:
+- Human Oversight: Pending decisions are visible at a glance
+- Auditability: The view is derived from, and rebuildable from, the audit trail
+"""
+
+import csv
+import os
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+from trail_view import TrailView, is_decision_update
+
+
+@dataclass
+class DecisionState:
+    """Latest decision for one cluster."""
+    cluster_id: str
+    decision: str
+    decided_by: str
+    decided_at: str
+    record_id: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+class DecisionView(TrailView):
+    """
+    In-memory cluster -> DecisionState map with a persisted snapshot.
+    """
+    
+    COLUMNS = ("record_id", "cluster_id", "timestamp", "signal_category", "human_decision", "human_user")
+    
+    def __init__(self, csv_path: str, snapshot_path: str):
+        """
+        Args:
+            csv_path: Audit CSV trail the view folds
+            snapshot_path: Persisted snapshot (JSON)
+        """
+        self._states: Dict[str, DecisionState] = {}
+        self._by_decision: Dict[str, set] = {}
+        
+        # Called with the new state for each human decision folded after
+        # startup (this process's writes and rows caught up from others)
+        self.on_decision: Optional[Callable[[DecisionState], None]] = None
+        super().__init__(csv_path, snapshot_path)
+    
+    def _fold(self, row: Dict[str, str]):
+        """Make the row the cluster's current state, keeping the per-decision index in step."""
+        cluster_id = row.get("cluster_id")
+        if not cluster_id:
+            return
+        state = DecisionState(
+            cluster_id=cluster_id,
+            decision=row.get("human_decision", ""),
+            decided_by=row.get("human_user", ""),
+            decided_at=row.get("timestamp", ""),
+            record_id=row.get("record_id", "")
+        )
+        previous = self._states.get(cluster_id)
+        if previous is not None:
+            self._by_decision.get(previous.decision, set()).discard(cluster_id)
+        self._states[cluster_id] = state
+        self._by_decision.setdefault(state.decision, set()).add(cluster_id)
+        if self.on_decision is not None and is_decision_update(row):
+            self.on_decision(state)
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        return {"clusters": [s.to_dict() for s in self._states.values()]}
+    
+    def _restore(self, snapshot: Dict[str, Any]):
+        for state in snapshot.get("clusters", []):
+            self._fold({
+                "cluster_id": state["cluster_id"],
+                "human_decision": state["decision"],
+                "human_user": state["decided_by"],
+                "timestamp": state["decided_at"],
+                "record_id": state["record_id"]
+            })
+    
+    def get(self, cluster_id: str) -> Optional[DecisionState]:
+        """Current decision for a cluster (None if never logged)."""
+        with self._lock:
+            return self._states.get(cluster_id)
+    
+    def clusters_with(self, decision: str) -> List[DecisionState]:
+        """Clusters whose latest decision is `decision`, most recent first."""
+        with self._lock:
+            states = [self._states[cid] for cid in self._by_decision.get(decision, ())]
+        return sorted(states, key=lambda s: s.decided_at, reverse=True)
+    
+    def pending(self) -> List[DecisionState]:
+        """Clusters still awaiting a human decision."""
+        return self.clusters_with("PENDING")
+    
+    def counts(self) -> Dict[str, int]:
+        """Number of clusters per current decision."""
+        with self._lock:
+            return {decision: len(ids) for decision, ids in self._by_decision.items() if ids}
+
+
+if __name__ == "__main__":
+    # Demo
+    import tempfile
+    
+    headers = ["record_id", "cluster_id", "timestamp", "human_decision", "human_user"]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "audit.csv")
+        snapshot_path = os.path.join(tmp, "decision_view.json")
+        rows = [
+            {"record_id": "AUD-1", "cluster_id": "FRD-01", "timestamp": "2026-01-30T10:00:00", "human_decision": "PENDING", "human_user": "system"},
+            {"record_id": "AUD-2", "cluster_id": "SVC-01", "timestamp": "2026-01-30T10:00:00", "human_decision": "PENDING", "human_user": "system"},
+            {"record_id": "AUD-3", "cluster_id": "FRD-01", "timestamp": "2026-01-30T10:05:00", "human_decision": "APPROVED", "human_user": "reviewer_01"},
+        ]
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            writer.writeheader()
+            writer.writerows(rows)
+        
+        view = DecisionView(csv_path, snapshot_path)
+        print(f"FRD-01: {view.get('FRD-01')}")
+        print(f"Pending: {[s.cluster_id for s in view.pending()]}")
+        print(f"Counts: {view.counts()}")
@@ -0,0 +1,288 @@
+"""
+Event Bus - Push Updates to Subscribers
+=======================================
+In-process publish/subscribe for analyst-card and decision events, served
+to frontends over SSE (GET /events) and WebSocket (/ws/events).
+
+Event types:
+- card.created / card.updated: an analyst card (published by the pipeline)
+- decision: a cluster's new human decision (published by the audit logger)
+- resync: sent to a subscriber that lost updates; refetch current state
+
+Fan-out:
+- publish() is O(subscribers) dict inserts; nothing is serialized for an
+  event until a subscriber takes it, and then only once for all of them
+- Each subscriber has its own pending map keyed by (type, cluster_id). A
+  slow subscriber that has not taken an event yet gets only the latest
+  version of it (coalescing); past MAX_PENDING keys the oldest are
+  dropped and the subscriber is sent "resync"
+- The last REPLAY_SIZE events are kept, so a reconnecting SSE client
+  (Last-Event-ID) misses nothing if it was gone briefly
+
+Subscribers wait either on a thread (wait()) or on an asyncio loop
+(wait_async()); publishers may be any thread.
+
+Responsible AI Mapping:
+- Human Oversight: Analysts see new risks and colleagues' decisions immediately
+- Transparency: Subscribers are told explicitly when they missed updates
+"""
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class BusEvent:
+    """A published event; data may be a zero-argument callable, resolved on first delivery."""
+    seq: int
+    type: str
+    key: str
+    data: Any
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    _json: Optional[str] = field(default=None, repr=False)
+    
+    def to_json(self) -> str:
+        """The event as JSON (built once, shared by every subscriber)."""
+        if self._json is None:
+            data = self.data() if callable(self.data) else self.data
+            self._json = json.dumps(
+                {"id": self.seq, "type": self.type, "key": self.key, "timestamp": self.timestamp, "data": data},
+                default=str
+            )
+        return self._json
+    
+    def sse_frame(self) -> str:
+        """The event as one server-sent-events frame."""
+        return f"id: {self.seq}\nevent: {self.type}\ndata: {self.to_json()}\n\n"
+
+
+class Subscription:
+    """
+    One subscriber's pending events, coalesced per (type, key).
+    """
+    
+    def __init__(self, bus: 'EventBus', max_pending: int, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.bus = bus
+        self.max_pending = max_pending
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self._pending: "OrderedDict[Tuple[str, str], BusEvent]" = OrderedDict()
+        self._resync = False
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._loop = loop
+        self._async_ready = asyncio.Event() if loop is not None else None
+    
+    def _offer(self, event: BusEvent):
+        """Queue an event, replacing an undelivered one for the same (type, key)."""
+        key = (event.type, event.key)
+        with self._lock:
+            was_empty = not self._pending and not self._resync
+            if self._pending.pop(key, None) is not None:
+                self.coalesced += 1
+            self._pending[key] = event
+            if len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+                self._resync = True
+            if was_empty:
+                self._ready.notify_all()
+                if self._loop is not None:
+                    try:
+                        self._loop.call_soon_threadsafe(self._async_ready.set)
+                    except RuntimeError:  # Loop closed: the subscriber is gone
+                        pass
+    
+    def _request_resync(self):
+        with self._lock:
+            self._resync = True
+            self._ready.notify_all()
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._async_ready.set)
+    
+    def drain(self) -> List[BusEvent]:
+        """Take all pending events, oldest first (a "resync" event first if updates were lost)."""
+        with self._lock:
+            events = list(self._pending.values())
+            self._pending.clear()
+            resync, self._resync = self._resync, False
+            if self._async_ready is not None:
+                self._async_ready.clear()
+        if resync:
+            events.insert(0, BusEvent(
+                seq=self.bus.last_seq, type="resync", key="",
+                data={"reason": "Updates were dropped; refetch current cards and decisions"}
+            ))
+        self.delivered += len(events)
+        return events
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block (thread) until events are pending; False on timeout."""
+        with self._ready:
+            if self._pending or self._resync:
+                return True
+            return self._ready.wait(timeout)
+    
+    async def wait_async(self, timeout: Optional[float] = None) -> bool:
+        """Wait (on the subscription's loop) until events are pending; False on timeout."""
+        with self._lock:
+            if self._pending or self._resync:
+                return True
+        try:
+            await asyncio.wait_for(self._async_ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """
+    Process-wide publish/subscribe hub with per-subscriber coalescing.
+    """
+    
+    # Undelivered (type, key) entries per subscriber before it must resync
+    MAX_PENDING = 1000
+    
+    # Recent events kept for Last-Event-ID replay
+    REPLAY_SIZE = 1000
+    
+    def __init__(self, max_pending: Optional[int] = None, replay_size: Optional[int] = None):
+        self.max_pending = max_pending or self.MAX_PENDING
+        self._lock = threading.Lock()
+        self._subscribers: List[Subscription] = []
+        self._replay: deque = deque(maxlen=replay_size or self.REPLAY_SIZE)
+        self._seq = 0
+        self._published = 0
+    
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+    
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+    
+    def publish(self, type: str, key: str, data: Any) -> BusEvent:
+        """
+        Publish an event to every subscriber.
+        
+        Args:
+            type: Event type (card.created, card.updated, decision)
+            key: Cluster ID; pending events with the same type and key coalesce
+            data: JSON-serializable payload, or a callable producing it on delivery
+        """
+        with self._lock:
+            self._seq += 1
+            self._published += 1
+            event = BusEvent(seq=self._seq, type=type, key=key, data=data)
+            self._replay.append(event)
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription._offer(event)
+        return event
+    
+    def subscribe(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        last_event_id: Optional[int] = None
+    ) -> Subscription:
+        """
+        Start receiving events.
+        
+        Args:
+            loop: Event loop of an asyncio subscriber (enables wait_async())
+            last_event_id: Replay events after this ID; if some of them are no
+                longer kept, the subscriber starts with "resync" instead
+        """
+        subscription = Subscription(self, self.max_pending, loop)
+        with self._lock:
+            self._subscribers.append(subscription)
+            if last_event_id is None or last_event_id >= self._seq:
+                # Nothing to replay; an ID ahead of ours is from an earlier server process
+                replay, complete = [], last_event_id is None or last_event_id == self._seq
+            else:
+                replay = [e for e in self._replay if e.seq > last_event_id]
+                complete = bool(replay) and replay[0].seq == last_event_id + 1
+            # Offered under the lock so no newer event gets in ahead of the replay
+            if not complete:
+                subscription._request_resync()
+            for event in replay:
+                subscription._offer(event)
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+    
+    def status(self) -> Dict[str, Any]:
+        """Subscriber and delivery counters."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            published, last_seq = self._published, self._seq
+        return {
+            "subscribers": len(subscribers),
+            "published": published,
+            "last_event_id": last_seq,
+            "pending": sum(len(s._pending) for s in subscribers),
+            "coalesced": sum(s.coalesced for s in subscribers),
+            "dropped": sum(s.dropped for s in subscribers)
+        }
+
+
+# Singleton
+_event_bus: Optional[EventBus] = None
+_event_bus_lock = threading.Lock()
+
+def get_event_bus() -> EventBus:
+    """Get the singleton EventBus."""
+    global _event_bus
+    if _event_bus is None:
+        with _event_bus_lock:
+            if _event_bus is None:
+                _event_bus = EventBus()
+    return _event_bus
+
+
+def publish(type: str, key: str, data: Any) -> BusEvent:
+    """Publish an event on the shared bus."""
+    return get_event_bus().publish(type, key, data)
+
+
+if __name__ == "__main__":
+    # Demo: a fast and a slow subscriber
+    import time
+    
+    bus = EventBus(max_pending=50)
+    fast = bus.subscribe()
+    slow = bus.subscribe()
+    
+    def publisher():
+        for i in range(200):
+            cluster_id = f"FRD-{i % 5:02d}"
+            bus.publish("card.updated", cluster_id, lambda i=i, c=cluster_id: {"cluster_id": c, "volume": i})
+            time.sleep(0.001)
+    
+    thread = threading.Thread(target=publisher)
+    thread.start()
+    received = 0
+    while thread.is_alive() or fast.wait(0):
+        if fast.wait(0.05):
+            received += len(fast.drain())
+    thread.join()
+    
+    print(f"Fast subscriber: {received} events")
+    print(f"Slow subscriber (reads once at the end): {[json.loads(e.to_json())['data'] for e in slow.drain()]}")
+    print(f"Bus: {bus.status()}")
+    
+    late = bus.subscribe(last_event_id=195)
+    print(f"Replay after 195: {[e.seq for e in late.drain()]}")
@@ -0,0 +1,209 @@
+"""
+Event Deduplicator - Stage 0.5: Duplicate Collapse
+==================================================
+Collapses identical and near-identical events into weighted representatives
+before classification, so work scales with distinct content, not raw volume.
+
+Each representative keeps:
+- multiplicity: number of raw events it stands for
+- member_event_ids: event IDs of every collapsed member (itself first)
+- sources: distinct sources of its members, so a burst from one source
+  still reads as single-source evidence downstream (risk scoring)
+- first_seen / last_seen: earliest and latest member timestamp, so a
+  cluster's time window covers every collapsed copy
+
+Near-duplicates are events whose content matches after normalization
+(case, URLs, @mentions, punctuation and whitespace are ignored). This is
+the typical shape of bot amplification: the same text with a different
+link, handle or trailing tag.
+
+Responsible AI Mapping:
+- Reliability: Amplification bursts cannot starve the pipeline
+- Transparency: Every collapsed event ID stays traceable through its representative
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _parse_time(ts: Any) -> Optional[datetime]:
+    """ISO timestamp as naive UTC (None if missing or unparseable)."""
+    if not isinstance(ts, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.replace(tzinfo=None) - (parsed.utcoffset() or timedelta(0))
+    return parsed
+
+
+def time_range(*timestamps: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """Earliest and latest of some ISO timestamps (unparseable ones are ignored)."""
+    parsed = []
+    for ts in timestamps:
+        t = _parse_time(ts)
+        if t is not None:
+            parsed.append((t, ts))
+    if not parsed:
+        return None, None
+    return min(parsed)[1], max(parsed)[1]
+
+
+def event_sources(event: Dict[str, Any]) -> List[str]:
+    """Distinct sources an event (or an earlier representative) stands for."""
+    if event.get('sources'):
+        return list(event['sources'])
+    return [str(event['source'])] if event.get('source') else []
+
+
+@dataclass
+class DeduplicationResult:
+    """Result of collapsing a batch of events."""
+    events: List[Dict[str, Any]]  # Representatives, in first-seen order
+    input_count: int
+    exact_duplicates: int
+    near_duplicates: int
+    
+    @property
+    def distinct_count(self) -> int:
+        return len(self.events)
+    
+    @property
+    def collapsed_count(self) -> int:
+        return self.exact_duplicates + self.near_duplicates
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "input_events": self.input_count,
+            "distinct_events": self.distinct_count,
+            "exact_duplicates": self.exact_duplicates,
+            "near_duplicates": self.near_duplicates,
+            "collapse_ratio": round(self.collapsed_count / max(self.input_count, 1), 4)
+        }
+
+
+class EventDeduplicator:
+    """
+    Collapses duplicate events into representatives with a multiplicity.
+    The first event seen for a piece of content becomes its representative.
+    """
+    
+    # Stripped before comparing content
+    URL_PATTERN = re.compile(r'https?://\S+|www\.\S+')
+    MENTION_PATTERN = re.compile(r'@\w+')
+    PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+    
+    def __init__(self, near_duplicates: bool = True):
+        self.near_duplicates = near_duplicates
+    
+    def normalize(self, content: str) -> str:
+        """Normalize content for near-duplicate comparison."""
+        if not self.near_duplicates:
+            return content
+        text = content.lower()
+        text = self.URL_PATTERN.sub(' ', text)
+        text = self.MENTION_PATTERN.sub(' ', text)
+        text = self.PUNCTUATION_PATTERN.sub(' ', text)
+        return self.WHITESPACE_PATTERN.sub(' ', text).strip()
+    
+    def content_key(self, event: Dict[str, Any]) -> str:
+        """Grouping key for an event."""
+        return self.normalize(str(event.get('content', '') or ''))
+    
+    def deduplicate(
+        self,
+        events: List[Dict[str, Any]],
+        index: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> DeduplicationResult:
+        """
+        Collapse duplicates in a batch.
+        
+        Args:
+            events: Event dictionaries (already validated/redacted)
+            index: Optional content_key -> representative mapping, extended in place
+                   (lets callers collapse across micro-batches)
+        
+        Returns:
+            DeduplicationResult with the representatives created by this batch
+        """
+        if index is None:
+            index = {}
+        
+        representatives = []
+        exact = 0
+        near = 0
+        
+        for event in events:
+            event_id = str(event.get('event_id', 'unknown'))
+            key = self.content_key(event)
+            rep = index.get(key)
+            
+            if rep is None:
+                rep = dict(event)
+                rep['multiplicity'] = int(event.get('multiplicity', 1))
+                rep['member_event_ids'] = list(event.get('member_event_ids') or [event_id])
+                rep['sources'] = sorted(set(event_sources(event)))
+                rep['first_seen'], rep['last_seen'] = time_range(
+                    event.get('first_seen'), event.get('last_seen'), event.get('timestamp')
+                )
+                index[key] = rep
+                representatives.append(rep)
+                continue
+            
+            if event.get('content', '') == rep.get('content', ''):
+                exact += 1
+            else:
+                near += 1
+            rep['multiplicity'] += int(event.get('multiplicity', 1))
+            rep['member_event_ids'].extend(event.get('member_event_ids') or [event_id])
+            rep['sources'] = sorted(set(rep['sources']).union(event_sources(event)))
+            rep['first_seen'], rep['last_seen'] = time_range(
+                rep['first_seen'], rep['last_seen'],
+                event.get('first_seen'), event.get('last_seen'), event.get('timestamp')
+            )
+        
+        return DeduplicationResult(
+            events=representatives,
+            input_count=len(events),
+            exact_duplicates=exact,
+            near_duplicates=near
+        )
+
+
+# Singleton instance
+_deduplicator = None
+
+def get_deduplicator() -> EventDeduplicator:
+    """Get the singleton EventDeduplicator instance."""
+    global _deduplicator
+    if _deduplicator is None:
+        _deduplicator = EventDeduplicator()
+    return _deduplicator
+
+
+# Convenience function
+def deduplicate_events(events: List[Dict[str, Any]]) -> DeduplicationResult:
+    """Collapse duplicate events into weighted representatives."""
+    return get_deduplicator().deduplicate(events)
+
+
+if __name__ == "__main__":
+    # Demo
+    events = [
+        {"event_id": "e1", "source": "Tweet", "timestamp": "2026-01-30T10:00:00", "content": "BREAKING: Mashreq ATMs empty! https://t.co/abc"},
+        {"event_id": "e2", "source": "Tweet", "timestamp": "2026-01-30T10:02:00", "content": "BREAKING: Mashreq ATMs empty! https://t.co/abc"},
+        {"event_id": "e3", "source": "Tweet", "timestamp": "2026-01-30T10:05:00", "content": "breaking - mashreq ATMs empty!! https://t.co/xyz @newsbot"},
+        {"event_id": "e4", "source": "Support Ticket", "content": "App login failing with error 500"},
+    ]
+    
+    result = deduplicate_events(events)
+    print(result.to_dict())
+    for rep in result.events:
+        print(f"{rep['event_id']}: x{rep['multiplicity']} {rep['member_event_ids']} {rep['sources']} "
+              f"{rep['first_seen']}..{rep['last_seen']} | {rep['content']}")
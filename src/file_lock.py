@@ -0,0 +1,160 @@
+"""
+File Lock - Inter-Process Advisory Locks
+========================================
+Lets separate processes (uvicorn workers, the Streamlit dashboard, the
+agent graph) append to the same files under data/ without interleaving
+partial rows.
+
+- FileLock: advisory lock on a sidecar "<file>.lock" (fcntl.flock on POSIX,
+  msvcrt.locking on Windows). Reentrant, and also serializes threads.
+- get_file_lock(): one shared FileLock per path per process, so nested
+  users in the same process never deadlock on their own lock
+- atomic_write_json(): write to a unique temp file, then os.replace, so
+  readers only ever see the old or the new contents
+
+Locks are advisory: every writer of a file must take its lock.
+
+Responsible AI Mapping:
+- Auditability: Audit rows from different processes are never torn or mixed
+- Reliability: Rewritten files are replaced atomically
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    Reentrant advisory lock on "<path>.lock", held across processes and threads.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: File to protect (the lock lives in a sidecar next to it)
+        """
+        self.path = Path(path)
+        self.lock_path = Path(f"{path}.lock")
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+    
+    def acquire(self):
+        """Block until this process holds the lock."""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    self._lock_fd(fd)
+                except BaseException:
+                    os.close(fd)
+                    raise
+                self._fd = fd
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+    
+    def release(self):
+        """Release one level of the lock."""
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                self._unlock_fd(fd)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+    
+    @staticmethod
+    def _lock_fd(fd: int):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            return
+        # msvcrt.locking gives up after ~10s of retries; keep waiting
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    
+    @staticmethod
+    def _unlock_fd(fd: int):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+# One lock per path per process
+_locks: Dict[str, FileLock] = {}
+_locks_lock = threading.Lock()
+
+def get_file_lock(path: str) -> FileLock:
+    """Get the process-wide FileLock for a path."""
+    key = os.path.abspath(path)
+    with _locks_lock:
+        if key not in _locks:
+            _locks[key] = FileLock(key)
+        return _locks[key]
+
+
+def atomic_write_json(path: str, data: Any, **dump_kwargs):
+    """Replace a JSON file atomically (unique temp file + os.replace)."""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+if __name__ == "__main__":
+    # Demo: several processes appending to one file under the lock
+    import multiprocessing
+    import tempfile
+    
+    def append_rows(path: str, worker: int, rows: int):
+        lock = get_file_lock(path)
+        for i in range(rows):
+            with lock, open(path, 'a') as f:
+                f.write(f"worker-{worker},row-{i}," + "x" * 500 + "\n")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "shared.csv")
+        workers = [multiprocessing.Process(target=append_rows, args=(path, w, 500)) for w in range(4)]
+        for p in workers:
+            p.start()
+        for p in workers:
+            p.join()
+        
+        with open(path) as f:
+            lines = f.read().splitlines()
+        torn = [line for line in lines if not line.endswith("x" * 500)]
+        print(f"Rows: {len(lines)} (expected 2000), torn rows: {len(torn)}")
+        
+        atomic_write_json(os.path.join(tmp, "state.json"), {"rows": len(lines)})
+        print(f"Atomic write: {open(os.path.join(tmp, 'state.json')).read()}")
@@ -0,0 +1,524 @@
+"""
+Job Queue - Background Pipeline Runs
+====================================
+Runs long pipeline jobs (CSV backfills) off the request path.
+
+- submit() returns a Job immediately; a bounded worker pool runs it
+- Progress (stage, events processed, estimated total, ETA) is updated as
+  the pipeline reports it; clients poll get() or follow watch()
+- Results are cached by the input file's SHA-256 and mtime, so rerunning
+  an unchanged file returns the cached result without touching the pipeline
+- Runs over the same source file are coalesced: submitting one while
+  another is queued or running returns the existing job
+
+Job state is written to data/jobs/<job_id>.json, so any API worker process
+can answer a poll. A file's hash is remembered together with its size and
+mtime; while those match, the file is not re-read to find its cache entry.
+
+Responsible AI Mapping:
+- Reliability: Long backfills are not killed by HTTP timeouts
+- Transparency: Every run reports its stage and progress
+- Auditability: A cached rerun writes no duplicate audit records
+"""
+
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from file_lock import atomic_write_json
+
+
+# Reports (stage, rows_processed); see ResponsibleAIPipeline.process_file
+ProgressCallback = Callable[[str, int], None]
+
+
+class JobQueueFull(RuntimeError):
+    """Raised by submit() when MAX_QUEUED jobs are already waiting."""
+
+
+@dataclass
+class SourceFingerprint:
+    """Identity of an input file: content hash plus the stat fields it was taken at."""
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    rows: int  # Data rows (line count minus header); an estimate if fields contain newlines
+    
+    @property
+    def cache_key(self) -> str:
+        return f"{self.sha256}-{self.mtime_ns}"
+    
+    def matches(self, stat: os.stat_result) -> bool:
+        """True if the file still has the size and mtime this fingerprint was taken at."""
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+
+def fingerprint_file(path: str, block_size: int = 1 << 20) -> SourceFingerprint:
+    """Hash a file and count its lines in one pass."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    digest = hashlib.sha256()
+    lines = 0
+    last = b""
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            digest.update(block)
+            lines += block.count(b"\n")
+            last = block
+    if last and not last.endswith(b"\n"):
+        lines += 1
+    return SourceFingerprint(
+        path=path,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        sha256=digest.hexdigest(),
+        rows=max(lines - 1, 0)
+    )
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process is still running (always True where it cannot be checked)."""
+    if os.name != "posix" or not pid:
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+@dataclass
+class Job:
+    """A background run and its progress."""
+    job_id: str
+    kind: str
+    source_path: Optional[str] = None
+    status: str = "queued"  # queued, running, succeeded, failed, cancelled, interrupted
+    stage: str = "queued"
+    events_processed: int = 0
+    total_events: Optional[int] = None
+    eta_seconds: Optional[float] = None
+    cache_hit: bool = False
+    cache_key: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    submitted_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    pid: int = field(default_factory=os.getpid)
+    version: int = 0
+    
+    FINISHED = ("succeeded", "failed", "cancelled", "interrupted")
+    
+    @property
+    def finished(self) -> bool:
+        return self.status in self.FINISHED
+    
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = asdict(self)
+        if not include_result:
+            data.pop("result")
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Job':
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+class JobQueue:
+    """
+    Bounded worker pool for pipeline runs, with progress tracking and a result cache.
+    """
+    
+    # Concurrent jobs
+    MAX_WORKERS = 2
+    
+    # Jobs allowed to wait for a worker before submit() refuses more
+    MAX_QUEUED = 16
+    
+    # Finished jobs kept in memory and on disk
+    MAX_JOBS = 200
+    
+    # Cached results kept on disk (oldest evicted first)
+    MAX_CACHED_RESULTS = 16
+    
+    # Minimum seconds between job file writes while a job is running
+    PERSIST_INTERVAL_SECONDS = 0.5
+    
+    def __init__(
+        self,
+        directory: str,
+        max_workers: Optional[int] = None,
+        max_queued: Optional[int] = None
+    ):
+        """
+        Args:
+            directory: Where job state and cached results are kept
+            max_workers: Concurrent jobs
+            max_queued: Jobs allowed to wait for a worker
+        """
+        self.directory = Path(directory)
+        self.results_dir = self.directory / "results"
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.fingerprints_path = self.directory / "fingerprints.json"
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.max_queued = self.MAX_QUEUED if max_queued is None else max_queued
+        
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pipeline-job")
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active: Dict[str, str] = {}  # source path -> job_id of its queued/running job
+        self._persisted_at: Dict[str, float] = {}
+        self._fingerprints: Dict[str, SourceFingerprint] = {}
+        self._load_fingerprints()
+    
+    # --- Fingerprints and result cache ---
+    
+    def _load_fingerprints(self):
+        """Read the fingerprints file (shared by all processes using the directory)."""
+        try:
+            with open(self.fingerprints_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        with self._lock:
+            for path, fp in data.items():
+                self._fingerprints[path] = SourceFingerprint(**fp)
+    
+    def _known_fingerprint(self, path: str) -> Optional[SourceFingerprint]:
+        """Fingerprint of a file whose size and mtime have not changed since it was hashed."""
+        stat = os.stat(path)
+        fp = self._fingerprints.get(path)
+        if fp is None or not fp.matches(stat):
+            # Another process may have hashed it since
+            self._load_fingerprints()
+            fp = self._fingerprints.get(path)
+        return fp if fp is not None and fp.matches(stat) else None
+    
+    def _remember_fingerprint(self, fp: SourceFingerprint):
+        with self._lock:
+            self._fingerprints[fp.path] = fp
+            snapshot = {path: asdict(f) for path, f in self._fingerprints.items()}
+        atomic_write_json(self.fingerprints_path, snapshot)
+    
+    def _result_path(self, cache_key: str) -> Path:
+        return self.results_dir / f"{cache_key}.json"
+    
+    def _cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._result_path(cache_key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+    
+    def _cache_result(self, cache_key: str, result: Dict[str, Any]):
+        atomic_write_json(self._result_path(cache_key), result)
+        cached = sorted(self.results_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in cached[:-self.MAX_CACHED_RESULTS]:
+            path.unlink(missing_ok=True)
+    
+    # --- Job state ---
+    
+    def _job_path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.json"
+    
+    def _update(self, job: Job, **changes):
+        """Apply changes to a job, wake watchers and persist it (throttled while running)."""
+        with self._changed:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.version += 1
+            if job.finished and self._active.get(job.source_path) == job.job_id:
+                del self._active[job.source_path]
+            self._changed.notify_all()
+            
+            now = time.monotonic()
+            due = job.finished or now - self._persisted_at.get(job.job_id, 0.0) >= self.PERSIST_INTERVAL_SECONDS
+            if due:
+                self._persisted_at[job.job_id] = now
+                data = job.to_dict()
+        if due:
+            atomic_write_json(self._job_path(job.job_id), data)
+    
+    def _add(self, job: Job):
+        """Register a new job, evicting the oldest finished jobs beyond MAX_JOBS."""
+        with self._lock:
+            self._jobs[job.job_id] = job
+            finished = [j for j in self._jobs.values() if j.finished]
+            for old in finished[:max(len(self._jobs) - self.MAX_JOBS, 0)]:
+                del self._jobs[old.job_id]
+                self._persisted_at.pop(old.job_id, None)
+                self._job_path(old.job_id).unlink(missing_ok=True)
+        atomic_write_json(self._job_path(job.job_id), job.to_dict())
+    
+    @staticmethod
+    def _new_job_id() -> str:
+        return f"JOB-{datetime.now().strftime('%Y%m%d%H%M%S')}-{secrets.token_hex(3)}"
+    
+    # --- Public API ---
+    
+    def submit(
+        self,
+        kind: str,
+        run: Callable[[ProgressCallback], Dict[str, Any]],
+        source_path: str,
+        use_cache: bool = True
+    ) -> Job:
+        """
+        Queue a run over a source file.
+        
+        Args:
+            kind: Job type, for display (e.g. "run-from-csv")
+            run: Does the work; called as run(progress) on a worker thread and
+                returns a JSON-serializable result
+            source_path: Input file (cache key and coalescing key)
+            use_cache: Return a cached result for an unchanged file, and skip
+                the run if one turns up once the file is hashed
+        
+        Returns:
+            The new job, an already finished cache hit, or the job already
+            queued/running for the same file
+        
+        Raises:
+            FileNotFoundError: If the source file does not exist
+            JobQueueFull: If MAX_QUEUED jobs are already waiting
+        """
+        source_path = os.path.abspath(source_path)
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"Source file not found: {source_path}")
+        
+        with self._lock:
+            active = self._active.get(source_path)
+            if active is not None:
+                return self._jobs[active]
+        
+        job = Job(job_id=self._new_job_id(), kind=kind, source_path=source_path)
+        
+        if use_cache:
+            fp = self._known_fingerprint(source_path)
+            result = self._cached_result(fp.cache_key) if fp else None
+            if result is not None:
+                now = datetime.now().isoformat()
+                job.status = job.stage = "succeeded"
+                job.cache_hit = True
+                job.cache_key = fp.cache_key
+                job.events_processed = job.total_events = result.get("events_processed", fp.rows)
+                job.eta_seconds = 0.0
+                job.result = result
+                job.started_at = job.finished_at = now
+                self._add(job)
+                return job
+        
+        with self._lock:
+            active = self._active.get(source_path)
+            if active is not None:
+                return self._jobs[active]
+            queued = sum(1 for j in self._jobs.values() if j.status == "queued")
+            if queued >= self.max_queued:
+                raise JobQueueFull(f"{queued} jobs are already queued; try again later")
+            self._active[source_path] = job.job_id
+        
+        self._add(job)
+        self._executor.submit(self._run, job, run, use_cache)
+        return job
+    
+    def _run(self, job: Job, run: Callable[[ProgressCallback], Dict[str, Any]], use_cache: bool):
+        """Worker: hash the source, answer from the cache or run the job."""
+        try:
+            self._update(job, status="running", stage="hashing", started_at=datetime.now().isoformat())
+            fp = self._known_fingerprint(job.source_path)
+            if fp is None:
+                fp = fingerprint_file(job.source_path)
+                self._remember_fingerprint(fp)
+            self._update(job, cache_key=fp.cache_key, total_events=fp.rows)
+            
+            result = self._cached_result(fp.cache_key) if use_cache else None
+            if result is not None:
+                self._update(
+                    job, status="succeeded", stage="succeeded", cache_hit=True, result=result,
+                    events_processed=result.get("events_processed", fp.rows), eta_seconds=0.0,
+                    finished_at=datetime.now().isoformat()
+                )
+                return
+            
+            started = time.monotonic()
+            first_rows: List[int] = []
+            
+            def progress(stage: str, rows: int):
+                if not first_rows:
+                    first_rows.append(rows)
+                    eta = None
+                else:
+                    rate = (rows - first_rows[0]) / max(time.monotonic() - started, 1e-6)
+                    eta = round((fp.rows - rows) / rate, 1) if rate > 0 and fp.rows >= rows else None
+                self._update(job, stage=stage, events_processed=rows, eta_seconds=eta)
+            
+            self._update(job, stage="processing")
+            result = run(progress)
+            
+            # Only cache if the file did not change under the run
+            if fp.matches(os.stat(job.source_path)):
+                self._cache_result(fp.cache_key, result)
+            self._update(
+                job, status="succeeded", stage="succeeded", result=result,
+                events_processed=result.get("events_processed", job.events_processed),
+                eta_seconds=0.0, finished_at=datetime.now().isoformat()
+            )
+        except Exception as e:
+            self._update(
+                job, status="failed", stage="failed", error=str(e),
+                error_type=type(e).__name__, eta_seconds=None,
+                finished_at=datetime.now().isoformat()
+            )
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        A job by ID (from this process, or from the job file another process wrote).
+        A job whose owning process has exited before it finished is reported "interrupted".
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return Job.from_dict(job.to_dict())
+        
+        try:
+            with open(self._job_path(job_id), 'r', encoding='utf-8') as f:
+                job = Job.from_dict(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not job.finished and not _pid_alive(job.pid):
+            job.status = "interrupted"
+            job.error = "The process running this job exited; resubmit with resume=true"
+        return job
+    
+    def list(self) -> List[Dict[str, Any]]:
+        """Jobs known to this process, newest first (without results)."""
+        with self._lock:
+            return [j.to_dict(include_result=False) for j in reversed(self._jobs.values())]
+    
+    def _wait_for_change(self, job_id: str, version: int, timeout: float):
+        """Sleep until a local job moves past `version` (remote jobs: just sleep)."""
+        with self._changed:
+            local = self._jobs.get(job_id)
+            if local is None or (local.version == version and not local.finished):
+                self._changed.wait(timeout)
+    
+    def wait(self, job_id: str, timeout: Optional[float] = None, poll_seconds: float = 1.0) -> Optional[Job]:
+        """Block until a job finishes (or timeout); returns its latest state."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job.finished:
+                return job
+            remaining = poll_seconds if deadline is None else deadline - time.monotonic()
+            if remaining <= 0:
+                return job
+            self._wait_for_change(job_id, job.version, min(poll_seconds, remaining))
+    
+    def watch(self, job_id: str, poll_seconds: float = 1.0) -> Iterator[Job]:
+        """
+        Yield a job's state each time it changes, ending once it has finished.
+        Jobs run by another process are followed by polling their job file.
+        """
+        version = -1
+        while True:
+            job = self.get(job_id)
+            if job is None:
+                return
+            if job.version != version or job.finished:
+                version = job.version
+                yield job
+            if job.finished:
+                return
+            self._wait_for_change(job_id, version, poll_seconds)
+    
+    def status(self) -> Dict[str, Any]:
+        """Pool and cache status."""
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "max_workers": self.max_workers,
+            "max_queued": self.max_queued,
+            "jobs": counts,
+            "cached_results": len(list(self.results_dir.glob("*.json")))
+        }
+    
+    def shutdown(self, wait: bool = False):
+        """Stop accepting work and cancel jobs that have not started."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            queued = [j for j in self._jobs.values() if j.status == "queued"]
+        for job in queued:
+            self._update(job, status="cancelled", stage="cancelled", finished_at=datetime.now().isoformat())
+
+
+# Singleton
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = threading.Lock()
+
+def get_job_queue() -> JobQueue:
+    """Get the singleton JobQueue (pool size from JOB_WORKERS / JOB_QUEUE_LIMIT)."""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                workers = os.getenv("JOB_WORKERS")
+                limit = os.getenv("JOB_QUEUE_LIMIT")
+                _job_queue = JobQueue(
+                    "data/jobs",
+                    max_workers=int(workers) if workers else None,
+                    max_queued=int(limit) if limit else None
+                )
+    return _job_queue
+
+
+if __name__ == "__main__":
+    # Demo: a slow job over a temp file, then a cached rerun
+    import tempfile
+    
+    def slow_count(path: str) -> Callable[[ProgressCallback], Dict[str, Any]]:
+        def run(progress: ProgressCallback) -> Dict[str, Any]:
+            with open(path) as f:
+                rows = sum(1 for _ in f) - 1
+            for done in range(0, rows + 1, 250):
+                time.sleep(0.05)
+                progress("processing", done)
+            return {"events_processed": rows}
+        return run
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "events.csv")
+        with open(source, 'w') as f:
+            f.write("text\n" + "".join(f"event {i}\n" for i in range(1000)))
+        
+        jobs = JobQueue(os.path.join(tmp, "jobs"))
+        job = jobs.submit("count", slow_count(source), source)
+        print(f"Submitted {job.job_id} ({job.status})")
+        for state in jobs.watch(job.job_id, poll_seconds=0.1):
+            eta = f", eta {state.eta_seconds}s" if state.eta_seconds is not None else ""
+            print(f"  {state.stage}: {state.events_processed}/{state.total_events}{eta}")
+        
+        start = time.perf_counter()
+        rerun = jobs.submit("count", slow_count(source), source)
+        print(f"Rerun: {rerun.status}, cache_hit={rerun.cache_hit} in {(time.perf_counter() - start) * 1000:.1f}ms")
+        jobs.shutdown()
@@ -24,6 +24,8 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional, Any
 from collections import defaultdict
 
+from event_deduplicator import event_sources
+
 
 @dataclass
 class ClassificationResult:
@@ -34,6 +36,12 @@ class ClassificationResult:
     class_probabilities: Dict[str, float]
     top_keywords: List[Tuple[str, float]]  # (keyword, contribution)
     raw_text: str
+    timestamp: Optional[str] = None  # Event timestamp, carried for windowed clustering
+    multiplicity: int = 1  # Raw events this result stands for (duplicate collapse)
+    member_event_ids: List[str] = field(default_factory=list)
+    sources: List[str] = field(default_factory=list)  # Distinct sources of the members
+    first_seen: Optional[str] = None  # Earliest / latest member timestamp
+    last_seen: Optional[str] = None
 
 
 @dataclass
@@ -260,7 +268,13 @@ class NaiveBayesClassifier:
             confidence=confidence,
             class_probabilities=probabilities,
             top_keywords=top_keywords,
-            raw_text=content
+            raw_text=content,
+            timestamp=event.get('timestamp'),
+            multiplicity=int(event.get('multiplicity', 1)),
+            member_event_ids=list(event.get('member_event_ids') or [event_id]),
+            sources=sorted(set(event_sources(event))),
+            first_seen=event.get('first_seen', event.get('timestamp')),
+            last_seen=event.get('last_seen', event.get('timestamp'))
         )
     
     def classify_batch(self, events: List[Dict[str, Any]]) -> BatchClassificationResult:
@@ -275,13 +289,15 @@ class NaiveBayesClassifier:
         """
         results = [self.classify(event) for event in events]
         
-        # Calculate class distribution
+        # Calculate class distribution (collapsed duplicates count once per member)
         class_distribution = defaultdict(int)
         for result in results:
-            class_distribution[result.predicted_class] += 1
+            class_distribution[result.predicted_class] += result.multiplicity
         
         # Calculate average confidence
-        avg_confidence = np.mean([r.confidence for r in results]) if results else 0.0
+        avg_confidence = np.average(
+            [r.confidence for r in results], weights=[r.multiplicity for r in results]
+        ) if results else 0.0
         
         return BatchClassificationResult(
             results=results,
@@ -0,0 +1,214 @@
+"""
+NDJSON Stream - Streaming Ingestion over Newline-Delimited JSON
+===============================================================
+Feeds a newline-delimited JSON event stream (e.g. a chunked HTTP request
+body) through the StreamingPipelineRunner and turns its output into an
+NDJSON stream of analyst cards.
+
+- NDJSONDecoder: incremental line splitter + JSON parser over raw byte
+  chunks; a line longer than MAX_LINE_BYTES is rejected rather than buffered
+- stream_cards(): one "card" line per cluster as its window closes, a
+  "progress" line after each batch of cards, and a final "summary" line
+
+Memory per stream is bounded: the decoder holds at most one partial line,
+and the runner's stage queues hold at most QUEUE_SIZE micro-batches each.
+Input is only pulled when the runner needs more events, so a slow reader
+of the output (or a slow pipeline) stalls the upload instead of buffering it.
+
+Responsible AI Mapping:
+- Reliability: Unbounded streams cannot exhaust server memory
+- Transparency: Rejected lines are counted and reported, never silently dropped
+- Accountability: Streamed clusters are audited exactly as in batch mode
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from streaming_pipeline import StreamingPipelineRunner
+
+
+class NDJSONDecoder:
+    """
+    Incremental NDJSON decoder: feed() raw chunks, get back complete events.
+    """
+    
+    # Longest accepted line (bytes)
+    MAX_LINE_BYTES = 1 << 20
+    
+    # Rejected lines reported with their reason
+    MAX_ERRORS = 20
+    
+    def __init__(self, max_line_bytes: Optional[int] = None):
+        self.max_line_bytes = max_line_bytes or self.MAX_LINE_BYTES
+        self.lines = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.errors: List[Dict[str, Any]] = []
+        self._buffer = bytearray()
+        self._skipping = False  # Inside an over-long line: discard until its newline
+    
+    def _reject(self, reason: str):
+        self.rejected += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append({"line": self.lines, "error": reason})
+    
+    def _decode(self, line: bytes) -> Optional[Dict[str, Any]]:
+        self.lines += 1
+        line = line.strip()
+        if not line:
+            return None
+        if len(line) > self.max_line_bytes:
+            self._reject(f"Line longer than {self.max_line_bytes} bytes")
+            return None
+        try:
+            event = json.loads(line)
+        except (ValueError, UnicodeDecodeError) as e:
+            self._reject(f"Invalid JSON: {e}")
+            return None
+        if not isinstance(event, dict):
+            self._reject("Expected a JSON object")
+            return None
+        self.accepted += 1
+        return event
+    
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """Add a chunk of raw bytes; returns the events completed by it."""
+        events = []
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end < 0:
+                break
+            if self._skipping:
+                self._skipping = False
+            else:
+                self._buffer += chunk[start:end]
+                event = self._decode(bytes(self._buffer))
+                if event is not None:
+                    events.append(event)
+            self._buffer.clear()
+            start = end + 1
+        
+        if not self._skipping:
+            self._buffer += chunk[start:]
+            if len(self._buffer) > self.max_line_bytes:
+                self._buffer.clear()
+                self._skipping = True
+                self.lines += 1
+                self._reject(f"Line longer than {self.max_line_bytes} bytes")
+        return events
+    
+    def close(self) -> List[Dict[str, Any]]:
+        """Flush a final line that has no trailing newline."""
+        if self._skipping or not self._buffer:
+            return []
+        event = self._decode(bytes(self._buffer))
+        self._buffer.clear()
+        return [event] if event is not None else []
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "lines": self.lines,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "errors": list(self.errors)
+        }
+
+
+def iter_ndjson(chunks: Iterable[bytes], decoder: Optional[NDJSONDecoder] = None) -> Iterator[Dict[str, Any]]:
+    """Decode events lazily from an iterable of raw byte chunks."""
+    decoder = decoder or NDJSONDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+def _line(message: Dict[str, Any]) -> str:
+    return json.dumps(message, default=str) + "\n"
+
+
+def stream_cards(
+    chunks: Iterable[bytes],
+    runner: Optional[StreamingPipelineRunner] = None,
+    decoder: Optional[NDJSONDecoder] = None
+) -> Iterator[str]:
+    """
+    Run an NDJSON event stream through the streaming pipeline.
+    
+    Args:
+        chunks: Raw request body chunks (consumed lazily, from a runner thread)
+        runner: Streaming runner (a new one on the shared pipeline if None)
+        decoder: NDJSON decoder (defaults apply if None)
+    
+    Yields:
+        NDJSON lines: {"type": "card", "card": ...} per closed cluster,
+        {"type": "progress", ...} after each batch of cards, then
+        {"type": "summary", ...} (or {"type": "error", ...} if the run failed)
+    """
+    runner = runner or StreamingPipelineRunner()
+    decoder = decoder or NDJSONDecoder()
+    
+    def progress(stats: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "events_in": stats["events_in"],
+            "signals_surfaced": stats["signals_surfaced"],
+            "noise_archived": stats["noise_archived"],
+            "clusters_emitted": stats["clusters_emitted"],
+            "rejected_lines": decoder.rejected
+        }
+    
+    analyses = runner.run(iter_ndjson(chunks, decoder))
+    try:
+        emitted = 0
+        for analysis in analyses:
+            yield _line({"type": "card", "card": analysis.to_analyst_card()})
+            emitted += 1
+            # Cards closed together arrive back to back; report once per batch
+            stats = runner.stats.snapshot()
+            if emitted == stats["clusters_emitted"]:
+                yield _line({"type": "progress", **progress(stats)})
+    except Exception as e:
+        yield _line({"type": "error", "error": str(e.__cause__ or e), **progress(runner.stats.snapshot())})
+        return
+    finally:
+        analyses.close()
+    
+    stats = runner.stats.snapshot()
+    yield _line({
+        "type": "summary",
+        **progress(stats),
+        "micro_batches": stats["micro_batches"],
+        "duplicates_collapsed": stats["duplicates_collapsed"],
+        "windows_below_min_size": stats["windows_below_min_size"],
+        "late_events": stats["late_events"],
+        "validation_issues": stats["validation_issues"],
+        "input": decoder.stats()
+    })
+
+
+if __name__ == "__main__":
+    # Demo: stream NDJSON in uneven byte chunks, with one malformed line
+    from datetime import datetime, timedelta
+    
+    base = datetime(2026, 1, 30, 10, 0, 0)
+    texts = [
+        "CRITICAL: 500 Internal Server Error - Gateway Timeout",
+        "Got suspicious SMS about OTP, this is a scam!",
+    ]
+    body = "".join(
+        json.dumps({
+            "event_id": f"ndjson-{i}",
+            "content": texts[i % len(texts)],
+            "source": "Tweet",
+            "timestamp": (base + timedelta(seconds=9 * i)).isoformat()
+        }) + "\n"
+        for i in range(400)
+    ).encode() + b"{not json}\n"
+    chunks = (body[i:i + 1000] for i in range(0, len(body), 1000))
+    
+    for line in stream_cards(chunks, StreamingPipelineRunner(micro_batch_size=50)):
+        message = json.loads(line)
+        if message["type"] == "card":
+            print(f"card {message['card']['cluster_id']}: volume {message['card']['volume']}")
+        else:
+            print(message)
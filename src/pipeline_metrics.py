@@ -0,0 +1,224 @@
+"""
+Pipeline Metrics - Per-Stage Timing Instrumentation
+===================================================
+Lightweight timing spans wrapped around each pipeline stage.
+
+Each span records:
+- Wall time (ms)
+- CPU time (ms, process-wide so worker threads are included)
+- Items in / items out
+- Optional tracemalloc peak (KB)
+
+tracemalloc is process-global: tracing timers share one refcounted
+session (started by the first, stopped by the last), and a timer that
+overlapped another traced timer reports no peak, since the peak cannot
+be attributed to a single stage.
+
+Completed spans feed a rolling in-process histogram per stage.
+
+Responsible AI Mapping:
+- Transparency: Shows where processing time goes, stage by stage
+- Reliability: Rolling percentiles surface slow stages before they cause missed alerts
+"""
+
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+
+# Shared tracemalloc session across concurrent traced timers
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_owned = False
+_tracing_epoch = 0
+
+
+@dataclass
+class StageSpan:
+    """Timing record for one pipeline stage."""
+    stage: str
+    wall_ms: float
+    cpu_ms: float
+    items_in: int
+    items_out: int
+    peak_alloc_kb: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "stage": self.stage,
+            "wall_ms": round(self.wall_ms, 3),
+            "cpu_ms": round(self.cpu_ms, 3),
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "peak_alloc_kb": round(self.peak_alloc_kb, 1) if self.peak_alloc_kb is not None else None
+        }
+
+
+class StageTimer:
+    """
+    Context manager producing a StageSpan.
+    
+    Usage:
+        with StageTimer("classification", items_in=len(events)) as timer:
+            result = classify(events)
+            timer.items_out = len(result)
+        span = timer.span
+    """
+    
+    def __init__(self, stage: str, items_in: int = 0, trace_allocations: bool = False):
+        self.stage = stage
+        self.items_in = items_in
+        self.items_out = 0
+        self.trace_allocations = trace_allocations
+        self.span: Optional[StageSpan] = None
+        self._epoch: Optional[int] = None
+    
+    def __enter__(self) -> 'StageTimer':
+        global _tracing_users, _tracing_owned, _tracing_epoch
+        if self.trace_allocations:
+            with _tracing_lock:
+                if _tracing_users == 0 and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _tracing_owned = True
+                _tracing_users += 1
+                _tracing_epoch += 1
+                # Alone: the peak from here on is this stage's
+                self._epoch = _tracing_epoch if _tracing_users == 1 else None
+                if self._epoch is not None:
+                    tracemalloc.reset_peak()
+        
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        global _tracing_users, _tracing_owned
+        wall_ms = (time.perf_counter() - self._wall_start) * 1000
+        cpu_ms = (time.process_time() - self._cpu_start) * 1000
+        
+        peak_kb = None
+        if self.trace_allocations:
+            with _tracing_lock:
+                if self._epoch == _tracing_epoch:
+                    _, peak = tracemalloc.get_traced_memory()
+                    peak_kb = peak / 1024
+                _tracing_users -= 1
+                if _tracing_users == 0 and _tracing_owned:
+                    tracemalloc.stop()
+                    _tracing_owned = False
+        
+        self.span = StageSpan(
+            stage=self.stage,
+            wall_ms=wall_ms,
+            cpu_ms=cpu_ms,
+            items_in=self.items_in,
+            items_out=self.items_out,
+            peak_alloc_kb=peak_kb
+        )
+        return False
+
+
+class StageHistogram:
+    """
+    Rolling per-stage latency histogram.
+    Keeps the most recent WINDOW_SIZE spans for each stage.
+    """
+    
+    # Number of recent spans kept per stage
+    WINDOW_SIZE = 500
+    
+    # Histogram bucket upper bounds (ms); the last bucket is open-ended
+    BUCKET_BOUNDS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000]
+    
+    def __init__(self, window_size: int = None):
+        self.window_size = window_size or self.WINDOW_SIZE
+        self._spans: Dict[str, Deque[StageSpan]] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, spans: List[StageSpan]):
+        """Add completed spans to the rolling window."""
+        with self._lock:
+            for span in spans:
+                window = self._spans.get(span.stage)
+                if window is None:
+                    window = deque(maxlen=self.window_size)
+                    self._spans[span.stage] = window
+                window.append(span)
+    
+    def _percentile(self, sorted_values: List[float], pct: float) -> float:
+        """Nearest-rank percentile of a sorted list."""
+        if not sorted_values:
+            return 0.0
+        index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+        return sorted_values[index]
+    
+    def _bucket_counts(self, values: List[float]) -> Dict[str, int]:
+        """Count values per bucket."""
+        labels = [f"<={b}ms" for b in self.BUCKET_BOUNDS_MS] + [f">{self.BUCKET_BOUNDS_MS[-1]}ms"]
+        counts = [0] * len(labels)
+        for v in values:
+            counts[bisect_left(self.BUCKET_BOUNDS_MS, v)] += 1
+        return dict(zip(labels, counts))
+    
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-stage latency summary.
+        
+        Returns:
+            Mapping of stage name to count, mean/p50/p95/max wall time,
+            mean wall time per input item, mean CPU time, and bucket counts
+        """
+        with self._lock:
+            snapshot = {stage: list(window) for stage, window in self._spans.items()}
+        
+        summary = {}
+        for stage, spans in snapshot.items():
+            wall = sorted(s.wall_ms for s in spans)
+            items = sum(s.items_in for s in spans)
+            summary[stage] = {
+                "count": len(spans),
+                "mean_ms": round(sum(wall) / len(wall), 3),
+                "p50_ms": round(self._percentile(wall, 50), 3),
+                "p95_ms": round(self._percentile(wall, 95), 3),
+                "max_ms": round(wall[-1], 3),
+                "mean_ms_per_item": round(sum(wall) / items, 3) if items else 0.0,
+                "mean_cpu_ms": round(sum(s.cpu_ms for s in spans) / len(spans), 3),
+                "buckets": self._bucket_counts(wall)
+            }
+        return summary
+    
+    def reset(self):
+        """Clear all recorded spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+# Singleton instance
+_histogram = None
+
+def get_stage_histogram() -> StageHistogram:
+    """Get the singleton StageHistogram instance."""
+    global _histogram
+    if _histogram is None:
+        _histogram = StageHistogram()
+    return _histogram
+
+
+if __name__ == "__main__":
+    # Demo
+    histogram = StageHistogram()
+    
+    for n in (100, 1000, 10000):
+        with StageTimer("sum", items_in=n, trace_allocations=True) as timer:
+            values = [i * i for i in range(n)]
+            timer.items_out = len(values)
+        histogram.record([timer.span])
+        print(timer.span.to_dict())
+    
+    print()
+    print(histogram.summary())
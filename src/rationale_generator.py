@@ -10,13 +10,18 @@ Output sections:
 - What we don't know yet (uncertainty)
 - Assumptions
 
+Rationales are generated lazily (on first view) and cached per cluster
+ID and cluster version; audit records only need the short summary.
+
 Responsible AI Mapping:
 - Transparency: Interpretable reasoning aligned to evidence
 - Accountability: Includes explicit assumptions
 """
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 from datetime import datetime
 
 
@@ -46,6 +51,14 @@ class Rationale:
         }
 
 
+@dataclass
+class RationaleSummary:
+    """The parts of a rationale recorded in the audit trail."""
+    cluster_id: str
+    what_signal: str
+    assumptions: List[str]
+
+
 class RationaleGenerator:
     """
     Generates structured rationales for signal clusters.
@@ -264,6 +277,17 @@ class RationaleGenerator:
             evidence_used=self._collect_evidence(cluster, risk_score, confidence)
         )
     
+    def summarize(self, cluster: Any, risk_score: Any = None) -> RationaleSummary:
+        """
+        Generate only the audit summary (what signal + assumptions).
+        Cheaper than a full rationale; used when the full one was never opened.
+        """
+        return RationaleSummary(
+            cluster_id=cluster.cluster_id if hasattr(cluster, 'cluster_id') else "UNK-00",
+            what_signal=self._generate_what_signal(cluster, risk_score),
+            assumptions=self._generate_assumptions(cluster)
+        )
+    
     def format_for_ui(self, rationale: Rationale) -> Dict[str, Any]:
         """
         Format rationale for UI display.
@@ -287,8 +311,69 @@ class RationaleGenerator:
         }
 
 
-# Singleton instance
+class RationaleCache:
+    """
+    LRU cache of generated rationales keyed by (cluster_id, cluster version).
+    A rebuilt cluster gets a new version, so its stale rationale is dropped.
+    """
+    
+    # Maximum cached rationales
+    MAX_ENTRIES = 1000
+    
+    def __init__(self, generator: RationaleGenerator, max_entries: int = None):
+        self.generator = generator
+        self.max_entries = max_entries or self.MAX_ENTRIES
+        self._entries: "OrderedDict[Tuple[str, str], Rationale]" = OrderedDict()
+        self._versions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, cluster: Any, risk_score: Any = None, confidence: Any = None) -> Rationale:
+        """Get the rationale for a cluster, generating it on first access."""
+        cluster_id = cluster.cluster_id if hasattr(cluster, 'cluster_id') else "UNK-00"
+        key = (cluster_id, getattr(cluster, 'version', ""))
+        
+        with self._lock:
+            rationale = self._entries.get(key)
+            if rationale is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return rationale
+            self.misses += 1
+        
+        # Generate outside the lock; a concurrent duplicate is harmless
+        rationale = self.generator.generate_rationale(cluster, risk_score, confidence)
+        
+        with self._lock:
+            previous = self._versions.get(cluster_id)
+            if previous is not None and previous != key[1]:
+                self._entries.pop((cluster_id, previous), None)
+            self._versions[cluster_id] = key[1]
+            self._entries[key] = rationale
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                (old_id, _), _ = self._entries.popitem(last=False)
+                self._versions.pop(old_id, None)
+        return rationale
+    
+    def invalidate(self, cluster_id: str):
+        """Drop any cached rationale for a cluster."""
+        with self._lock:
+            version = self._versions.pop(cluster_id, None)
+            if version is not None:
+                self._entries.pop((cluster_id, version), None)
+    
+    def stats(self) -> Dict[str, int]:
+        """Cache size and hit/miss counts."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Singleton instances
 _generator = None
+_cache = None
+_cache_lock = threading.Lock()
 
 def get_rationale_generator() -> RationaleGenerator:
     """Get the singleton RationaleGenerator instance."""
@@ -298,11 +383,25 @@ def get_rationale_generator() -> RationaleGenerator:
     return _generator
 
 
-# Convenience function
+def get_rationale_cache() -> RationaleCache:
+    """Get the singleton RationaleCache instance."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RationaleCache(get_rationale_generator())
+    return _cache
+
+
+# Convenience functions
 def generate_rationale(cluster: Any, risk_score: Any = None, confidence: Any = None) -> Rationale:
     """Generate rationale for a cluster."""
     return get_rationale_generator().generate_rationale(cluster, risk_score, confidence)
 
+def get_cached_rationale(cluster: Any, risk_score: Any = None, confidence: Any = None) -> Rationale:
+    """Get a cluster's rationale, generating it on first access."""
+    return get_rationale_cache().get(cluster, risk_score, confidence)
+
 
 if __name__ == "__main__":
     # Demo
@@ -0,0 +1,221 @@
+"""
+Response Cache - Conditional GET for Static-ish Resources
+=========================================================
+In-process cache of serialized JSON bodies for resources that rarely
+change (/governance, the data and model cards, /alerts).
+
+- File-backed resources are keyed by the file's mtime, size and inode:
+  a stat per request, and the file is only re-read and re-serialized
+  after it changes (writers replace files atomically, see file_lock.py)
+- Generated resources are keyed by a version token supplied by the caller
+  (e.g. the object they are built from) and rebuilt when it changes
+- Every body carries a strong ETag (content hash) and Last-Modified, so
+  clients revalidate with If-None-Match / If-Modified-Since and get 304s
+- A MessagePack variant (see response_encoding.py) is derived from the JSON
+  body on first request and cached alongside it, with its own ETag
+
+Hits, misses and 304s are counted per resource (stats()).
+
+Responsible AI Mapping:
+- Transparency: Governance documents are served exactly as last written
+- Reliability: Polling clients cost a stat() instead of a parse
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+from response_encoding import JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, dumps_msgpack
+
+
+@dataclass
+class CachedBody:
+    """A serialized body and its validators."""
+    body: bytes
+    etag: str
+    last_modified: float  # Unix time
+    version: Any
+    media_type: str = JSON_MEDIA_TYPE
+    _variants: Dict[str, 'CachedBody'] = field(default_factory=dict, repr=False)
+    
+    @property
+    def last_modified_http(self) -> str:
+        return formatdate(self.last_modified, usegmt=True)
+    
+    def headers(self) -> Dict[str, str]:
+        """Validator headers; clients must revalidate before reusing the body."""
+        return {"ETag": self.etag, "Last-Modified": self.last_modified_http, "Cache-Control": "no-cache"}
+    
+    def not_modified(self, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+        """
+        Whether the client's copy is current. If-None-Match takes precedence
+        over If-Modified-Since (RFC 9110 13.2.2).
+        """
+        if if_none_match:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or any(tag.removeprefix("W/") == self.etag for tag in tags)
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(self.last_modified) <= since
+        return False
+    
+    def variant(self, media_type: str) -> 'CachedBody':
+        """
+        The body in another representation (built once per entry).
+        
+        Raises:
+            RuntimeError: If msgpack is not installed
+        """
+        if media_type == self.media_type:
+            return self
+        if media_type != MSGPACK_MEDIA_TYPE:
+            raise ValueError(f"Unsupported media type: {media_type}")
+        entry = self._variants.get(media_type)
+        if entry is None:
+            entry = CachedBody(
+                body=dumps_msgpack(json.loads(self.body)),
+                etag=f'{self.etag[:-1]}-msgpack"',
+                last_modified=self.last_modified,
+                version=self.version,
+                media_type=media_type
+            )
+            self._variants[media_type] = entry
+        return entry
+
+
+def _serialize(data: Any) -> bytes:
+    """JSON body bytes, encoded as FastAPI's JSONResponse would."""
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+class ResponseCache:
+    """
+    Serialized JSON bodies keyed by resource, with hit/miss/304 counters.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, CachedBody] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+    
+    def _count(self, key: str, name: str):
+        with self._lock:
+            counters = self._counters.setdefault(key, {"hits": 0, "misses": 0, "not_modified": 0})
+            counters[name] += 1
+    
+    def _lookup(self, key: str, version: Any) -> Optional[CachedBody]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            self._count(key, "hits")
+            return entry
+        return None
+    
+    def _store(self, key: str, data: Any, version: Any, last_modified: float) -> CachedBody:
+        body = _serialize(data)
+        entry = CachedBody(
+            body=body,
+            etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            last_modified=last_modified,
+            version=version
+        )
+        with self._lock:
+            self._entries[key] = entry
+        self._count(key, "misses")
+        return entry
+    
+    def file_json(self, path: str, default: Any = None) -> CachedBody:
+        """
+        A JSON file's contents (default if the file does not exist).
+        
+        Raises:
+            ValueError: If the file is not valid JSON (nothing is cached)
+        """
+        try:
+            stat = os.stat(path)
+            version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except FileNotFoundError:
+            stat, version = None, None
+        
+        entry = self._lookup(path, version)
+        if entry is not None:
+            return entry
+        if stat is None:
+            return self._store(path, default, None, time.time())
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return self._store(path, data, version, stat.st_mtime)
+    
+    def generated(self, key: str, build: Callable[[], Any], version: Any) -> CachedBody:
+        """A generated resource, rebuilt only when its version token changes."""
+        entry = self._lookup(key, version)
+        if entry is not None:
+            return entry
+        return self._store(key, build(), version, time.time())
+    
+    def record_not_modified(self, key: str):
+        """Count a 304 served for a resource."""
+        self._count(key, "not_modified")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit ratio overall and per resource."""
+        with self._lock:
+            resources = {key: dict(counters) for key, counters in self._counters.items()}
+        for counters in resources.values():
+            lookups = counters["hits"] + counters["misses"]
+            counters["hit_ratio"] = round(counters["hits"] / lookups, 4) if lookups else 0.0
+        hits = sum(c["hits"] for c in resources.values())
+        misses = sum(c["misses"] for c in resources.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "not_modified": sum(c["not_modified"] for c in resources.values()),
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "resources": resources
+        }
+
+
+# Singleton
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+def get_response_cache() -> ResponseCache:
+    """Get the singleton ResponseCache."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache()
+    return _response_cache
+
+
+if __name__ == "__main__":
+    # Demo
+    import tempfile
+    
+    cache = ResponseCache()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "alerts.json")
+        with open(path, 'w') as f:
+            json.dump([{"id": "A-1"}], f)
+        
+        first = cache.file_json(path, default=[])
+        again = cache.file_json(path, default=[])
+        print(f"ETag {first.etag}, second lookup cached: {again is first}")
+        print(f"Client copy current: {again.not_modified(first.etag, None)}")
+        
+        time.sleep(0.01)
+        with open(path, 'w') as f:
+            json.dump([{"id": "A-1"}, {"id": "A-2"}], f)
+        changed = cache.file_json(path, default=[])
+        print(f"After rewrite: {changed.body.decode()} (client copy current: {changed.not_modified(first.etag, None)})")
+        print(cache.stats())
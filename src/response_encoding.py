@@ -0,0 +1,167 @@
+"""
+Response Encoding - Fast JSON and MessagePack Bodies
+====================================================
+Serializes API responses without FastAPI's jsonable_encoder + response
+model validation pass, which dominates large responses (hundreds of
+analyst cards).
+
+- JSON via orjson when installed (falls back to the standard library)
+- MessagePack (msgpack) for machine clients that send
+  Accept: application/msgpack, when installed
+- negotiate() picks the representation from the Accept header (q-values
+  honoured); anything unrecognised gets JSON, and only a client that
+  asks for MessagePack (and not JSON) on a server without msgpack gets 406
+
+Both libraries are optional: pip install orjson msgpack
+
+Responsible AI Mapping:
+- Reliability: Large analyst-card batches are served without serialization stalls
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+
+class NotAcceptable(ValueError):
+    """Raised by negotiate() when no offered representation is acceptable."""
+
+
+def _default(obj: Any) -> Any:
+    """Encode types the fast encoders do not handle natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "item"):  # numpy scalars
+        return obj.item()
+    if hasattr(obj, "tolist"):  # numpy arrays
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def dumps_json(data: Any) -> bytes:
+    """JSON bytes (orjson if available, else json with FastAPI's compact settings)."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_msgpack(data: Any) -> bytes:
+    """MessagePack bytes (requires msgpack)."""
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(data, default=_default, use_bin_type=True, datetime=False)
+
+
+def _accepted(accept: str) -> list:
+    """Parse an Accept header into (media_type, q) pairs, highest q first."""
+    ranges = []
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type:
+            ranges.append((media_type.strip().lower(), q))
+    return sorted(ranges, key=lambda r: r[1], reverse=True)
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    Pick the response media type for an Accept header. JSON is the default,
+    including for Accept headers that match neither type (as before
+    negotiation existed).
+    
+    Returns:
+        JSON_MEDIA_TYPE or MSGPACK_MEDIA_TYPE
+    
+    Raises:
+        NotAcceptable: If MessagePack is explicitly preferred over JSON but
+            msgpack is not installed
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+    msgpack_requested = False
+    for media_type, q in _accepted(accept):
+        if q <= 0:
+            continue
+        if media_type in _MSGPACK_MEDIA_TYPES:
+            if msgpack is not None:
+                return MSGPACK_MEDIA_TYPE
+            msgpack_requested = True
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            return JSON_MEDIA_TYPE
+    if msgpack_requested:
+        raise NotAcceptable(f"{MSGPACK_MEDIA_TYPE} requested but msgpack is not installed; supported: {JSON_MEDIA_TYPE}")
+    return JSON_MEDIA_TYPE
+
+
+def encode(data: Any, accept: Optional[str] = None) -> Tuple[bytes, str]:
+    """
+    Encode data for a client.
+    
+    Returns:
+        (body, media_type)
+    
+    Raises:
+        NotAcceptable: See negotiate()
+    """
+    media_type = negotiate(accept)
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return dumps_msgpack(data), media_type
+    return dumps_json(data), media_type
+
+
+def backends() -> dict:
+    """Which optional encoders are in use."""
+    return {"json": "orjson" if orjson is not None else "json", "msgpack": msgpack is not None}
+
+
+if __name__ == "__main__":
+    # Demo: encode a batch of card-shaped dicts
+    import time
+    
+    cards = [
+        {
+            "cluster_id": f"FRD-{i:02d}",
+            "risk_score": 7.5,
+            "risk_breakdown": {"severity": {"score": 2.5, "max": 2.5, "description": "Fraud signals"}},
+            "top_phrases": ["otp", "scam"],
+            "example_snippets": ["Got suspicious SMS about OTP, this is a scam!"] * 3,
+            "approval_required": True
+        }
+        for i in range(500)
+    ]
+    
+    print(f"Encoders: {backends()}")
+    start = time.perf_counter()
+    body = dumps_json({"clusters": cards})
+    print(f"JSON: {len(body)} bytes in {(time.perf_counter() - start) * 1000:.2f}ms")
+    print(f"Accept 'application/msgpack;q=0.9, */*;q=0.1' -> {negotiate('application/msgpack;q=0.9, */*;q=0.1')}")
@@ -4,13 +4,13 @@ Responsible AI Pipeline - Unified 10-Stage Pipeline
 Integrates all pipeline stages into a single coherent workflow.
 
 Stages:
-0. Governance Setup (guardrails)
+0. Governance Setup (guardrails), then duplicate collapse
 1. Naïve Bayes Classification
 2. Noise vs Signal Gating
 3. Clustering + Aggregation
 4. Risk Scoring (0-10)
 5. Confidence Scoring (%)
-6. Model Rationale Generation
+6. Model Rationale Generation (lazy, on first view)
 7. Suggested Escalation
 8. Human-in-the-Loop Decision (UI)
 9. Audit Logging
@@ -18,21 +18,33 @@ Stages:
 Author: Antigravity
 """
 
+import os
+import threading
 import time
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from collections import Counter, OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime
 
 # Import all pipeline components
 from guardrails import get_guardrails, validate_input
+from event_deduplicator import get_deduplicator, time_range
 from naive_bayes_classifier import get_classifier, ClassificationResult, BatchClassificationResult
 from signal_gate import get_signal_gate, GatingResult, GatedSignal
-from clustering_engine import get_clustering_engine, ClusteringResult, SignalCluster
+from clustering_engine import ClusterStats, ClusteringEngine, ClusteringResult, SignalCluster
 from risk_scorer import get_risk_scorer, RiskScore
 from confidence_scorer import get_confidence_scorer, ConfidenceScore
-from rationale_generator import get_rationale_generator, Rationale
+from rationale_generator import get_rationale_generator, get_rationale_cache, Rationale
 from escalation_router import get_escalation_router, EscalationSuggestion
 from audit_logger import get_audit_logger, AuditRecord
+from audit_writer import get_audit_writer
+from event_bus import get_event_bus
+from authz import authorize_decisions
+from pipeline_metrics import StageSpan, StageTimer, get_stage_histogram
+from pipeline_checkpoint import PipelineCheckpoint, CheckpointStore
+from data_loader import iter_csv_events
+from analysis_backlog import AnalysisBacklog
 
 
 @dataclass
@@ -57,6 +69,20 @@ class PipelineOutput:
     # Metadata
     processing_time_ms: int
     timestamp: str
+    
+    # Per-stage timing spans (wall/CPU time, item counts, optional alloc peak)
+    stage_timings: List[StageSpan] = field(default_factory=list)
+    
+    # Incremental runs: clusters recomputed by this run (all clusters for full runs)
+    recomputed_clusters: List[str] = field(default_factory=list)
+    
+    # Duplicate collapse summary (input vs distinct events)
+    deduplication: Dict[str, Any] = field(default_factory=dict)
+    
+    # Degraded fast path: audit deferred to the background backlog
+    degraded: bool = False
+    degraded_reason: Optional[str] = None
+    deferred_clusters: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -65,12 +91,34 @@ class ClusterAnalysis:
     cluster: SignalCluster
     risk_score: RiskScore
     confidence: ConfidenceScore
-    rationale: Rationale
+    rationale: Optional[Rationale]  # None until first requested (see get_rationale)
     escalation: EscalationSuggestion
+    degraded: bool = False
     
-    def to_analyst_card(self) -> Dict[str, Any]:
-        """Convert to analyst card format for UI."""
-        return {
+    def get_rationale(self) -> Rationale:
+        """
+        Get the Stage 6 rationale, generating it on first access.
+        Cached per cluster ID + cluster version, so re-opening a card is free.
+        """
+        self.rationale = get_rationale_cache().get(self.cluster, self.risk_score, self.confidence)
+        return self.rationale
+    
+    def to_analyst_card(self, include_rationale: bool = False) -> Dict[str, Any]:
+        """
+        Convert to analyst card format for UI.
+        
+        Args:
+            include_rationale: Generate and embed the full rationale. Otherwise the
+                               card links to it via 'rationale_url'. Degraded cards
+                               carry 'rationale': None until the backlog catches up.
+        """
+        if self.degraded:
+            card = self.to_minimal_card()
+            if include_rationale:
+                card["rationale"] = None
+            return card
+        
+        card = {
             "cluster_id": self.cluster.cluster_id,
             "title": self._generate_title(),
             "category": self.cluster.category,
@@ -93,15 +141,8 @@ class ClusterAnalysis:
             "confidence_level": self.confidence.level.value,
             "uncertainty_wording": self.confidence.uncertainty_wording,
             
-            # Rationale (Stage 6)
-            "rationale": {
-                "what_signal": self.rationale.what_signal,
-                "what_changed": self.rationale.what_changed,
-                "why_it_matters": self.rationale.why_it_matters,
-                "what_we_dont_know": self.rationale.what_we_dont_know,
-                "assumptions": self.rationale.assumptions,
-                "evidence_used": self.rationale.evidence_used
-            },
+            # Rationale (Stage 6), fetched on demand
+            "rationale_url": f"/clusters/{self.cluster.cluster_id}/rationale",
             
             # Escalation (Stage 7)
             "suggested_queue": self.escalation.suggested_queue.value,
@@ -112,7 +153,50 @@ class ClusterAnalysis:
             # UI helpers
             "is_critical": self.risk_score.risk_level == "CRITICAL",
             "top_phrases": self.cluster.top_phrases,
-            "example_snippets": self.cluster.example_snippets
+            "example_snippets": self.cluster.example_snippets,
+            "degraded": self.degraded,
+            "rationale_pending": False
+        }
+        
+        if include_rationale:
+            rationale = self.get_rationale()
+            card["rationale"] = {
+                "what_signal": rationale.what_signal,
+                "what_changed": rationale.what_changed,
+                "why_it_matters": rationale.why_it_matters,
+                "what_we_dont_know": rationale.what_we_dont_know,
+                "assumptions": rationale.assumptions,
+                "evidence_used": rationale.evidence_used
+            }
+        
+        return card
+    
+    def to_minimal_card(self) -> Dict[str, Any]:
+        """
+        Risk + queue only card, emitted while the audit is deferred.
+        Same keys as the full card; the fields it skips are None.
+        """
+        return {
+            "cluster_id": self.cluster.cluster_id,
+            "title": self._generate_title(),
+            "category": self.cluster.category,
+            "volume": self.cluster.volume,
+            "risk_score": self.risk_score.total_score,
+            "risk_level": self.risk_score.risk_level,
+            "risk_breakdown": None,
+            "confidence_percentage": None,
+            "confidence_level": None,
+            "uncertainty_wording": None,
+            "rationale_url": None,
+            "suggested_queue": self.escalation.suggested_queue.value,
+            "priority": self.escalation.priority,
+            "escalation_reason": None,
+            "approval_required": True,
+            "is_critical": self.risk_score.risk_level == "CRITICAL",
+            "top_phrases": None,
+            "example_snippets": None,
+            "degraded": True,
+            "rationale_pending": True
         }
     
     def _generate_title(self) -> str:
@@ -132,90 +216,430 @@ class ClusterAnalysis:
         return f"{base} ({self.cluster.cluster_id})"
 
 
+@dataclass
+class StateJournal:
+    """Keys of a PipelineState changed since its last checkpoint_delta()."""
+    seen: set = field(default_factory=set)  # Raw event IDs
+    events: set = field(default_factory=set)  # Results and gating decisions
+    content: set = field(default_factory=set)  # Content volume keys
+    dedup: set = field(default_factory=set)  # Duplicate-collapse keys
+    issues: int = 0  # Validation issues already taken
+
+
+@dataclass
+class PipelineState:
+    """
+    Prior pipeline state for incremental re-runs (see process_delta).
+    Holds classification results, gated sets and open per-category clusters,
+    plus running totals and per-category ClusterStats that process_delta
+    updates from each delta, so its cost does not grow with the state.
+    
+    With a journal, the keys each delta changes are recorded, and
+    checkpoint_delta() returns just those entries plus the compact
+    aggregates; from_deltas() rebuilds the state from them without
+    processing any event again (see _run_checkpointed).
+    """
+    # Stage 0-1: raw event IDs seen so far, and representatives keyed by
+    # event_id in arrival order (collapsed duplicates grow their multiplicity)
+    seen_event_ids: set = field(default_factory=set)
+    dedup_index: Dict[str, str] = field(default_factory=dict)
+    results: Dict[str, ClassificationResult] = field(default_factory=dict)
+    validation_issues: List[str] = field(default_factory=list)
+    class_distribution: Counter = field(default_factory=Counter)
+    confidence_sum: float = 0.0
+    ordinals: Dict[str, int] = field(default_factory=dict)  # Arrival position per result
+    
+    # Stage 2: gating volume and decisions
+    content_counts: Counter = field(default_factory=Counter)
+    content_members: Dict[str, List[str]] = field(default_factory=dict)
+    surfaced: Dict[str, GatedSignal] = field(default_factory=dict)
+    archived: Dict[str, GatedSignal] = field(default_factory=dict)
+    gated_volumes: Dict[str, int] = field(default_factory=dict)  # Multiplicity counted per gated event
+    signal_volume: int = 0
+    noise_volume: int = 0
+    archive_reasons: Counter = field(default_factory=Counter)
+    
+    # Stages 3-7: open clusters per category
+    cluster_ids: Dict[str, str] = field(default_factory=dict)
+    analyses: Dict[str, 'ClusterAnalysis'] = field(default_factory=dict)
+    cluster_stats: Dict[str, ClusterStats] = field(default_factory=dict)
+    
+    # Changes since the last checkpoint_delta() (None: not recorded)
+    journal: Optional[StateJournal] = None
+    
+    @property
+    def event_count(self) -> int:
+        return len(self.seen_event_ids)
+    
+    def checkpoint_delta(self) -> Dict[str, Any]:
+        """
+        Entries changed since the previous call, plus the current aggregates,
+        cluster stats (without their members) and open cluster analyses
+        (without their signals). Resets the journal.
+        """
+        journal = self.journal
+        members = {}
+        for event_id in journal.events:
+            gated = self.surfaced.get(event_id)
+            stats = self.cluster_stats.get(gated.predicted_class) if gated else None
+            contribution = stats.contributions.get(event_id) if stats else None
+            members[event_id] = (gated.predicted_class, contribution) if contribution else None
+        
+        delta = {
+            "seen": list(journal.seen),
+            "dedup": {key: self.dedup_index[key] for key in journal.dedup},
+            # In arrival order, so restored results keep their order
+            "events": {
+                event_id: (
+                    self.results[event_id], self.ordinals[event_id],
+                    self.surfaced.get(event_id), self.archived.get(event_id),
+                    self.gated_volumes.get(event_id)
+                )
+                for event_id in sorted(journal.events, key=self.ordinals.__getitem__)
+            },
+            "content": {key: (self.content_counts[key], list(self.content_members[key])) for key in journal.content},
+            "members": members,
+            "issues": self.validation_issues[journal.issues:],
+            "totals": (
+                dict(self.class_distribution), self.confidence_sum,
+                self.signal_volume, self.noise_volume, dict(self.archive_reasons)
+            ),
+            "cluster_ids": dict(self.cluster_ids),
+            "cluster_stats": {category: stats.summary() for category, stats in self.cluster_stats.items()},
+            "analyses": {
+                category: replace(analysis, cluster=replace(analysis.cluster, signals=[]))
+                for category, analysis in self.analyses.items()
+            }
+        }
+        self.journal = StateJournal(issues=len(self.validation_issues))
+        return delta
+    
+    @classmethod
+    def from_deltas(cls, deltas: List[Dict[str, Any]]) -> 'PipelineState':
+        """Rebuild a state from its checkpoint_delta() results, in order."""
+        state = cls()
+        members: Dict[str, tuple] = {}
+        for delta in deltas:
+            state.seen_event_ids.update(delta["seen"])
+            state.dedup_index.update(delta["dedup"])
+            for event_id, (result, ordinal, surfaced, archived, volume) in delta["events"].items():
+                state.results[event_id] = result
+                state.ordinals[event_id] = ordinal
+                for gated_set, gated in ((state.surfaced, surfaced), (state.archived, archived)):
+                    if gated is None:
+                        gated_set.pop(event_id, None)
+                    else:
+                        gated_set[event_id] = gated
+                if volume is None:
+                    state.gated_volumes.pop(event_id, None)
+                else:
+                    state.gated_volumes[event_id] = volume
+            for key, (count, content_members) in delta["content"].items():
+                state.content_counts[key] = count
+                state.content_members[key] = content_members
+            members.update(delta["members"])
+            state.validation_issues.extend(delta["issues"])
+            (class_distribution, state.confidence_sum,
+             state.signal_volume, state.noise_volume, archive_reasons) = delta["totals"]
+            state.class_distribution = Counter(class_distribution)
+            state.archive_reasons = Counter(archive_reasons)
+            state.cluster_ids = dict(delta["cluster_ids"])
+            state.cluster_stats = delta["cluster_stats"]
+            state.analyses = delta["analyses"]
+        
+        # Entries restored from different deltas share one result object again
+        for gated in list(state.surfaced.values()) + list(state.archived.values()):
+            gated.classification_result = state.results.get(gated.event_id, gated.classification_result)
+        
+        by_category: Dict[str, Dict[str, tuple]] = {}
+        for event_id, member in members.items():
+            if member is not None:
+                by_category.setdefault(member[0], {})[event_id] = member[1]
+        for category, stats in state.cluster_stats.items():
+            stats.restore(by_category.get(category, {}), state.surfaced)
+        for category, analysis in state.analyses.items():
+            analysis.cluster.signals = state.cluster_stats[category].signals()
+        return state
+    
+    def save(self, path: str):
+        """Persist state to disk (atomic replace)."""
+        import os
+        import pickle
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str) -> 'PipelineState':
+        """Load persisted state; returns an empty state if missing or unreadable."""
+        import pickle
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+            # State written by an older layout cannot be resumed safely
+            if not isinstance(state, cls) or vars(state).keys() != vars(cls()).keys():
+                return cls()
+            return state
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError):
+            return cls()
+
+
 class ResponsibleAIPipeline:
     """
     Unified 10-stage Responsible AI pipeline.
     Orchestrates all components with governance controls.
+    
+    Thread-safe: the stage components (classifier, gate, scorers, router) are
+    read-only and shared, each run gets its own clustering engine (cluster
+    IDs still come from one process-wide counter), and the long-lived shared
+    state (audit logger, rationale cache, stage histogram, backlog, analysis
+    registry) sits behind locks.
     """
     
-    def __init__(self):
+    # Default worker count for per-cluster analysis (Stages 4-7)
+    ANALYSIS_WORKERS = 4
+    
+    # Latency budget for process() (ms); None disables the degraded fast path
+    LATENCY_BUDGET_MS = None
+    
+    # File runs: rows per chunk and rows between checkpoints
+    FILE_CHUNK_SIZE = 10000
+    CHECKPOINT_EVERY_ROWS = 50000
+    
+    # Recent analyses kept for on-demand rationale lookups by cluster ID
+    MAX_TRACKED_ANALYSES = 1000
+    
+    def __init__(
+        self, 
+        max_workers: Optional[int] = None, 
+        executor: Optional[Executor] = None,
+        trace_allocations: bool = False,
+        latency_budget_ms: Optional[float] = None
+    ):
+        """
+        Args:
+            max_workers: Worker threads for per-cluster analysis.
+                         1 (or less) runs serially, e.g. for tests.
+            executor: Optional externally managed executor; overrides max_workers.
+            trace_allocations: Record tracemalloc peaks in stage spans (adds overhead;
+                               stages overlapping a concurrent run report no peak).
+            latency_budget_ms: Budget for process(). When a run would exceed it,
+                               the audit write is deferred to a background backlog.
+        """
         self.guardrails = get_guardrails()
+        self.deduplicator = get_deduplicator()
         self.classifier = get_classifier()
         self.signal_gate = get_signal_gate()
-        self.clustering = get_clustering_engine()
         self.risk_scorer = get_risk_scorer()
         self.confidence_scorer = get_confidence_scorer()
         self.rationale_gen = get_rationale_generator()
         self.escalation_router = get_escalation_router()
         self.audit_logger = get_audit_logger()
+        self.audit_writer = get_audit_writer()
+        self.event_bus = get_event_bus()
+        
+        self.max_workers = self.ANALYSIS_WORKERS if max_workers is None else max_workers
+        self._executor = executor
+        self.trace_allocations = trace_allocations
+        self.stage_histogram = get_stage_histogram()
+        
+        self.latency_budget_ms = self.LATENCY_BUDGET_MS if latency_budget_ms is None else latency_budget_ms
+        # Upgraded (no longer degraded) cards are republished as card.updated
+        self.backlog = AnalysisBacklog(self.rationale_gen, self.audit_logger, self.audit_writer, on_complete=self._track)
+        
+        self._analyses: "OrderedDict[str, ClusterAnalysis]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _get_executor(self) -> Optional[Executor]:
+        """Get the analysis executor, or None for serial execution."""
+        with self._lock:
+            if self._executor is None and self.max_workers > 1:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="cluster-analysis"
+                )
+            return self._executor
+    
+    def _map(self, fn, *iterables) -> List[Any]:
+        """
+        Apply a per-cluster stage function over clusters.
+        Results keep input order regardless of completion order.
+        """
+        executor = self._get_executor()
+        items = [list(it) for it in iterables]
+        if executor is None or (items and len(items[0]) < 2):
+            return [fn(*args) for args in zip(*items)]
+        
+        return list(executor.map(fn, *items))
+    
+    def _over_budget(self, start_time: float, clusters: int, durable: bool) -> Optional[str]:
+        """
+        Check whether finishing this run synchronously would exceed the latency budget.
+        Projects the audit cost of this run's clusters from recent per-item stage
+        timings; a durable run also waits for the records already queued ahead of it.
+        Decided per run, so the fast path ends as soon as runs fit again.
+        
+        Returns:
+            Reason string if the run should degrade, else None
+        """
+        if self.latency_budget_ms is None:
+            return None
+        
+        elapsed_ms = (time.time() - start_time) * 1000
+        recent = self.stage_histogram.summary()
+        remaining_ms = clusters * recent.get("audit", {}).get("mean_ms_per_item", 0.0)
+        if durable:
+            queued = self.audit_writer.status()["queue_depth"]
+            remaining_ms += queued * recent.get("audit_commit", {}).get("mean_ms_per_item", 0.0)
+        
+        if elapsed_ms + remaining_ms > self.latency_budget_ms:
+            return (
+                f"Latency budget {self.latency_budget_ms:.0f}ms exceeded "
+                f"({elapsed_ms:.0f}ms elapsed + {remaining_ms:.0f}ms projected audit)"
+            )
+        
+        return None
     
-    def process(self, events: List[Dict[str, Any]]) -> PipelineOutput:
+    def _track(self, analyses: List[ClusterAnalysis]):
+        """
+        Remember recent analyses so their rationale can be fetched later,
+        and publish them as card.created / card.updated events.
+        """
+        with self._lock:
+            known = [analysis.cluster.cluster_id in self._analyses for analysis in analyses]
+            for analysis in analyses:
+                self._analyses[analysis.cluster.cluster_id] = analysis
+                self._analyses.move_to_end(analysis.cluster.cluster_id)
+            while len(self._analyses) > self.MAX_TRACKED_ANALYSES:
+                self._analyses.popitem(last=False)
+        
+        # Cards are only built if a subscriber takes the event
+        for analysis, updated in zip(analyses, known):
+            self.event_bus.publish(
+                "card.updated" if updated else "card.created", 
+                analysis.cluster.cluster_id, 
+                analysis.to_analyst_card
+            )
+    
+    def get_analysis(self, cluster_id: str) -> Optional[ClusterAnalysis]:
+        """Look up the most recent analysis produced for a cluster ID."""
+        with self._lock:
+            return self._analyses.get(cluster_id)
+    
+    def _stage(self, name: str, items_in: int) -> StageTimer:
+        """Create a timing span for a pipeline stage."""
+        return StageTimer(name, items_in=items_in, trace_allocations=self.trace_allocations)
+    
+    def process(self, events: List[Dict[str, Any]], durable_audit: bool = False) -> PipelineOutput:
         """
         Process a batch of events through the full pipeline.
         
         Args:
             events: List of event dictionaries with 'event_id', 'content', etc.
+            durable_audit: Wait until the audit records are committed and fsynced.
+                           By default they are only queued for the next group commit.
             
         Returns:
             PipelineOutput with all stage results
         """
         start_time = time.time()
+        spans: List[StageSpan] = []
         
         # Stage 0: Governance Validation
-        validation_issues = []
-        for event in events:
-            result = validate_input(event)
-            if not result.is_valid:
-                validation_issues.extend(result.violations)
+        with self._stage("governance", len(events)) as timer:
+            validation_issues = []
+            for event in events:
+                result = validate_input(event)
+                if not result.is_valid:
+                    validation_issues.extend(result.violations)
+            
+            governance_validated = len(validation_issues) == 0
+            timer.items_out = len(events)
+        spans.append(timer.span)
         
-        governance_validated = len(validation_issues) == 0
+        # Collapse exact/near duplicates into weighted representatives
+        with self._stage("deduplication", len(events)) as timer:
+            deduplication = self.deduplicator.deduplicate(events)
+            timer.items_out = deduplication.distinct_count
+        spans.append(timer.span)
         
         # Stage 1: Naïve Bayes Classification
-        classification_result = self.classifier.classify_batch(events)
+        with self._stage("classification", deduplication.distinct_count) as timer:
+            classification_result = self.classifier.classify_batch(deduplication.events)
+            timer.items_out = len(classification_result.results)
+        spans.append(timer.span)
         
-        # Calculate signal volume map for Gating Override
-        # (Allows low-confidence signals to pass if volume is high)
-        from collections import Counter
-        event_ids = [r.event_id for r in classification_result.results]
-        # Since event_ids are unique, we need to group by SIMILARITY or CONTENT hash
-        # For this pipeline, we'll use a simplified content-based volume for Stage 2
-        content_hashes = [hash(r.raw_text[:50]) for r in classification_result.results]
-        content_counts = Counter(content_hashes)
-        
-        volume_map = {}
-        for r, h in zip(classification_result.results, content_hashes):
-             volume_map[r.event_id] = content_counts[h]
-
         # Stage 2: Noise vs Signal Gating
-        gating_result = self.signal_gate.gate_signals(
-            classification_result.results, 
-            volume_map=volume_map  # NEW: Pass volume for override logic
-        )
+        with self._stage("gating", len(classification_result.results)) as timer:
+            # Calculate signal volume map for Gating Override
+            # (Allows low-confidence signals to pass if volume is high)
+            volume_map = self._build_volume_map(classification_result.results)
+            
+            gating_result = self.signal_gate.gate_signals(
+                classification_result.results, 
+                volume_map=volume_map  # NEW: Pass volume for override logic
+            )
+            timer.items_out = len(gating_result.signals)
+        spans.append(timer.span)
         
-        # Stage 3: Clustering
+        # Stage 3: Clustering (per-run engine: IDs and active clusters are request-local)
         surfaced_signals = gating_result.signals
-        clustering_result = self.clustering.cluster_signals(surfaced_signals)
+        with self._stage("clustering", len(surfaced_signals)) as timer:
+            clustering_result = ClusteringEngine().cluster_signals(surfaced_signals)
+            timer.items_out = clustering_result.cluster_count
+        spans.append(timer.span)
         
-        # Stages 4-7: Per-cluster analysis
-        cluster_analyses = []
-        for cluster in clustering_result.clusters:
-            analysis = self._analyze_cluster(cluster)
-            cluster_analyses.append(analysis)
-            
-            # Stage 9: Log to audit trail
-            record = self.audit_logger.create_record(
+        clusters = clustering_result.clusters
+        
+        # Stage 4: Risk Scoring
+        with self._stage("risk", len(clusters)) as timer:
+            risk_scores = self._map(self.risk_scorer.calculate_risk_score, clusters)
+            timer.items_out = len(risk_scores)
+        spans.append(timer.span)
+        
+        # Stage 5: Confidence Scoring (all clusters in one vectorized pass)
+        with self._stage("confidence", len(clusters)) as timer:
+            confidences = self.confidence_scorer.calculate_confidence_batch(clusters)
+            timer.items_out = len(confidences)
+        spans.append(timer.span)
+        
+        # Under overload, skip to risk + queue and defer the audit
+        degraded_reason = self._over_budget(start_time, len(clusters), durable_audit) if clusters else None
+        
+        # Stage 6: Rationale Generation happens lazily (ClusterAnalysis.get_rationale)
+        
+        # Stage 7: Escalation Routing
+        with self._stage("escalation", len(clusters)) as timer:
+            escalations = self._map(self.escalation_router.suggest_queue, clusters, risk_scores, confidences)
+            timer.items_out = len(escalations)
+        spans.append(timer.span)
+        
+        cluster_analyses = [
+            ClusterAnalysis(
                 cluster=cluster,
-                classification_result=classification_result,
-                risk_score=analysis.risk_score,
-                confidence=analysis.confidence,
-                rationale=analysis.rationale,
-                escalation=analysis.escalation,
-                human_decision="PENDING",
-                human_user="SYSTEM",
-                processing_time_ms=int((time.time() - start_time) * 1000)
+                risk_score=risk_score,
+                confidence=confidence,
+                rationale=None,
+                escalation=escalation,
+                degraded=degraded_reason is not None
             )
-            self.audit_logger.log_decision(record)
+            for cluster, risk_score, confidence, escalation
+            in zip(clusters, risk_scores, confidences, escalations)
+        ]
+        self._track(cluster_analyses)
         
+        # Stage 9: Queue for the audit writer's next group commit, or hand off to the backlog
+        elapsed_ms = int((time.time() - start_time) * 1000)
+        if degraded_reason is None:
+            with self._stage("audit", len(cluster_analyses)) as timer:
+                records = self._audit_records(cluster_analyses, classification_result, elapsed_ms)
+                timer.items_out = len(self.audit_writer.submit(records, wait=durable_audit))
+            spans.append(timer.span)
+        else:
+            self.backlog.submit(cluster_analyses, classification_result, elapsed_ms)
+        
+        self.stage_histogram.record(spans)
         processing_time = int((time.time() - start_time) * 1000)
         
         return PipelineOutput(
@@ -226,19 +650,535 @@ class ResponsibleAIPipeline:
             clustering_result=clustering_result,
             cluster_analyses=cluster_analyses,
             processing_time_ms=processing_time,
-            timestamp=datetime.now().isoformat()
+            timestamp=datetime.now().isoformat(),
+            stage_timings=spans,
+            recomputed_clusters=[c.cluster_id for c in clusters],
+            deduplication=deduplication.to_dict(),
+            degraded=degraded_reason is not None,
+            degraded_reason=degraded_reason,
+            deferred_clusters=[c.cluster_id for c in clusters] if degraded_reason else []
+        )
+    
+    def process_delta(
+        self, 
+        events: List[Dict[str, Any]], 
+        state: PipelineState, 
+        audit: bool = True
+    ) -> PipelineOutput:
+        """
+        Process only new events against a prior state.
+        
+        Classification and gating run on the delta (plus earlier events whose
+        content volume changed); Stages 4-7 and audit run only for clusters
+        whose membership changed. Unchanged cluster analyses are reused.
+        Changed clusters are rebuilt and scored from their running
+        ClusterStats, and output totals come from running counters, so the
+        cost of a delta depends on its size, not on the events seen so far.
+        
+        Args:
+            events: New event dictionaries (already-seen event_ids are skipped)
+            state: PipelineState from previous runs; updated in place
+            audit: Log recomputed clusters (checkpointed runs audit at checkpoints instead)
+        
+        Returns:
+            PipelineOutput covering all events seen so far
+        """
+        start_time = time.time()
+        spans: List[StageSpan] = []
+        
+        new_events = [e for e in events if str(e.get('event_id', 'unknown')) not in state.seen_event_ids]
+        
+        # Stage 0: Governance Validation (delta only)
+        with self._stage("governance", len(new_events)) as timer:
+            for event in new_events:
+                result = validate_input(event)
+                if not result.is_valid:
+                    state.validation_issues.extend(result.violations)
+            timer.items_out = len(new_events)
+        spans.append(timer.span)
+        
+        # Duplicate collapse: copies of content seen in earlier runs grow the
+        # existing representative instead of being classified again
+        with self._stage("deduplication", len(new_events)) as timer:
+            deduplication = self.deduplicator.deduplicate(new_events)
+            state.seen_event_ids.update(str(e.get('event_id', 'unknown')) for e in new_events)
+            
+            fresh, grown, new_keys = [], [], []
+            for rep in deduplication.events:
+                key = self.deduplicator.content_key(rep)
+                existing_id = state.dedup_index.get(key)
+                if existing_id is None:
+                    state.dedup_index[key] = str(rep.get('event_id', 'unknown'))
+                    new_keys.append(key)
+                    fresh.append(rep)
+                    continue
+                existing = state.results[existing_id]
+                existing.multiplicity += rep['multiplicity']
+                existing.member_event_ids.extend(rep['member_event_ids'])
+                existing.sources = sorted(set(existing.sources).union(rep['sources']))
+                existing.first_seen, existing.last_seen = time_range(
+                    existing.first_seen, existing.last_seen, rep['first_seen'], rep['last_seen']
+                )
+                state.class_distribution[existing.predicted_class] += rep['multiplicity']
+                state.confidence_sum += existing.confidence * rep['multiplicity']
+                grown.append((existing, rep['multiplicity']))
+            timer.items_out = len(fresh)
+        spans.append(timer.span)
+        
+        # Stage 1: Naïve Bayes Classification (new distinct content only)
+        with self._stage("classification", len(fresh)) as timer:
+            delta_results = self.classifier.classify_batch(fresh).results
+            for r in delta_results:
+                state.ordinals[r.event_id] = len(state.results)
+                state.results[r.event_id] = r
+                state.class_distribution[r.predicted_class] += r.multiplicity
+                state.confidence_sum += r.confidence * r.multiplicity
+            timer.items_out = len(delta_results)
+        spans.append(timer.span)
+        
+        # Stage 2: Gating for the delta and for earlier events whose volume changed
+        clustering = ClusteringEngine()
+        with self._stage("gating", len(delta_results) + len(grown)) as timer:
+            touched_keys = set()
+            for r in delta_results:
+                key = self._content_key(r)
+                state.content_counts[key] += r.multiplicity
+                state.content_members.setdefault(key, []).append(r.event_id)
+                touched_keys.add(key)
+            for r, added in grown:
+                key = self._content_key(r)
+                state.content_counts[key] += added
+                touched_keys.add(key)
+            
+            regate_ids = [eid for key in touched_keys for eid in state.content_members[key]]
+            regate = [state.results[eid] for eid in regate_ids]
+            volume_map = {r.event_id: state.content_counts[self._content_key(r)] for r in regate}
+            delta_gating = self.signal_gate.gate_signals(regate, volume_map=volume_map)
+            
+            affected_categories = set()
+            for gated in delta_gating.signals:
+                previous = state.surfaced.get(gated.event_id)
+                if previous is None or previous.predicted_class != gated.predicted_class:
+                    affected_categories.add(gated.predicted_class)
+                    if previous is not None:
+                        affected_categories.add(previous.predicted_class)
+                        state.cluster_stats[previous.predicted_class].remove(gated.event_id)
+                self._uncount_gated(state, gated.event_id)
+                state.archived.pop(gated.event_id, None)
+                state.surfaced[gated.event_id] = gated
+                self._count_gated(state, gated, clustering)
+            for gated in delta_gating.noise:
+                self._uncount_gated(state, gated.event_id)
+                previous = state.surfaced.pop(gated.event_id, None)
+                if previous is not None:
+                    affected_categories.add(previous.predicted_class)
+                    state.cluster_stats[previous.predicted_class].remove(gated.event_id)
+                state.archived[gated.event_id] = gated
+                self._count_gated(state, gated, clustering)
+            
+            # Grown representatives change their cluster's volume
+            for r, _ in grown:
+                if r.event_id in state.surfaced:
+                    affected_categories.add(r.predicted_class)
+            
+            gating_result = self._gating_result_from_state(state)
+            timer.items_out = len(delta_gating.signals)
+        spans.append(timer.span)
+        
+        if state.journal is not None:
+            state.journal.seen.update(str(e.get('event_id', 'unknown')) for e in new_events)
+            state.journal.dedup.update(new_keys)
+            state.journal.events.update(regate_ids)
+            state.journal.content.update(touched_keys)
+        
+        # Stage 3: Rebuild only the affected category clusters, from their running stats
+        with self._stage("clustering", len(affected_categories)) as timer:
+            empty = ClusterStats()
+            clusters = []
+            for category in sorted(affected_categories, key=lambda c: state.cluster_stats.get(c, empty).first_ordinal()):
+                stats = state.cluster_stats.get(category, empty)
+                if not stats or not clustering._meets_min_size(category, [], volume=stats.volume):
+                    state.analyses.pop(category, None)
+                    continue
+                cluster = clustering._build_cluster(
+                    category, stats.signals(), cluster_id=state.cluster_ids.get(category), stats=stats
+                )
+                state.cluster_ids[category] = cluster.cluster_id
+                clusters.append(cluster)
+            timer.items_out = len(clusters)
+        spans.append(timer.span)
+        
+        # Stages 4-7: affected clusters only
+        with self._stage("risk", len(clusters)) as timer:
+            risk_scores = self._map(self.risk_scorer.calculate_risk_score, clusters)
+            timer.items_out = len(risk_scores)
+        spans.append(timer.span)
+        
+        with self._stage("confidence", len(clusters)) as timer:
+            confidences = self.confidence_scorer.calculate_confidence_batch(clusters)
+            timer.items_out = len(confidences)
+        spans.append(timer.span)
+        
+        with self._stage("escalation", len(clusters)) as timer:
+            escalations = self._map(self.escalation_router.suggest_queue, clusters, risk_scores, confidences)
+            timer.items_out = len(escalations)
+        spans.append(timer.span)
+        
+        recomputed = []
+        for cluster, risk_score, confidence, escalation in zip(
+            clusters, risk_scores, confidences, escalations
+        ):
+            analysis = ClusterAnalysis(
+                cluster=cluster,
+                risk_score=risk_score,
+                confidence=confidence,
+                rationale=None,
+                escalation=escalation
+            )
+            state.analyses[cluster.category] = analysis
+            recomputed.append(analysis)
+        self._track(recomputed)
+        
+        all_clusters = {a.cluster.cluster_id: a.cluster for a in state.analyses.values()}
+        for cluster in all_clusters.values():
+            cluster.related_clusters = clustering._find_related_clusters(cluster, all_clusters)
+        
+        classification_result = self._classification_from_state(state)
+        
+        # Stage 9: Audit only what changed
+        if audit:
+            with self._stage("audit", len(recomputed)) as timer:
+                elapsed_ms = int((time.time() - start_time) * 1000)
+                records = self._audit_records(recomputed, classification_result, elapsed_ms)
+                timer.items_out = len(self.audit_writer.submit(records))
+            spans.append(timer.span)
+        
+        self.stage_histogram.record(spans)
+        
+        cluster_analyses = list(state.analyses.values())
+        category_dist = {c: s.volume for c, s in state.cluster_stats.items() if s.volume > 0}
+        clustering_result = ClusteringResult(
+            clusters=[a.cluster for a in cluster_analyses],
+            total_signals=len(state.surfaced),
+            cluster_count=len(cluster_analyses),
+            category_distribution=dict(category_dist),
+            time_range={
+                "start": min((a.cluster.time_window_start for a in cluster_analyses), default=datetime.now()).isoformat(),
+                "end": max((a.cluster.time_window_end for a in cluster_analyses), default=datetime.now()).isoformat()
+            }
+        )
+        
+        return PipelineOutput(
+            governance_validated=len(state.validation_issues) == 0,
+            validation_issues=list(state.validation_issues),
+            classification_result=classification_result,
+            gating_result=gating_result,
+            clustering_result=clustering_result,
+            cluster_analyses=cluster_analyses,
+            processing_time_ms=int((time.time() - start_time) * 1000),
+            timestamp=datetime.now().isoformat(),
+            stage_timings=spans,
+            recomputed_clusters=[a.cluster.cluster_id for a in recomputed],
+            deduplication=deduplication.to_dict()
+        )
+    
+    def process_file(
+        self, 
+        file_path: str, 
+        checkpoint_dir: Optional[str] = None, 
+        chunk_size: Optional[int] = None, 
+        checkpoint_every: Optional[int] = None,
+        progress: Optional[Callable[[str, int], None]] = None
+    ) -> PipelineOutput:
+        """
+        Process a large CSV file in chunks, checkpointing progress.
+        
+        Each chunk runs incrementally (process_delta). At every checkpoint the
+        clusters changed since the previous one are audited once, then the
+        state changes since the previous checkpoint, input offset, totals and
+        audit cursor are saved to checkpoint_dir (see pipeline_checkpoint.py).
+        
+        Args:
+            file_path: CSV file to process
+            checkpoint_dir: Directory for checkpoints (None = no checkpointing)
+            chunk_size: Rows per chunk
+            checkpoint_every: Rows between checkpoints
+            progress: Called as progress(stage, rows_processed) after each
+                chunk ("processing") and before each audit write ("auditing")
+        
+        Returns:
+            PipelineOutput covering the whole file
+        """
+        checkpoint = PipelineCheckpoint.for_source(file_path)
+        store = CheckpointStore(checkpoint_dir) if checkpoint_dir else None
+        return self._run_checkpointed(checkpoint, store, chunk_size, checkpoint_every, progress)
+    
+    def resume(
+        self, 
+        checkpoint_dir: str, 
+        chunk_size: Optional[int] = None, 
+        checkpoint_every: Optional[int] = None,
+        progress: Optional[Callable[[str, int], None]] = None
+    ) -> PipelineOutput:
+        """
+        Continue an interrupted process_file run from its last checkpoint.
+        
+        The pipeline state is restored from the checkpoint's state log, so
+        records before the input offset are neither processed nor audited
+        again, and audit records of an interrupted write are only written
+        if they did not land. progress is reported as in process_file (rows
+        count from the file start).
+        
+        Raises:
+            FileNotFoundError: If there is no checkpoint (or the source file is gone)
+            ValueError: If the source file shrank, or the state log does not match the checkpoint
+        """
+        store = CheckpointStore(checkpoint_dir)
+        checkpoint = store.load()
+        if checkpoint is None:
+            raise FileNotFoundError(f"No checkpoint found in {checkpoint_dir}")
+        checkpoint.verify_source()
+        
+        # Finish the audit write that was in flight when the run stopped
+        if checkpoint.pending_records:
+            landed = set(self.audit_logger.record_ids_since(checkpoint.audit_offset))
+            missing = [r for r in checkpoint.pending_records if r.record_id not in landed]
+            self.audit_logger.log_decisions(missing, fsync=True)
+            checkpoint.pending_records = []
+            checkpoint.audit_offset = self.audit_logger.csv_offset()
+            store.save(checkpoint)
+        
+        return self._run_checkpointed(checkpoint, store, chunk_size, checkpoint_every, progress)
+    
+    def _run_checkpointed(
+        self, 
+        checkpoint: PipelineCheckpoint, 
+        store: Optional[CheckpointStore], 
+        chunk_size: Optional[int], 
+        checkpoint_every: Optional[int],
+        progress: Optional[Callable[[str, int], None]] = None
+    ) -> PipelineOutput:
+        """
+        Drive a file run from the checkpoint's input offset to the end of the source.
+        Records before the offset were processed and audited by an earlier
+        run: the state they built is restored from the state log.
+        """
+        checkpoint_every = checkpoint_every or self.CHECKPOINT_EVERY_ROWS
+        report = progress or (lambda stage, rows: None)
+        state = PipelineState()
+        if store is not None:
+            state = self._restore_state(checkpoint, store)
+            state.journal = StateJournal(issues=len(state.validation_issues))
+        rows = checkpoint.input_offset
+        dirty = set()
+        audited = []
+        rows_since_checkpoint = 0
+        
+        for events in iter_csv_events(checkpoint.source_path, chunk_size or self.FILE_CHUNK_SIZE, skip_rows=rows):
+            output = self.process_delta(events, state, audit=False)
+            recomputed = set(output.recomputed_clusters)
+            dirty.update(c for c, a in state.analyses.items() if a.cluster.cluster_id in recomputed)
+            rows += len(events)
+            checkpoint.input_offset = rows
+            rows_since_checkpoint += len(events)
+            report("processing", rows)
+            
+            if rows_since_checkpoint >= checkpoint_every:
+                report("auditing", rows)
+                audited.extend(self._checkpoint(checkpoint, store, state, dirty))
+                dirty = set()
+                rows_since_checkpoint = 0
+        
+        if not checkpoint.completed:
+            checkpoint.completed = True
+            report("auditing", rows)
+            audited.extend(self._checkpoint(checkpoint, store, state, dirty))
+        
+        output = self.process_delta([], state, audit=False)
+        output.recomputed_clusters = audited
+        return output
+    
+    def _restore_state(self, checkpoint: PipelineCheckpoint, store: CheckpointStore) -> PipelineState:
+        """
+        Rebuild the state at the checkpoint's input offset from the state log
+        and check it against the totals saved with the checkpoint.
+        
+        Raises:
+            ValueError: If they differ (the state log does not belong to the checkpoint)
+        """
+        state = PipelineState.from_deltas(store.load_state(checkpoint.state_size))
+        restored = (state.event_count, {c: n for c, n in state.class_distribution.items() if n})
+        if restored != (checkpoint.event_count, checkpoint.class_distribution):
+            raise ValueError(
+                f"State log does not match the checkpoint at {checkpoint.input_offset} records: "
+                f"{store.state_path}"
+            )
+        return state
+    
+    def _checkpoint(
+        self, 
+        checkpoint: PipelineCheckpoint, 
+        store: Optional[CheckpointStore], 
+        state: PipelineState, 
+        dirty: set
+    ) -> List[str]:
+        """
+        Audit clusters changed since the last checkpoint, then save progress.
+        The records are saved as pending *before* they are written, so resume()
+        can tell whether the write completed.
+        """
+        checkpoint.cluster_ids = dict(state.cluster_ids)
+        checkpoint.event_count = state.event_count
+        checkpoint.class_distribution = {c: n for c, n in state.class_distribution.items() if n}
+        analyses = [state.analyses[c] for c in sorted(dirty) if c in state.analyses]
+        records = self._audit_records(analyses, self._classification_from_state(state), 0)
+        
+        checkpoint.pending_records = records
+        checkpoint.audit_offset = self.audit_logger.csv_offset()
+        if store is not None:
+            checkpoint.state_size = store.append_state(state.checkpoint_delta())
+            store.save(checkpoint)
+        
+        # Written synchronously and durably: the checkpoint below records it as done
+        if records:
+            self.audit_logger.log_decisions(records, fsync=True)
+            checkpoint.pending_records = []
+            checkpoint.audit_offset = self.audit_logger.csv_offset()
+            if store is not None:
+                store.save(checkpoint)
+        
+        return [a.cluster.cluster_id for a in analyses]
+    
+    def _classification_from_state(self, state: PipelineState) -> BatchClassificationResult:
+        """Assemble a BatchClassificationResult over all results held in state."""
+        return BatchClassificationResult(
+            results=list(state.results.values()),
+            class_distribution=dict(state.class_distribution),
+            average_confidence=state.confidence_sum / max(state.event_count, 1)
         )
     
-    def _analyze_cluster(self, cluster: SignalCluster) -> ClusterAnalysis:
-        """Analyze a single cluster through Stages 4-7."""
+    def _audit_records(
+        self, 
+        analyses: List[ClusterAnalysis], 
+        classification_result: BatchClassificationResult, 
+        processing_time_ms: int
+    ) -> List[AuditRecord]:
+        """
+        Create PENDING audit records for analysed clusters.
+        Uses the rationale summary unless the full rationale was already generated.
+        """
+        return [
+            self.audit_logger.create_record(
+                cluster=analysis.cluster,
+                classification_result=classification_result,
+                risk_score=analysis.risk_score,
+                confidence=analysis.confidence,
+                rationale=analysis.rationale or self.rationale_gen.summarize(analysis.cluster, analysis.risk_score),
+                escalation=analysis.escalation,
+                human_decision="PENDING",
+                human_user="SYSTEM",
+                processing_time_ms=processing_time_ms
+            )
+            for analysis in analyses
+        ]
+    
+    def _count_gated(self, state: PipelineState, gated: GatedSignal, clustering: ClusteringEngine):
+        """Add a gating decision to the running totals (and a surfaced signal to its category stats)."""
+        volume = gated.multiplicity
+        state.gated_volumes[gated.event_id] = volume
+        if gated.event_id in state.archived:
+            state.noise_volume += volume
+            state.archive_reasons[gated.archive_reason.code if gated.archive_reason else "unknown"] += volume
+            return
+        
+        state.signal_volume += volume
+        stats = state.cluster_stats.get(gated.predicted_class)
+        if stats is None:
+            keywords = clustering.stats_keywords(gated.predicted_class, tuple(self.risk_scorer.TRUST_IMPACT_KEYWORDS))
+            stats = state.cluster_stats[gated.predicted_class] = ClusterStats(keywords=keywords)
+        margin, label = self.confidence_scorer.signal_margin(gated)
+        first, last = clustering._event_time_range(gated) or (None, None)
+        stats.add(
+            gated.event_id, gated, state.ordinals[gated.event_id],
+            timestamp=first, last_timestamp=last,
+            margin=margin, label=label
+        )
+    
+    def _uncount_gated(self, state: PipelineState, event_id: str):
+        """Take an event's earlier gating decision out of the running totals."""
+        volume = state.gated_volumes.pop(event_id, None)
+        if volume is None:
+            return
+        if event_id in state.surfaced:
+            state.signal_volume -= volume
+        elif event_id in state.archived:
+            previous = state.archived[event_id]
+            state.noise_volume -= volume
+            state.archive_reasons[previous.archive_reason.code if previous.archive_reason else "unknown"] -= volume
+    
+    def _gating_result_from_state(self, state: PipelineState) -> GatingResult:
+        """Assemble a GatingResult from the gated sets and running totals held in state."""
+        signal_volume = state.signal_volume
+        noise_volume = state.noise_volume
+        total = signal_volume + noise_volume
+        reasons = {code: count for code, count in state.archive_reasons.items() if count > 0}
+        return GatingResult(
+            signals=list(state.surfaced.values()),
+            noise=list(state.archived.values()),
+            total_processed=total,
+            signal_count=signal_volume,
+            noise_count=noise_volume,
+            gating_summary={
+                "signal_rate": signal_volume / max(total, 1),
+                "noise_rate": noise_volume / max(total, 1),
+                "archive_reasons": dict(reasons),
+                "thresholds_used": {
+                    "default": self.signal_gate.CONFIDENCE_THRESHOLD,
+                    **self.signal_gate.SENSITIVE_CLASS_THRESHOLDS
+                }
+            }
+        )
+    
+    def _content_key(self, result: ClassificationResult) -> str:
+        """Content key for volume grouping (stable across processes, unlike hash())."""
+        return result.raw_text[:50]
+    
+    def _build_volume_map(
+        self, 
+        results: List[ClassificationResult], 
+        content_counts: Optional[Counter] = None
+    ) -> Dict[str, int]:
+        """
+        Map event_id to the number of events sharing its content prefix
+        (collapsed duplicates count by multiplicity).
+        Used by the gating volume override.
+        
+        Args:
+            results: Classification results to map
+            content_counts: Optional running counts to update (e.g. across micro-batches)
+        """
+        # Since event_ids are unique, we need to group by SIMILARITY or CONTENT hash
+        # For this pipeline, we'll use a simplified content-based volume for Stage 2
+        content_hashes = [self._content_key(r) for r in results]
+        if content_counts is None:
+            content_counts = Counter()
+        for r, h in zip(results, content_hashes):
+            content_counts[h] += r.multiplicity
+        
+        return {r.event_id: content_counts[h] for r, h in zip(results, content_hashes)}
+    
+    def _analyze_cluster(
+        self, 
+        cluster: SignalCluster, 
+        confidence: Optional[ConfidenceScore] = None
+    ) -> ClusterAnalysis:
+        """Analyze a single cluster through Stages 4-7 (rationale left to first view)."""
         # Stage 4: Risk Scoring
         risk_score = self.risk_scorer.calculate_risk_score(cluster)
         
         # Stage 5: Confidence Scoring
-        confidence = self.confidence_scorer.calculate_confidence(cluster)
-        
-        # Stage 6: Rationale Generation
-        rationale = self.rationale_gen.generate_rationale(cluster, risk_score, confidence)
+        if confidence is None:
+            confidence = self.confidence_scorer.calculate_confidence(cluster)
         
         # Stage 7: Escalation Routing
         escalation = self.escalation_router.suggest_queue(cluster, risk_score, confidence)
@@ -247,7 +1187,7 @@ class ResponsibleAIPipeline:
             cluster=cluster,
             risk_score=risk_score,
             confidence=confidence,
-            rationale=rationale,
+            rationale=None,
             escalation=escalation
         )
     
@@ -272,6 +1212,63 @@ class ResponsibleAIPipeline:
         """
         return self.audit_logger.update_decision(cluster_id, decision, user, reason)
     
+    def log_human_decisions(self, decisions: List[Dict[str, Any]], role: str) -> List[Dict[str, Any]]:
+        """
+        Log many human decisions at once (bulk triage).
+        RBAC is checked once per distinct decision; authorized items are
+        written as a single audit group commit.
+        
+        Args:
+            decisions: Dicts with cluster_id, decision, user and optional reason
+            role: Role of the caller (see authz.Role)
+        
+        Returns:
+            Per-item results, in order: cluster_id, decision, status
+            ("logged" | "forbidden" | "invalid" | "failed"), previous_decision,
+            and record_id when logged
+        """
+        allowed = authorize_decisions(role, [d.get("decision", "") for d in decisions])
+        self.audit_logger.refresh()
+        
+        results = []
+        accepted = []
+        for item in decisions:
+            cluster_id = item.get("cluster_id")
+            decision = item.get("decision", "")
+            previous = self.audit_logger.decisions.get(cluster_id) if cluster_id else None
+            result = {
+                "cluster_id": cluster_id,
+                "decision": decision,
+                "previous_decision": previous.decision if previous else None
+            }
+            if not cluster_id or not item.get("user"):
+                result.update(status="invalid", detail="cluster_id and user are required")
+            elif not allowed[decision]:
+                result.update(status="forbidden", detail=f"Role '{role}' is not authorized to perform decision '{decision}'")
+            else:
+                result["status"] = "logged"
+                accepted.append((result, item))
+            results.append(result)
+        
+        try:
+            record_ids = self.audit_logger.update_decisions([
+                {
+                    "cluster_id": item["cluster_id"],
+                    "human_decision": item["decision"],
+                    "human_user": item["user"],
+                    "decision_reason": item.get("reason")
+                }
+                for _, item in accepted
+            ])
+        except OSError as e:
+            for result, _ in accepted:
+                result.update(status="failed", detail=str(e))
+            return results
+        
+        for (result, _), record_id in zip(accepted, record_ids):
+            result["record_id"] = record_id
+        return results
+    
     def get_governance_display(self) -> Dict[str, Any]:
         """Get governance information for UI display."""
         return {
@@ -284,19 +1281,35 @@ class ResponsibleAIPipeline:
 
 # Singleton instance
 _pipeline = None
+_pipeline_lock = threading.Lock()
 
 def get_pipeline() -> ResponsibleAIPipeline:
     """Get the singleton pipeline instance."""
     global _pipeline
     if _pipeline is None:
-        _pipeline = ResponsibleAIPipeline()
+        with _pipeline_lock:
+            if _pipeline is None:
+                budget = os.getenv("PIPELINE_LATENCY_BUDGET_MS")
+                _pipeline = ResponsibleAIPipeline(latency_budget_ms=float(budget) if budget else None)
     return _pipeline
 
 
-# Convenience function
-def process_events(events: List[Dict[str, Any]]) -> PipelineOutput:
+# Convenience functions
+def process_events(events: List[Dict[str, Any]], durable_audit: bool = False) -> PipelineOutput:
     """Process events through the full pipeline."""
-    return get_pipeline().process(events)
+    return get_pipeline().process(events, durable_audit=durable_audit)
+
+def process_delta(events: List[Dict[str, Any]], state: PipelineState) -> PipelineOutput:
+    """Process new events incrementally against a prior state."""
+    return get_pipeline().process_delta(events, state)
+
+def process_file(file_path: str, checkpoint_dir: Optional[str] = None) -> PipelineOutput:
+    """Process a large CSV file with checkpoints."""
+    return get_pipeline().process_file(file_path, checkpoint_dir=checkpoint_dir)
+
+def resume(checkpoint_dir: str) -> PipelineOutput:
+    """Resume an interrupted file run from its last checkpoint."""
+    return get_pipeline().resume(checkpoint_dir)
 
 
 if __name__ == "__main__":
@@ -325,10 +1338,14 @@ if __name__ == "__main__":
     print()
     
     for analysis in result.cluster_analyses:
-        card = analysis.to_analyst_card()
+        card = analysis.to_analyst_card(include_rationale=True)
         print(f"--- {card['title']} ---")
         print(f"Risk: {card['risk_score']}/10 ({card['risk_level']})")
-        print(f"Confidence: {card['confidence_percentage']:.0f}% ({card['confidence_level']})")
+        if card['confidence_percentage'] is not None:
+            print(f"Confidence: {card['confidence_percentage']:.0f}% ({card['confidence_level']})")
         print(f"Queue: {card['suggested_queue']} ({card['priority']})")
-        print(f"Rationale: {card['rationale']['what_signal']}")
+        if card['rationale_pending']:
+            print("Rationale: pending (audit deferred)")
+        else:
+            print(f"Rationale: {card['rationale']['what_signal']}")
         print()
@@ -171,24 +171,30 @@ class RiskScorer:
     
     def _calculate_trust_impact(self, cluster: Any) -> RiskComponent:
         """Calculate trust impact based on keyword analysis."""
-        # Collect all text from cluster
-        all_text = ""
-        signals = cluster.signals if hasattr(cluster, 'signals') else []
+        stats = getattr(cluster, 'stats', None)
+        if stats is not None:
+            # Incrementally built cluster: keyword hits are counted per member
+            found = lambda keyword: stats.keyword_counts[keyword] > 0
+        else:
+            # Collect all text from cluster
+            all_text = ""
+            signals = cluster.signals if hasattr(cluster, 'signals') else []
         
-        for signal in signals:
-            if hasattr(signal, 'classification_result'):
-                all_text += " " + signal.classification_result.raw_text.lower()
-            elif hasattr(signal, 'raw_text'):
-                all_text += " " + signal.raw_text.lower()
-            elif hasattr(signal, 'content'):
-                all_text += " " + signal.content.lower()
+            for signal in signals:
+                if hasattr(signal, 'classification_result'):
+                    all_text += " " + signal.classification_result.raw_text.lower()
+                elif hasattr(signal, 'raw_text'):
+                    all_text += " " + signal.raw_text.lower()
+                elif hasattr(signal, 'content'):
+                    all_text += " " + signal.content.lower()
+            found = lambda keyword: keyword in all_text
         
         # Score keywords
         total_weight = 0.0
         found_keywords = []
         
         for keyword, weight in self.TRUST_IMPACT_KEYWORDS.items():
-            if keyword in all_text:
+            if found(keyword):
                 total_weight += weight
                 found_keywords.append(keyword)
         
@@ -239,10 +245,16 @@ class RiskScorer:
             reason = f"Score reduced due to limited evidence ({volume} signals)"
         
         # Conservative if only one signal type/source
-        if hasattr(cluster, 'signals') and len(set(
-            getattr(s, 'source', 'unknown') for s in cluster.signals 
-            if hasattr(s, 'source')
-        )) <= 1:
+        stats = getattr(cluster, 'stats', None)
+        if stats is not None:
+            single_source = stats.sources <= 1
+        else:
+            # Collapsed duplicates count every source they stand for
+            single_source = hasattr(cluster, 'signals') and len(set(
+                source for s in cluster.signals
+                for source in (getattr(s, 'sources', None) or ([s.source] if hasattr(s, 'source') else []))
+            )) <= 1
+        if single_source:
             if score >= 5.0:
                 score = score * 0.9
                 is_conservative = True
@@ -39,6 +39,16 @@ class GatedSignal:
     status: SignalStatus
     archive_reason: ArchiveReason = None
     classification_result: Any = None  # Original ClassificationResult
+    
+    @property
+    def multiplicity(self) -> int:
+        """Raw events this signal stands for (1 unless duplicates were collapsed)."""
+        return getattr(self.classification_result, 'multiplicity', 1)
+    
+    @property
+    def sources(self) -> List[str]:
+        """Distinct sources of the raw events this signal stands for."""
+        return list(getattr(self.classification_result, 'sources', None) or [])
 
 
 @dataclass
@@ -156,6 +166,10 @@ class SignalGate:
         noise = []
         archive_reasons_summary = {}
         
+        # Counts are in raw events: collapsed duplicates count by multiplicity
+        signal_volume = 0
+        noise_volume = 0
+        
         for result in classification_results:
             volume = volume_map.get(result.event_id, 1)
             should_archive, reason = self._should_archive(result, volume)
@@ -171,21 +185,25 @@ class SignalGate:
             
             if should_archive:
                 noise.append(gated)
+                noise_volume += gated.multiplicity
                 # Track reason counts
                 reason_code = reason.code if reason else "unknown"
-                archive_reasons_summary[reason_code] = archive_reasons_summary.get(reason_code, 0) + 1
+                archive_reasons_summary[reason_code] = archive_reasons_summary.get(reason_code, 0) + gated.multiplicity
             else:
                 signals.append(gated)
+                signal_volume += gated.multiplicity
+        
+        total = signal_volume + noise_volume
         
         return GatingResult(
             signals=signals,
             noise=noise,
-            total_processed=len(classification_results),
-            signal_count=len(signals),
-            noise_count=len(noise),
+            total_processed=total,
+            signal_count=signal_volume,
+            noise_count=noise_volume,
             gating_summary={
-                "signal_rate": len(signals) / max(len(classification_results), 1),
-                "noise_rate": len(noise) / max(len(classification_results), 1),
+                "signal_rate": signal_volume / max(total, 1),
+                "noise_rate": noise_volume / max(total, 1),
                 "archive_reasons": archive_reasons_summary,
                 "thresholds_used": {
                     "default": self.CONFIDENCE_THRESHOLD,
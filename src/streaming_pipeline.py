@@ -0,0 +1,449 @@
+"""
+Streaming Pipeline - Micro-Batch Stage Execution
+================================================
+Runs the front of the pipeline as concurrent stages connected by
+bounded queues, so alerts are raised per micro-batch instead of per file.
+
+Stages (one thread each):
+source -> governance (+ duplicate collapse) -> classification -> gating -> clustering
+
+- Queues are bounded: a slow stage blocks its upstream, and ultimately
+  the source stops pulling events (backpressure).
+- Clustering keeps tumbling event-time windows per category. When the
+  event-time watermark passes a window's end plus the allowed lateness,
+  the window closes and its cluster runs Stages 4-7 + audit, then is
+  emitted immediately.
+- Events that arrive after their window closed are late: they are left out
+  of windowing and counted (late_events in the stream stats), rather than
+  each opening a tiny window of its own. Raise the allowed lateness for
+  sources that deliver out of order.
+
+Responsible AI Mapping:
+- Reliability & Safety: Faster event-to-alert latency during incidents
+- Accountability: Every emitted cluster is audited exactly as in batch mode
+"""
+
+import queue
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from guardrails import validate_input
+from naive_bayes_classifier import BatchClassificationResult
+from clustering_engine import ClusteringEngine, SignalCluster
+from responsible_ai_pipeline import ResponsibleAIPipeline, ClusterAnalysis, get_pipeline
+
+
+# Marks the end of the stream on every queue
+_END = object()
+
+
+@dataclass
+class _StageFailure:
+    """Carries an exception from a stage thread to the consumer."""
+    stage: str
+    error: BaseException
+
+
+@dataclass
+class _Window:
+    """An open tumbling window for one category."""
+    category: str
+    start: datetime
+    end: datetime
+    signals: List[Any] = field(default_factory=list)
+    timestamps: List[datetime] = field(default_factory=list)
+
+
+@dataclass
+class StreamingStats:
+    """
+    Running counters for a streaming run. Stage threads update them through
+    add()/add_issues(); other threads read a consistent copy via snapshot().
+    """
+    events_in: int = 0
+    micro_batches: int = 0
+    duplicates_collapsed: int = 0
+    signals_surfaced: int = 0
+    noise_archived: int = 0
+    clusters_emitted: int = 0
+    windows_below_min_size: int = 0
+    late_events: int = 0
+    validation_issues: List[str] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    
+    def add(self, **increments: int):
+        """Increment counters atomically, e.g. add(events_in=200, micro_batches=1)."""
+        with self._lock:
+            for name, amount in increments.items():
+                setattr(self, name, getattr(self, name) + amount)
+    
+    def add_issues(self, issues: List[str]):
+        with self._lock:
+            self.validation_issues.extend(issues)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """All counters at one instant (validation_issues as a count)."""
+        with self._lock:
+            return {
+                "events_in": self.events_in,
+                "micro_batches": self.micro_batches,
+                "duplicates_collapsed": self.duplicates_collapsed,
+                "signals_surfaced": self.signals_surfaced,
+                "noise_archived": self.noise_archived,
+                "clusters_emitted": self.clusters_emitted,
+                "windows_below_min_size": self.windows_below_min_size,
+                "late_events": self.late_events,
+                "validation_issues": len(self.validation_issues)
+            }
+
+
+class StreamingPipelineRunner:
+    """
+    Streams events through the pipeline in micro-batches.
+    
+    Usage:
+        runner = StreamingPipelineRunner()
+        for analysis in runner.run(event_iterator):
+            publish(analysis.to_analyst_card())
+    """
+    
+    # Events per micro-batch
+    MICRO_BATCH_SIZE = 200
+    
+    # Micro-batches buffered between two stages
+    QUEUE_SIZE = 4
+    
+    # Event-time grace after a window's end before it closes
+    ALLOWED_LATENESS_MINUTES = 5
+    
+    # Seconds between checks for cancellation while blocked on a queue
+    POLL_INTERVAL = 0.1
+    
+    # Distinct contents whose running volume is kept for gating; the least
+    # recently seen are forgotten first, so unbounded streams stay bounded
+    MAX_CONTENT_KEYS = 100_000
+    
+    def __init__(
+        self,
+        pipeline: Optional[ResponsibleAIPipeline] = None,
+        micro_batch_size: int = None,
+        queue_size: int = None,
+        window_minutes: int = None,
+        allowed_lateness_minutes: Optional[float] = None
+    ):
+        self.pipeline = pipeline or get_pipeline()
+        self.micro_batch_size = micro_batch_size or self.MICRO_BATCH_SIZE
+        self.queue_size = queue_size or self.QUEUE_SIZE
+        
+        # Windowed clustering uses its own engine so batch state is untouched
+        self.clustering = ClusteringEngine()
+        self.window = timedelta(minutes=window_minutes or self.clustering.TIME_WINDOW_MINUTES)
+        self.allowed_lateness = timedelta(minutes=(
+            self.ALLOWED_LATENESS_MINUTES if allowed_lateness_minutes is None else allowed_lateness_minutes
+        ))
+        
+        self.stats = StreamingStats()
+        self._content_counts: Counter = Counter()
+        self._stop = threading.Event()
+    
+    def _put(self, q: queue.Queue, item: Any) -> bool:
+        """Blocking put that gives up once the run is cancelled."""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=self.POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _get(self, q: queue.Queue) -> Any:
+        """Blocking get that returns _END once the run is cancelled."""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _END
+    
+    def _run_stage(self, name: str, inbox: Optional[queue.Queue], outbox: queue.Queue, work):
+        """
+        Thread body for one stage.
+        Consumes items until _END, forwards failures downstream.
+        """
+        try:
+            if inbox is None:
+                work(outbox)
+            else:
+                while True:
+                    item = self._get(inbox)
+                    if item is _END or isinstance(item, _StageFailure):
+                        if isinstance(item, _StageFailure):
+                            self._put(outbox, item)
+                        break
+                    work(item, outbox)
+        except BaseException as e:
+            self._put(outbox, _StageFailure(name, e))
+        finally:
+            self._put(outbox, _END)
+    
+    def _source(self, events: Iterable[Dict[str, Any]]):
+        """Chunk the input iterable into micro-batches."""
+        def work(outbox: queue.Queue):
+            batch = []
+            for event in events:
+                if self._stop.is_set():
+                    return
+                batch.append(event)
+                if len(batch) >= self.micro_batch_size:
+                    self.stats.add(events_in=len(batch), micro_batches=1)
+                    # Blocks while downstream is saturated (backpressure)
+                    if not self._put(outbox, batch):
+                        return
+                    batch = []
+            if batch:
+                self.stats.add(events_in=len(batch), micro_batches=1)
+                self._put(outbox, batch)
+        return work
+    
+    def _governance(self, batch: List[Dict[str, Any]], outbox: queue.Queue):
+        """Stage 0: validate (and redact) each event, then collapse duplicates."""
+        with self.pipeline._stage("governance", len(batch)) as timer:
+            for event in batch:
+                result = validate_input(event)
+                if not result.is_valid:
+                    self.stats.add_issues(result.violations)
+            timer.items_out = len(batch)
+        
+        # Collapse within the micro-batch (representatives already sent downstream are final)
+        with self.pipeline._stage("deduplication", len(batch)) as dedup_timer:
+            deduplication = self.pipeline.deduplicator.deduplicate(batch)
+            self.stats.add(duplicates_collapsed=deduplication.collapsed_count)
+            dedup_timer.items_out = deduplication.distinct_count
+        self.pipeline.stage_histogram.record([timer.span, dedup_timer.span])
+        self._put(outbox, deduplication.events)
+    
+    def _classification(self, batch: List[Dict[str, Any]], outbox: queue.Queue):
+        """Stage 1: classify the micro-batch."""
+        with self.pipeline._stage("classification", len(batch)) as timer:
+            result = self.pipeline.classifier.classify_batch(batch)
+            timer.items_out = len(result.results)
+        self.pipeline.stage_histogram.record([timer.span])
+        self._put(outbox, result.results)
+    
+    def _gating(self, results: List[Any], outbox: queue.Queue):
+        """Stage 2: gate against the running content volume."""
+        with self.pipeline._stage("gating", len(results)) as timer:
+            volume_map = self.pipeline._build_volume_map(results, self._content_counts)
+            self._forget_stale_content(results)
+            gating_result = self.pipeline.signal_gate.gate_signals(results, volume_map=volume_map)
+            self.stats.add(signals_surfaced=gating_result.signal_count, noise_archived=gating_result.noise_count)
+            timer.items_out = len(gating_result.signals)
+        self.pipeline.stage_histogram.record([timer.span])
+        self._put(outbox, gating_result.signals)
+    
+    def _forget_stale_content(self, results: List[Any]):
+        """Keep at most MAX_CONTENT_KEYS volume counts, evicting the least recently seen."""
+        counts = self._content_counts
+        for key in {self.pipeline._content_key(r) for r in results}:
+            counts[key] = counts.pop(key)
+        while len(counts) > self.MAX_CONTENT_KEYS:
+            del counts[next(iter(counts))]
+    
+    def _signal_time(self, signal: Any) -> datetime:
+        """Event time for a gated signal, naive UTC (falls back to arrival time)."""
+        return self.clustering._event_timestamp(signal) or datetime.now()
+    
+    def _window_start(self, ts: datetime) -> datetime:
+        """Align an event time to its tumbling window."""
+        epoch = datetime(1970, 1, 1)
+        size = self.window.total_seconds()
+        offset = (ts - epoch).total_seconds() // size * size
+        return epoch + timedelta(seconds=offset)
+    
+    def _clustering(self):
+        """Stage 3: assign signals to windows and close expired ones."""
+        windows: Dict[Tuple[str, datetime], _Window] = {}
+        watermark: List[Optional[datetime]] = [None]
+        
+        def close(expired: List[_Window], outbox: queue.Queue):
+            ready = []
+            for w in expired:
+                if not self.clustering._meets_min_size(w.category, w.signals):
+                    self.stats.add(windows_below_min_size=1)
+                    continue
+                ready.append(self.clustering._build_cluster(w.category, w.signals, w.timestamps))
+            if ready:
+                self._put(outbox, ready)
+        
+        def work(signals: List[Any], outbox: queue.Queue):
+            with self.pipeline._stage("clustering", len(signals)) as timer:
+                late = 0
+                for signal in signals:
+                    ts = self._signal_time(signal)
+                    category = getattr(signal, 'predicted_class', 'MIXED')
+                    start = self._window_start(ts)
+                    # Its window has closed (or would close at once): late
+                    if watermark[0] is not None and start + self.window + self.allowed_lateness <= watermark[0]:
+                        late += getattr(signal, 'multiplicity', 1)
+                        continue
+                    key = (category, start)
+                    if key not in windows:
+                        windows[key] = _Window(category, start, start + self.window)
+                    windows[key].signals.append(signal)
+                    windows[key].timestamps.append(ts)
+                    if watermark[0] is None or ts > watermark[0]:
+                        watermark[0] = ts
+                
+                if late:
+                    self.stats.add(late_events=late)
+                
+                closes_by = watermark[0] - self.allowed_lateness if watermark[0] else None
+                expired = [w for w in windows.values() if w.end <= closes_by] if closes_by else []
+                for w in expired:
+                    del windows[(w.category, w.start)]
+                expired.sort(key=lambda w: (w.start, w.category))
+                timer.items_out = len(expired)
+            self.pipeline.stage_histogram.record([timer.span])
+            close(expired, outbox)
+        
+        def flush(outbox: queue.Queue):
+            remaining = sorted(windows.values(), key=lambda w: (w.start, w.category))
+            windows.clear()
+            close(remaining, outbox)
+        
+        return work, flush
+    
+    def _analyze(self, clusters: List[SignalCluster]) -> List[ClusterAnalysis]:
+        """Stages 4-7 and audit for clusters whose windows just closed."""
+        confidences = self.pipeline.confidence_scorer.calculate_confidence_batch(clusters)
+        analyses = self.pipeline._map(self.pipeline._analyze_cluster, clusters, confidences)
+        
+        records = [
+            self.pipeline.audit_logger.create_record(
+                cluster=analysis.cluster,
+                classification_result=BatchClassificationResult(
+                    results=[s.classification_result for s in analysis.cluster.signals],
+                    class_distribution={},
+                    average_confidence=0.0
+                ),
+                risk_score=analysis.risk_score,
+                confidence=analysis.confidence,
+                rationale=self.pipeline.rationale_gen.summarize(analysis.cluster, analysis.risk_score),
+                escalation=analysis.escalation,
+                human_decision="PENDING",
+                human_user="SYSTEM"
+            )
+            for analysis in analyses
+        ]
+        self.pipeline.audit_writer.submit(records)
+        self.pipeline._track(analyses)
+        self.stats.add(clusters_emitted=len(analyses))
+        return analyses
+    
+    
+    def run(self, events: Iterable[Dict[str, Any]]) -> Iterator[ClusterAnalysis]:
+        """
+        Stream events through the pipeline.
+        
+        Args:
+            events: Any iterable of event dictionaries (consumed lazily)
+        
+        Yields:
+            ClusterAnalysis for each cluster as its window closes
+        """
+        self._stop.clear()
+        self.stats = StreamingStats()
+        self._content_counts = Counter()
+        
+        q_gov = queue.Queue(maxsize=self.queue_size)
+        q_cls = queue.Queue(maxsize=self.queue_size)
+        q_gate = queue.Queue(maxsize=self.queue_size)
+        q_cluster = queue.Queue(maxsize=self.queue_size)
+        q_out = queue.Queue(maxsize=self.queue_size)
+        
+        cluster_work, cluster_flush = self._clustering()
+        
+        threads = [
+            threading.Thread(target=self._run_stage, args=("source", None, q_gov, self._source(events))),
+            threading.Thread(target=self._run_stage, args=("governance", q_gov, q_cls, self._governance)),
+            threading.Thread(target=self._run_stage, args=("classification", q_cls, q_gate, self._classification)),
+            threading.Thread(target=self._run_stage, args=("gating", q_gate, q_cluster, self._gating)),
+        ]
+        
+        def clustering_thread():
+            try:
+                while True:
+                    item = self._get(q_cluster)
+                    if item is _END:
+                        if not self._stop.is_set():
+                            cluster_flush(q_out)
+                        break
+                    if isinstance(item, _StageFailure):
+                        self._put(q_out, item)
+                        break
+                    cluster_work(item, q_out)
+            except BaseException as e:
+                self._put(q_out, _StageFailure("clustering", e))
+            finally:
+                self._put(q_out, _END)
+        
+        threads.append(threading.Thread(target=clustering_thread))
+        for t in threads:
+            t.daemon = True
+            t.start()
+        
+        try:
+            while True:
+                item = self._get(q_out)
+                if item is _END:
+                    break
+                if isinstance(item, _StageFailure):
+                    raise RuntimeError(f"Streaming stage '{item.stage}' failed") from item.error
+                for analysis in self._analyze(item):
+                    yield analysis
+        finally:
+            # Unblock and stop all stage threads (also on early consumer exit)
+            self._stop.set()
+            for t in threads:
+                t.join(timeout=5)
+
+
+# Convenience function
+def stream_events(events: Iterable[Dict[str, Any]], micro_batch_size: int = None) -> Iterator[ClusterAnalysis]:
+    """Stream events through the pipeline, yielding clusters as windows close."""
+    return StreamingPipelineRunner(micro_batch_size=micro_batch_size).run(events)
+
+
+if __name__ == "__main__":
+    # Demo: two 30-minute windows of synthetic events
+    base = datetime(2026, 1, 30, 10, 0, 0)
+    
+    def generate():
+        texts = [
+            "CRITICAL: 500 Internal Server Error - Gateway Timeout",
+            "Got suspicious SMS about OTP, this is a scam!",
+            "Hearing rumors that ATMs are empty, bank collapse?",
+        ]
+        for i in range(600):
+            yield {
+                "event_id": f"stream-{i}",
+                "content": texts[i % len(texts)],
+                "source": "Tweet",
+                "timestamp": (base + timedelta(seconds=6 * i)).isoformat(),
+            }
+    
+    runner = StreamingPipelineRunner(micro_batch_size=50)
+    
+    print("=== Streaming Pipeline Demo ===\n")
+    for analysis in runner.run(generate()):
+        card = analysis.to_analyst_card()
+        print(f"[{analysis.cluster.time_window_start:%H:%M}-{analysis.cluster.time_window_end:%H:%M}] "
+              f"{card['cluster_id']}: {card['title']} (volume {card['volume']}, risk {card['risk_score']})")
+    
+    print()
+    print(f"Events: {runner.stats.events_in} in {runner.stats.micro_batches} micro-batches")
+    print(f"Clusters emitted: {runner.stats.clusters_emitted}")
+    print(f"Late events: {runner.stats.late_events}")
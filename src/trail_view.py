@@ -0,0 +1,218 @@
+"""
+Trail View - Incrementally Maintained Projections of the Audit Trail
+====================================================================
+Base class for in-memory views derived from the audit CSV trail
+(DecisionView, AuditStats).
+
+A view folds each trail row into its state exactly once:
+- apply(): rows just written by AuditLogger (under its write lock)
+- catch_up(): rows another process appended between two CSV offsets
+- startup: load the persisted snapshot, then scan only the CSV bytes
+  written after it (a full scan if there is no usable snapshot)
+
+Snapshots are written atomically every SNAPSHOT_EVERY_ROWS rows and on
+flush(). Each one records the CSV byte offset it covers and the trail's
+first record ID, so a snapshot of an archived trail is never reused.
+
+Subclasses define COLUMNS (the fields they read) and implement the
+abstract _fold, _snapshot and _restore (checked at instantiation).
+
+Responsible AI Mapping:
+- Auditability: Views are derived from, and rebuildable from, the audit trail
+"""
+
+import csv
+import io
+import json
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from audit_store import BoundedReader
+from file_lock import atomic_write_json
+
+
+def is_decision_update(row: Dict[str, Any]) -> bool:
+    """Decision update rows carry a decision but no category (see AuditLogger.update_decision)."""
+    if row.get("update_type") == "DECISION_UPDATE":
+        return True
+    return not row.get("signal_category") and bool(row.get("human_decision"))
+
+
+class TrailView(ABC):
+    """
+    Base class: snapshot persistence and incremental CSV catch-up.
+    Writes come from AuditLogger (under its lock); reads are thread-safe.
+    """
+    
+    # Rows applied between snapshot saves
+    SNAPSHOT_EVERY_ROWS = 1000
+    
+    # Trail columns passed to _fold
+    COLUMNS: Tuple[str, ...] = ()
+    
+    # Bumped when the snapshot layout changes; older snapshots are rebuilt from the trail
+    SNAPSHOT_VERSION = 1
+    
+    def __init__(self, csv_path: str, snapshot_path: str):
+        """
+        Args:
+            csv_path: Audit CSV trail the view folds
+            snapshot_path: Persisted snapshot (JSON)
+        """
+        self.csv_path = Path(csv_path)
+        self.snapshot_path = Path(snapshot_path)
+        self._lock = threading.Lock()
+        self._offset = 0
+        self._unsaved = 0
+        self._first_record_id = self._read_first_record_id()
+        self._load()
+    
+    @abstractmethod
+    def _fold(self, row: Dict[str, str]):
+        """Fold one trail row into the view (caller holds the lock)."""
+    
+    @abstractmethod
+    def _snapshot(self) -> Dict[str, Any]:
+        """View state to persist (caller holds the lock)."""
+    
+    @abstractmethod
+    def _restore(self, snapshot: Dict[str, Any]):
+        """Load view state from a snapshot."""
+    
+    def _read_first_record_id(self) -> Optional[str]:
+        """ID of the trail's first row; identifies the trail a snapshot belongs to."""
+        try:
+            with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                next(reader, None)
+                row = next(reader, None)
+        except FileNotFoundError:
+            return None
+        return row[0] if row else None
+    
+    def _load(self):
+        """Load the snapshot if it still matches the trail, then catch up from the CSV."""
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            snapshot = None
+        
+        size = self.csv_path.stat().st_size if self.csv_path.exists() else 0
+        if (snapshot and snapshot.get("first_record_id") == self._first_record_id
+                and snapshot.get("version", 1) == self.SNAPSHOT_VERSION
+                and snapshot.get("csv_offset", 0) <= size):
+            self._restore(snapshot)
+            self._offset = snapshot["csv_offset"]
+        
+        caught_up = self._scan(self._offset, size)
+        self._offset = size
+        if caught_up:
+            self.save()
+    
+    def _scan(self, offset: int, end_offset: int) -> int:
+        """Fold CSV rows between two byte offsets into the view. Returns rows applied."""
+        if end_offset <= offset:
+            return 0
+        
+        with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), None) or []
+        columns = {name: i for i, name in enumerate(header)}
+        indices = [(name, columns[name]) for name in self.COLUMNS if name in columns]
+        
+        applied = 0
+        raw = open(self.csv_path, 'rb')
+        raw.seek(offset)
+        with io.TextIOWrapper(BoundedReader(raw, end_offset - offset), encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            if offset == 0:
+                next(reader, None)
+            
+            for row in reader:
+                if len(row) < len(header):
+                    continue
+                self._fold({name: row[i] for name, i in indices})
+                applied += 1
+        return applied
+    
+    def catch_up(self, offset: int, end_offset: int):
+        """Fold rows another process appended between two CSV offsets."""
+        with self._lock:
+            if self._first_record_id is None:
+                self._first_record_id = self._read_first_record_id()
+            applied = self._scan(offset, end_offset)
+            self._offset = end_offset
+            self._unsaved += applied
+    
+    def apply(self, rows: List[Dict[str, str]], csv_offset: int):
+        """
+        Fold rows just appended to the trail.
+        
+        Args:
+            rows: Flat CSV rows, in write order
+            csv_offset: CSV size after the rows were written
+        """
+        with self._lock:
+            for row in rows:
+                self._fold(row)
+            if self._first_record_id is None and rows:
+                self._first_record_id = rows[0].get("record_id")
+            self._offset = csv_offset
+            self._unsaved += len(rows)
+            due = self._unsaved >= self.SNAPSHOT_EVERY_ROWS
+        if due:
+            self.save()
+    
+    def save(self):
+        """Persist the snapshot atomically."""
+        with self._lock:
+            snapshot = {
+                "version": self.SNAPSHOT_VERSION,
+                "first_record_id": self._first_record_id,
+                "csv_offset": self._offset,
+                **self._snapshot()
+            }
+            self._unsaved = 0
+        atomic_write_json(self.snapshot_path, snapshot)
+    
+    def flush(self):
+        """Save the snapshot if rows were applied since the last save."""
+        if self._unsaved:
+            self.save()
+
+
+if __name__ == "__main__":
+    # Demo: a view counting rows per cluster
+    import os
+    import tempfile
+    
+    class ClusterRowCount(TrailView):
+        COLUMNS = ("cluster_id",)
+        
+        def __init__(self, csv_path: str, snapshot_path: str):
+            self.counts: Dict[str, int] = {}
+            super().__init__(csv_path, snapshot_path)
+        
+        def _fold(self, row):
+            self.counts[row["cluster_id"]] = self.counts.get(row["cluster_id"], 0) + 1
+        
+        def _snapshot(self):
+            return {"counts": dict(self.counts)}
+        
+        def _restore(self, snapshot):
+            self.counts = snapshot["counts"]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "audit.csv")
+        snapshot_path = os.path.join(tmp, "view.json")
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows([["record_id", "cluster_id"], ["AUD-1", "FRD-01"], ["AUD-2", "FRD-01"]])
+        
+        view = ClusterRowCount(csv_path, snapshot_path)
+        print(f"Full scan: {view.counts}")
+        
+        with open(csv_path, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerow(["AUD-3", "SVC-01"])
+        print(f"Snapshot + catch-up: {ClusterRowCount(csv_path, snapshot_path).counts}")
@@ -0,0 +1,110 @@
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+# Audit files are written under ./data; keep them out of the repo
+os.chdir(tempfile.mkdtemp(prefix="audit_queries_"))
+
+from audit_logger import AuditLogger
+
+
+class Cluster:
+    """Minimal cluster: what AuditLogger.create_record reads."""
+    def __init__(self, cluster_id, category):
+        self.cluster_id = cluster_id
+        self.category = category
+        self.volume = 3
+        self.top_phrases = ["outage", "login"]
+        self.signals = []
+
+
+class AuditQueryTester:
+    def __init__(self, backend):
+        self.backend = backend
+        self.logger = AuditLogger(tempfile.mkdtemp(prefix=f"{backend}_"), backend=backend)
+        self.results = []
+
+    def check(self, name, passed, reason):
+        self.results.append({"name": name, "passed": passed, "reason": reason})
+        print(f"   {'✅ PASS' if passed else '❌ FAIL'}: {name} - {reason}")
+
+    def run(self):
+        print(f"\n🔴 BACKEND: {self.backend}")
+        logger = self.logger
+        logger.log_decisions([
+            logger.create_record(Cluster(f"QRY-{i:02d}", "SERVICE" if i % 2 else "FRAUD"))
+            for i in range(6)
+        ])
+        logger.update_decision("QRY-01", "APPROVED", "alice", "confirmed outage")
+        logger.update_decision("QRY-02", "APPROVED", "bob")
+        logger.update_decision("QRY-02", "REJECTED", "alice")
+
+        # 1. User filter matches the human who decided, not SYSTEM
+        by_user = logger.page_records(user="alice")["records"]
+        self.check(
+            "Page by user", sorted(r["cluster_id"] for r in by_user) == ["QRY-01", "QRY-02"],
+            f"{[r['cluster_id'] for r in by_user]} decided by alice"
+        )
+
+        # 2. Decision filter follows the latest update per record
+        approved = logger.page_records(decision="APPROVED")["records"]
+        rejected = logger.page_records(decision="REJECTED")["records"]
+        self.check(
+            "Page by decision",
+            [r["cluster_id"] for r in approved] == ["QRY-01"] and [r["cluster_id"] for r in rejected] == ["QRY-02"],
+            f"APPROVED {[r['cluster_id'] for r in approved]}, REJECTED {[r['cluster_id'] for r in rejected]}"
+        )
+
+        # 3. Update rows are never served as records
+        pending = logger.page_records(decision="PENDING", limit=2)
+        pages = [pending["records"]]
+        while pending["next_cursor"]:
+            pending = logger.page_records(pending["next_cursor"], limit=2, decision="PENDING")
+            pages.append(pending["records"])
+        listed = [r["cluster_id"] for page in pages for r in page]
+        recent = [r["cluster_id"] for r in logger.get_recent_records(10)]
+        self.check(
+            "Only decision records listed",
+            sorted(listed) == ["QRY-00", "QRY-03", "QRY-04", "QRY-05"] and len(recent) == 6,
+            f"{len(listed)} pending across {len(pages)} pages, {len(recent)} recent records"
+        )
+        
+        # 4. Stats count each record under its latest decision
+        stats = logger.get_stats(days=1)
+        expected = {"PENDING": 4, "APPROVED": 1, "REJECTED": 1}
+        self.check(
+            "Stats follow decision updates",
+            stats["decisions"] == expected and stats["window"]["decisions"] == expected
+            and stats["total_records"] == 6 and stats["decision_updates"] == 3,
+            f"{stats['decisions']} over {stats['total_records']} records"
+        )
+        
+        # 5. Offset queries list decision records only, oldest first
+        queried = logger.query_records(category="SERVICE", limit=2, offset=1)
+        self.check(
+            "Query by offset", [r["cluster_id"] for r in queried] == ["QRY-03", "QRY-05"],
+            f"{[r['cluster_id'] for r in queried]} after offset 1"
+        )
+
+
+if __name__ == "__main__":
+    print("="*60)
+    print("🔎 AUDIT QUERY TEST")
+    print("="*60)
+
+    results = []
+    for backend in AuditLogger.BACKENDS:
+        tester = AuditQueryTester(backend)
+        tester.run()
+        results.extend(tester.results)
+
+    print("\n" + "="*60)
+    print("SUMMARY")
+    passes = sum(1 for r in results if r['passed'])
+    print(f"Tests Passed: {passes}/{len(results)}")
+    print("="*60)
+
+    sys.exit(0 if passes == len(results) else 1)
@@ -0,0 +1,154 @@
+import sys
+import os
+import csv
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+# Audit files are written under ./data; keep them out of the repo
+os.chdir(tempfile.mkdtemp(prefix="stress_concurrency_"))
+
+from fastapi.testclient import TestClient
+from api import app
+from audit_logger import get_audit_logger
+from audit_writer import get_audit_writer
+
+TEMPLATES = [
+    ("App Log", "CRITICAL: 500 Internal Server Error - Gateway Timeout #{i}"),
+    ("Support Ticket", "Server is down, can't access my account ({i})"),
+    ("Tweet", "Got suspicious SMS about OTP, this is a scam! ref {i}"),
+    ("Support Ticket", "Phishing email claiming to be from the bank, case {i}"),
+    ("Tweet", "Rumor says the bank is about to collapse, ATMs empty {i}"),
+    ("Support Ticket", "What are the branch hours? ({i})"),
+]
+
+
+def make_events(count=120):
+    """Deterministic batch covering several categories."""
+    events = []
+    for i in range(count):
+        source, content = TEMPLATES[i % len(TEMPLATES)]
+        events.append({
+            "event_id": f"ST-{i:04d}",
+            "source": source,
+            "content": content.format(i=i),
+            "timestamp": f"2026-01-30T10:{i % 30:02d}:00"
+        })
+    return events
+
+
+def comparable(response):
+    """
+    Strip per-run fields (timings, timestamps, cluster IDs) from a
+    /pipeline/process response. Cluster IDs are unique per process, so
+    every run gets new ones.
+    """
+    return {
+        "gating": response["gating"],
+        "clustering": response["clustering"],
+        "deduplication": response["deduplication"],
+        "clusters": [
+            {k: v for k, v in card.items() if k not in ("cluster_id", "rationale_url")}
+            for card in response["clusters"]
+        ],
+    }
+
+
+class ConcurrencyStressTester:
+    def __init__(self, requests=32, workers=16):
+        self.requests = requests
+        self.workers = workers
+        self.client = TestClient(app)
+        self.results = []
+
+    def check(self, name, passed, reason):
+        self.results.append({"name": name, "passed": passed, "reason": reason})
+        print(f"   {'✅ PASS' if passed else '❌ FAIL'}: {name} - {reason}")
+
+    def post(self, events):
+        response = self.client.post("/pipeline/process", json={"events": events})
+        response.raise_for_status()
+        return response.json()
+
+    def run(self):
+        events = make_events()
+        audit_path = get_audit_logger().csv_path
+
+        print(f"\n🔴 BASELINE: 1 serial request")
+        baseline = self.post(events)
+        get_audit_writer().flush()
+        expected_ids = [c["cluster_id"] for c in baseline["clusters"]]
+        rows_before = len(self.read_audit_rows(audit_path))
+
+        print(f"🔴 STRESS: {self.requests} requests over {self.workers} threads")
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            responses = list(pool.map(lambda _: self.post(events), range(self.requests)))
+        get_audit_writer().flush()
+
+        # 1. Every concurrent request returns exactly the serial output
+        mismatches = sum(1 for r in responses if comparable(r) != comparable(baseline))
+        self.check(
+            "Identical outputs", mismatches == 0,
+            f"{self.requests - mismatches}/{self.requests} match the serial baseline"
+        )
+
+        # 2. Audit CSV is well-formed: every row has every column
+        rows = self.read_audit_rows(audit_path)
+        malformed = [r for r in rows if None in r or any(v is None for v in r.values())]
+        self.check("Well-formed audit rows", not malformed, f"{len(malformed)} malformed rows")
+
+        # 3. One batch per request, each batch contiguous (no interleaving)
+        new_rows = rows[rows_before:]
+        expected_count = self.requests * len(expected_ids)
+        batches = [
+            [r["cluster_id"] for r in new_rows[i:i + len(expected_ids)]]
+            for i in range(0, len(new_rows), len(expected_ids) or 1)
+        ]
+        request_ids = {tuple(c["cluster_id"] for c in r["clusters"]) for r in responses}
+        interleaved = sum(1 for b in batches if tuple(b) not in request_ids)
+        self.check(
+            "No interleaved audit rows",
+            len(new_rows) == expected_count and interleaved == 0,
+            f"{len(new_rows)}/{expected_count} rows, {interleaved} interleaved batches"
+        )
+
+        # 4. Record IDs and cluster IDs stay unique across threads
+        cluster_ids = [c["cluster_id"] for r in [baseline] + responses for c in r["clusters"]]
+        repeated = len(cluster_ids) - len(set(cluster_ids))
+        self.check("Unique cluster IDs", repeated == 0, f"{repeated} cluster IDs reused across requests")
+
+        record_ids = [r["record_id"] for r in rows]
+        duplicates = len(record_ids) - len(set(record_ids))
+        self.check("Unique record IDs", duplicates == 0, f"{duplicates} duplicate IDs")
+
+        # 5. Record store (JSONL segments or SQLite) holds every record exactly once
+        store = get_audit_logger().store
+        stored_ids = [r["record_id"] for r in store.iter_records()]
+        self.check(
+            "Complete record store",
+            sorted(stored_ids) == sorted(record_ids) and store.count() == len(record_ids),
+            f"{len(stored_ids)}/{len(record_ids)} records in the store"
+        )
+
+    def read_audit_rows(self, path):
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+
+if __name__ == "__main__":
+    print("="*60)
+    print("🧵 CONCURRENT PIPELINE STRESS TEST")
+    print("="*60)
+
+    tester = ConcurrencyStressTester()
+    tester.run()
+
+    print("\n" + "="*60)
+    print("SUMMARY")
+    passes = sum(1 for r in tester.results if r['passed'])
+    print(f"Tests Passed: {passes}/{len(tester.results)}")
+    print("="*60)
+
+    sys.exit(0 if passes == len(tester.results) else 1)